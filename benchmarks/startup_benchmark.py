@@ -0,0 +1,55 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Measure TigerGraph-MCP cold start: the time from spawning the server over stdio until the
+first `list_tools` response arrives.
+
+No TigerGraph server is needed, since listing tools never connects to the database.
+
+    python -m benchmarks.startup_benchmark --runs 10
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import click
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+
+async def time_to_first_list_tools() -> float:
+    server_params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "tigergraph_mcp.main"],
+        env=dict(os.environ),
+    )
+    start = time.perf_counter()
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.list_tools()
+            elapsed = time.perf_counter() - start
+    assert result.tools, "The server did not list any tools."
+    return elapsed
+
+
+@click.command()
+@click.option("--runs", default=5, show_default=True, help="Number of cold starts to measure.")
+def main(runs: int) -> None:
+    timings = [asyncio.run(time_to_first_list_tools()) for _ in range(runs)]
+    click.echo(
+        f"Time to first list_tools over {runs} runs: "
+        f"median {statistics.median(timings) * 1000:.0f} ms, "
+        f"min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from mcp import ClientSession
+from mcp.client.stdio import stdio_client
+
+from tests.integration.base_graph_fixture import UserProductGraphFixture
+from tigergraph_mcp import TigerGraphToolName
+
+
+class TestBulkTools(UserProductGraphFixture):
+    @pytest.mark.asyncio
+    async def test_batch(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.BATCH,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "operations": [
+                            {
+                                "tool": TigerGraphToolName.ADD_NODE,
+                                "arguments": {"node_id": "User_D", "node_type": "User"},
+                            },
+                            {
+                                "tool": TigerGraphToolName.ADD_NODE,
+                                "arguments": {"node_id": "User_E", "node_type": "User"},
+                            },
+                            {
+                                "tool": TigerGraphToolName.HAS_NODE,
+                                "arguments": {"node_id": "User_D", "node_type": "User"},
+                            },
+                            {
+                                "tool": TigerGraphToolName.HAS_NODE,
+                                "arguments": {"node_id": "User_Z", "node_type": "User"},
+                            },
+                        ],
+                        "output_format": "json",
+                    },
+                )
+                results = json.loads(result.content[0].text)
+                assert len(results) == 4
+                assert "added successfully" in results[0]["result"]
+                assert "added successfully" in results[1]["result"]
+                assert results[2]["result"].endswith("True.")
+                assert results[3]["result"].endswith("False.")
+                assert self.G.has_node("User_D", "User")
+                assert self.G.has_node("User_E", "User")
@@ -1,3 +1,4 @@
+import json
 import pytest
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client
@@ -80,6 +81,27 @@ class TestEdgeTools(UserProductGraphFixture):
                 )
                 assert f"exists in graph '{self.graph_name}': True" in str(result)
 
+    @pytest.mark.asyncio
+    async def test_has_edges(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.HAS_EDGES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "edges": [["User_A", "Product_1"], ["User_A", "Product_404"]],
+                        "src_node_type": "User",
+                        "edge_type": "purchased",
+                        "tgt_node_type": "Product",
+                        "output_format": "json",
+                    },
+                )
+                assert json.loads(result.content[0].text) == {
+                    "existing": [["User_A", "Product_1"]],
+                    "missing": [["User_A", "Product_404"]],
+                }
+
     @pytest.mark.asyncio
     async def test_get_edge_data(self):
         async with stdio_client(self.server_params) as (read, write):
@@ -100,3 +122,24 @@ class TestEdgeTools(UserProductGraphFixture):
                 )
                 assert "✅ Edge data retrieved:" in str(result)
                 assert "'purchase_date': '2024-01-12 00:00:00'" in str(result)
+
+    @pytest.mark.asyncio
+    async def test_get_edges_data(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.GET_EDGES_DATA,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "edges": [["User_B", "Product_2"], ["User_B", "Product_404"]],
+                        "src_node_type": "User",
+                        "edge_type": "purchased",
+                        "tgt_node_type": "Product",
+                        "return_attributes": ["purchase_date"],
+                    },
+                )
+                assert json.loads(result.content[0].text) == {
+                    "edges": {"User_B": {"Product_2": {"purchase_date": "2024-01-12 00:00:00"}}},
+                    "missing": [["User_B", "Product_404"]],
+                }
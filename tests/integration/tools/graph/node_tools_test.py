@@ -1,3 +1,4 @@
+import json
 import pytest
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client
@@ -47,6 +48,29 @@ class TestNodeTools(UserProductGraphFixture):
                 assert self.G.has_node("User_E", "User")
                 assert self.G.has_node("User_F", "User")
 
+    @pytest.mark.asyncio
+    async def test_add_nodes_columnar(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.ADD_NODES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "columns": {
+                            "node_id": ["User_G", "User_H"],
+                            "name": ["Grace", "Henry"],
+                            "age": [41, 52],
+                        },
+                        "node_type": "User",
+                    },
+                )
+
+                assert "Successfully added 2 nodes" in str(result)
+
+                assert self.G.has_node("User_G", "User")
+                assert self.G.get_node_data("User_H", "User")["age"] == 52
+
     @pytest.mark.asyncio
     async def test_remove_node(self):
         async with stdio_client(self.server_params) as (read, write):
@@ -67,6 +91,29 @@ class TestNodeTools(UserProductGraphFixture):
                 # Verify node no longer exists
                 assert not self.G.has_node("User_C", "User")
 
+    @pytest.mark.asyncio
+    async def test_remove_nodes(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.REMOVE_NODES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "removals": [
+                            {"node_type": "User", "node_ids": ["User_A", "User_B", "User_Z"]},
+                            {"node_type": "Product", "filter_expression": "s.price > 40"},
+                        ],
+                    },
+                )
+                assert "Removed 3 node(s)" in str(result)
+
+                assert not self.G.has_node("User_A", "User")
+                assert not self.G.has_node("User_B", "User")
+                assert self.G.has_node("User_C", "User")
+                assert not self.G.has_node("Product_3", "Product")
+                assert self.G.has_node("Product_1", "Product")
+
     @pytest.mark.asyncio
     async def test_has_node(self):
         async with stdio_client(self.server_params) as (read, write):
@@ -84,6 +131,25 @@ class TestNodeTools(UserProductGraphFixture):
                 )
                 assert f"exists in graph '{self.graph_name}': True" in str(result)
 
+    @pytest.mark.asyncio
+    async def test_has_nodes(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.HAS_NODES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_ids": ["User_A", "User_C", "User_Z"],
+                        "node_type": "User",
+                        "output_format": "json",
+                    },
+                )
+                assert json.loads(result.content[0].text) == {
+                    "existing": ["User_A", "User_C"],
+                    "missing": ["User_Z"],
+                }
+
     @pytest.mark.asyncio
     async def test_get_node_data(self):
         async with stdio_client(self.server_params) as (read, write):
@@ -105,6 +171,25 @@ class TestNodeTools(UserProductGraphFixture):
                 assert "'name': 'C'" in str(result)
                 assert "'age': 30" in str(result)
 
+    @pytest.mark.asyncio
+    async def test_get_nodes_data(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.GET_NODES_DATA,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_ids": ["User_C", "User_Z"],
+                        "node_type": "User",
+                        "return_attributes": ["age"],
+                    },
+                )
+                assert json.loads(result.content[0].text) == {
+                    "nodes": {"User_C": {"age": 30}},
+                    "missing": ["User_Z"],
+                }
+
     @pytest.mark.asyncio
     async def test_get_node_edges(self):
         async with stdio_client(self.server_params) as (read, write):
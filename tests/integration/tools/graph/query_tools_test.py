@@ -1,3 +1,4 @@
+import json
 import pytest
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client
@@ -120,3 +121,140 @@ class TestQueryTools(UserProductGraphFixture):
                     },
                 )
                 assert "✅ BFS traversal results" in str(result)
+
+    @pytest.mark.asyncio
+    async def test_get_nodes_json_output(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.GET_NODES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_type": "User",
+                        "return_attributes": ["id", "age"],
+                        "output_format": "json",
+                    },
+                )
+                nodes = json.loads(result.content[0].text)
+                assert sorted(node["id"] for node in nodes) == ["User_A", "User_B", "User_C"]
+
+    @pytest.mark.asyncio
+    async def test_get_nodes_paginated(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                arguments = {
+                    "graph_name": self.graph_name,
+                    "node_type": "User",
+                    "return_attributes": ["id"],
+                    "page_size": 2,
+                    "output_format": "json",
+                }
+                ids = []
+                while True:
+                    result = await session.call_tool(
+                        TigerGraphToolName.GET_NODES, arguments=arguments
+                    )
+                    page = json.loads(result.content[0].text)
+                    assert len(page["results"]) <= 2
+                    ids.extend(node["id"] for node in page["results"])
+                    if page["next_cursor"] is None:
+                        break
+                    arguments["cursor"] = page["next_cursor"]
+                assert sorted(ids) == ["User_A", "User_B", "User_C"]
+
+    @pytest.mark.asyncio
+    async def test_get_nodes_repeated_shape(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                # The same shape with different literals, past the installation threshold.
+                all_users = ["User_A", "User_B", "User_C"]
+                for min_age, expected in [(20, ["User_C"]), (40, []), (-1, all_users)] * 3:
+                    result = await session.call_tool(
+                        TigerGraphToolName.GET_NODES,
+                        arguments={
+                            "graph_name": self.graph_name,
+                            "node_type": "User",
+                            "filter_expression": f"s.age > {min_age}",
+                            "return_attributes": ["id"],
+                            "output_format": "json",
+                        },
+                    )
+                    ids = sorted(node["id"] for node in json.loads(result.content[0].text))
+                    assert ids == expected
+
+    @pytest.mark.asyncio
+    async def test_aggregate_nodes(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                arguments = {
+                    "graph_name": self.graph_name,
+                    "node_type": "User",
+                    "group_by": ["age"],
+                    "aggregates": [{"function": "count"}],
+                    "output_format": "json",
+                }
+                result = await session.call_tool(TigerGraphToolName.AGGREGATE_NODES, arguments)
+                assert json.loads(result.content[0].text) == [
+                    {"age": 0, "count": 2},
+                    {"age": 30, "count": 1},
+                ]
+
+                result = await session.call_tool(
+                    TigerGraphToolName.AGGREGATE_NODES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_type": "Product",
+                        "filter_expression": "s.price > 10",
+                        "aggregates": [
+                            {"function": "count"},
+                            {"function": "sum", "attribute": "price", "alias": "total"},
+                        ],
+                        "output_format": "json",
+                    },
+                )
+                assert json.loads(result.content[0].text) == [{"count": 1, "total": 50}]
+
+    @pytest.mark.asyncio
+    async def test_top_k_nodes(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.TOP_K_NODES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_type": "Product",
+                        "sort_by": "price",
+                        "k": 1,
+                        "return_attributes": ["name"],
+                        "output_format": "json",
+                    },
+                )
+                assert json.loads(result.content[0].text) == [
+                    {"node_id": "Product_3", "price": 50, "name": "3"}
+                ]
+
+    @pytest.mark.asyncio
+    async def test_top_k_edges(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.TOP_K_EDGES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "edge_type": "purchased",
+                        "sort_by": "quantity",
+                        "k": 2,
+                        "return_attributes": [],
+                        "output_format": "json",
+                    },
+                )
+                assert json.loads(result.content[0].text) == [
+                    {"from_id": "User_C", "to_id": "Product_3", "quantity": 25.5},
+                    {"from_id": "User_C", "to_id": "Product_2", "quantity": 15.5},
+                ]
@@ -1,3 +1,4 @@
+import json
 import pytest
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client
@@ -27,6 +28,47 @@ class TestStatisticsTools(UserProductGraphFixture):
                 assert "Degree of node 'Product_1'" in str(result)
                 assert "is 3" in str(result)
 
+    @pytest.mark.asyncio
+    async def test_degrees(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.DEGREES,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_ids": ["User_A", "User_B", "User_C", "User_Z"],
+                        "node_type": "User",
+                        "edge_types": "purchased",
+                        "output_format": "json",
+                    },
+                )
+                assert json.loads(result.content[0].text) == {
+                    "degrees": {"User_C": 3, "User_A": 1, "User_B": 1},
+                    "missing": ["User_Z"],
+                }
+
+    @pytest.mark.asyncio
+    async def test_degree_distribution(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.DEGREE_DISTRIBUTION,
+                    arguments={
+                        "graph_name": self.graph_name,
+                        "node_type": "User",
+                        "edge_types": "purchased",
+                        "top_k": 1,
+                        "output_format": "json",
+                    },
+                )
+                distribution = json.loads(result.content[0].text)
+                assert distribution["nodes"] == 3
+                assert distribution["max_degree"] == 3
+                assert distribution["histogram"] == {"1": 2, "3": 1}
+                assert distribution["hubs"] == [{"id": "User_C", "type": "User", "degree": 3}]
+
     @pytest.mark.asyncio
     async def test_number_of_nodes(self):
         async with stdio_client(self.server_params) as (read, write):
@@ -43,6 +85,28 @@ class TestStatisticsTools(UserProductGraphFixture):
 
                 assert "has 6 node(s)" in str(result)
 
+    @pytest.mark.asyncio
+    async def test_number_of_nodes_cached(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                arguments = {"graph_name": self.graph_name, "node_type": "User"}
+                result = await session.call_tool(TigerGraphToolName.NUMBER_OF_NODES, arguments)
+                assert "has 3 node(s) of type 'User' (exact)" in str(result)
+
+                # Removals through the server keep the cached count exact.
+                await session.call_tool(
+                    TigerGraphToolName.REMOVE_NODE,
+                    arguments={**arguments, "node_id": "User_A"},
+                )
+                result = await session.call_tool(TigerGraphToolName.NUMBER_OF_NODES, arguments)
+                assert "has 2 node(s) of type 'User' (cached" in str(result)
+
+                result = await session.call_tool(
+                    TigerGraphToolName.NUMBER_OF_NODES, {**arguments, "refresh": True}
+                )
+                assert "has 2 node(s) of type 'User' (exact)" in str(result)
+
     @pytest.mark.asyncio
     async def test_number_of_edges(self):
         async with stdio_client(self.server_params) as (read, write):
@@ -58,3 +122,30 @@ class TestStatisticsTools(UserProductGraphFixture):
                 )
 
                 assert "has 6 edge(s)" in str(result)
+
+    @pytest.mark.asyncio
+    async def test_profile(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool(
+                    TigerGraphToolName.PROFILE,
+                    arguments={"graph_name": self.graph_name, "distinct_counts": True},
+                )
+                profile = json.loads(result.content[0].text)
+
+                user = profile["nodes"]["User"]
+                assert user["count"] == 3
+                assert user["attributes"]["age"] == {
+                    "min": 0,
+                    "max": 30,
+                    "mean": 10.0,
+                    "defaults": 2,
+                }
+                assert user["attributes"]["name"] == {"distinct": 3, "defaults": 1}
+                assert profile["nodes"]["Product"]["attributes"]["price"]["max"] == 50
+
+                purchased = profile["edges"]["purchased"]
+                assert purchased["count"] == 5
+                assert purchased["degree"]["max"] == 3
+                assert profile["edges"]["similar_to"]["count"] == 1
@@ -0,0 +1,194 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tigergraph_mcp.executor import ToolCategory, ToolExecutor, raise_if_cancelled
+
+
+def make_executor(workers: int = 2, max_in_flight: int = 16) -> ToolExecutor:
+    return ToolExecutor({category: workers for category in ToolCategory}, max_in_flight)
+
+
+class ConcurrencyProbe:
+    """A tool body that blocks until released, recording how many run at the same time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.started = 0
+        self.release = threading.Event()
+
+    async def __call__(self, value: int = 0) -> int:
+        with self.lock:
+            self.running += 1
+            self.started += 1
+            self.max_running = max(self.max_running, self.running)
+        self.release.wait(timeout=5)
+        with self.lock:
+            self.running -= 1
+        return value
+
+
+async def wait_for(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
+
+
+class TestToolExecutor:
+    @pytest.mark.asyncio
+    async def test_returns_the_result_of_the_tool(self):
+        executor = make_executor()
+
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        try:
+            assert await executor.run(ToolCategory.READ, add, {"a": 1, "b": 2}) == 3
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_category(self):
+        executor = make_executor(workers=2)
+        reads = ConcurrencyProbe()
+        try:
+            tasks = [
+                asyncio.create_task(executor.run(ToolCategory.READ, reads, {"value": i}))
+                for i in range(5)
+            ]
+            await wait_for(lambda: reads.started == 2)
+            await asyncio.sleep(0.05)
+            assert reads.running == 2
+
+            reads.release.set()
+            assert sorted(await asyncio.gather(*tasks)) == [0, 1, 2, 3, 4]
+            assert reads.max_running == 2
+        finally:
+            reads.release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_categories_do_not_block_each_other(self):
+        executor = make_executor(workers=1)
+        load = ConcurrencyProbe()
+
+        async def read() -> str:
+            return "read"
+
+        try:
+            task = asyncio.create_task(executor.run(ToolCategory.LOAD, load, {}))
+            await wait_for(lambda: load.started == 1)
+            result = await asyncio.wait_for(executor.run(ToolCategory.READ, read, {}), 2)
+            assert result == "read"
+            load.release.set()
+            await task
+        finally:
+            load.release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_limits_calls_in_flight(self):
+        executor = make_executor(workers=4, max_in_flight=1)
+        probe = ConcurrencyProbe()
+        try:
+            tasks = [
+                asyncio.create_task(executor.run(category, probe, {}))
+                for category in (ToolCategory.READ, ToolCategory.WRITE)
+            ]
+            await wait_for(lambda: probe.started == 1)
+            await asyncio.sleep(0.05)
+            assert probe.started == 1
+
+            probe.release.set()
+            await asyncio.gather(*tasks)
+            assert probe.max_running == 1
+        finally:
+            probe.release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_that_has_not_started_is_dropped(self):
+        executor = make_executor(workers=1)
+        blocker = ConcurrencyProbe()
+        ran = threading.Event()
+
+        async def queued() -> None:
+            ran.set()
+
+        try:
+            running = asyncio.create_task(executor.run(ToolCategory.READ, blocker, {}))
+            await wait_for(lambda: blocker.started == 1)
+            waiting = asyncio.create_task(executor.run(ToolCategory.READ, queued, {}))
+            await asyncio.sleep(0.05)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+
+            blocker.release.set()
+            await running
+            await asyncio.sleep(0.05)
+            assert not ran.is_set()
+        finally:
+            blocker.release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_stops_at_its_next_check(self):
+        executor = make_executor()
+        steps = []
+
+        async def long_running() -> None:
+            for step in range(500):
+                raise_if_cancelled()
+                steps.append(step)
+                time.sleep(0.01)
+
+        try:
+            task = asyncio.create_task(executor.run(ToolCategory.WRITE, long_running, {}))
+            await wait_for(lambda: len(steps) >= 3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            await asyncio.sleep(0.1)
+            stopped_at = len(steps)
+            await asyncio.sleep(0.1)
+            assert len(steps) == stopped_at < 500
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_nested_calls_are_cancelled_with_their_parent(self):
+        executor = make_executor()
+        steps = []
+
+        async def child() -> None:
+            for step in range(500):
+                raise_if_cancelled()
+                steps.append(step)
+                time.sleep(0.01)
+
+        async def parent() -> None:
+            await asyncio.wrap_future(executor.submit(ToolCategory.READ, child, {}))
+
+        try:
+            task = asyncio.create_task(executor.run(ToolCategory.WRITE, parent, {}))
+            await wait_for(lambda: len(steps) >= 3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            await asyncio.sleep(0.1)
+            stopped_at = len(steps)
+            await asyncio.sleep(0.1)
+            assert len(steps) == stopped_at < 500
+        finally:
+            executor.shutdown()
+
+    def test_raise_if_cancelled_is_a_no_op_outside_tool_calls(self):
+        raise_if_cancelled()
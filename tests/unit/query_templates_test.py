@@ -0,0 +1,46 @@
+import pytest
+
+from tigergraph_mcp.tools import query_templates
+from tigergraph_mcp.tools.query_templates import QueryTemplate, QueryTemplateManager
+
+
+def template(graph_name, shape):
+    return QueryTemplate(graph_name, "test", "", f"PRINT {shape};")
+
+
+@pytest.fixture
+def manager():
+    # A threshold that is never reached, so nothing is installed.
+    manager = QueryTemplateManager(install=True, threshold=1_000_000)
+    yield manager
+    manager.close()
+
+
+class TestQueryTemplateManager:
+    def test_does_not_count_uses_when_installation_is_disabled(self):
+        manager = QueryTemplateManager(install=False)
+        try:
+            assert manager.run_installed(template("Social", 1)) is None
+            assert not manager._uses
+        finally:
+            manager.close()
+
+    def test_counts_uses_per_shape(self, manager):
+        for _ in range(3):
+            manager.run_installed(template("Social", 1))
+        manager.run_installed(template("Social", 2))
+        assert sorted(manager._uses.values()) == [1, 3]
+
+    def test_forgets_the_least_recently_used_shapes(self, manager, monkeypatch):
+        monkeypatch.setattr(query_templates, "MAX_COUNTED_SHAPES", 2)
+        for shape in (1, 2, 1, 3):
+            manager.run_installed(template("Social", shape))
+        assert list(manager._uses) == [
+            ("Social", template("Social", shape).name) for shape in (1, 3)
+        ]
+
+    def test_invalidate_forgets_the_uses_of_the_graph(self, manager):
+        manager.run_installed(template("Social", 1))
+        manager.run_installed(template("Retail", 1))
+        manager.invalidate("Social")
+        assert [graph_name for graph_name, _ in manager._uses] == ["Retail"]
@@ -0,0 +1,89 @@
+import time
+
+from mcp.types import TextContent
+
+from tigergraph_mcp.result_cache import ENTRY_OVERHEAD, ResultCache, is_failure
+
+
+def content(text: str):
+    return [TextContent(type="text", text=text)]
+
+
+class TestResultCache:
+    def test_returns_cached_content(self):
+        cache = ResultCache(max_bytes=10_000, ttl=60)
+        key = cache.key(("get_node", "{}"), "Social")
+        assert cache.get(key) is None
+
+        cache.put(key, content("hello"))
+        assert cache.get(key)[0].text == "hello"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used_entries(self):
+        # Room for exactly two 10-character entries.
+        cache = ResultCache(max_bytes=2 * (ENTRY_OVERHEAD + 10), ttl=60)
+        a, b, c = (cache.key((name, "{}"), "Social") for name in "abc")
+        cache.put(a, content("a" * 10))
+        cache.put(b, content("b" * 10))
+        assert cache.get(a) is not None  # a is now more recent than b
+
+        cache.put(c, content("c" * 10))
+        assert cache.get(b) is None
+        assert cache.get(a) is not None
+        assert cache.get(c) is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["size_bytes"] <= stats["max_bytes"]
+
+    def test_skips_entries_larger_than_the_cache(self):
+        cache = ResultCache(max_bytes=ENTRY_OVERHEAD + 10, ttl=60)
+        key = cache.key(("get_nodes", "{}"), "Social")
+        cache.put(key, content("x" * 11))
+        assert cache.get(key) is None
+        assert cache.stats()["size_bytes"] == 0
+
+    def test_replacing_an_entry_does_not_leak_its_size(self):
+        cache = ResultCache(max_bytes=10_000, ttl=60)
+        key = cache.key(("get_node", "{}"), "Social")
+        cache.put(key, content("old"))
+        cache.put(key, content("new"))
+        assert cache.stats()["size_bytes"] == ENTRY_OVERHEAD + 3
+        assert cache.get(key)[0].text == "new"
+
+    def test_writes_invalidate_only_their_graph(self):
+        cache = ResultCache(max_bytes=10_000, ttl=60)
+        call = ("get_node", "{}")
+        cache.put(cache.key(call, "Social"), content("social"))
+        cache.put(cache.key(call, "Retail"), content("retail"))
+
+        cache.bump_epoch("Social")
+        assert cache.get(cache.key(call, "Social")) is None
+        assert cache.get(cache.key(call, "Retail"))[0].text == "retail"
+
+    def test_global_writes_invalidate_every_graph(self):
+        cache = ResultCache(max_bytes=10_000, ttl=60)
+        call = ("get_node", "{}")
+        cache.put(cache.key(call, "Social"), content("social"))
+        cache.put(cache.key(call, None), content("no graph"))
+
+        cache.bump_epoch()
+        assert cache.get(cache.key(call, "Social")) is None
+        assert cache.get(cache.key(call, None)) is None
+
+    def test_entries_expire_after_the_ttl(self):
+        cache = ResultCache(max_bytes=10_000, ttl=0.01)
+        key = cache.key(("get_node", "{}"), "Social")
+        cache.put(key, content("hello"))
+        time.sleep(0.02)
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_zero_size_disables_the_cache(self):
+        assert not ResultCache(max_bytes=0, ttl=60).enabled
+
+
+def test_is_failure():
+    assert is_failure(content("❌ Failed to get node"))
+    assert not is_failure(content("✅ Retrieved node"))
@@ -0,0 +1,59 @@
+import pytest
+from mcp import types
+from mcp.types import TextContent
+
+from tigergraph_mcp import result_cache
+from tigergraph_mcp.config import ServerConfig, get_config, set_config
+from tigergraph_mcp.server import create_server
+from tigergraph_mcp.tools import TigerGraphToolName
+
+
+class FakeExecutor:
+    """Answers every tool call with the number of calls run so far, without a server."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def run(self, category, func, arguments):
+        self.calls.append(arguments["arguments"])
+        return [TextContent(type="text", text=f"✅ call {len(self.calls)}")]
+
+
+@pytest.fixture
+def server(monkeypatch):
+    previous = get_config()
+    set_config(ServerConfig(result_cache_size=1_000_000))
+    monkeypatch.setattr(result_cache, "_result_cache", None)
+    yield create_server(FakeExecutor())
+    set_config(previous)
+
+
+async def call(server, name, **arguments):
+    request = types.CallToolRequest(
+        method="tools/call", params=types.CallToolRequestParams(name=name, arguments=arguments)
+    )
+    result = await server.request_handlers[types.CallToolRequest](request)
+    return result.root.content[0].text
+
+
+class TestResultCaching:
+    @pytest.mark.asyncio
+    async def test_reads_are_cached_until_their_graph_changes(self, server):
+        get_node = TigerGraphToolName.GET_NODE_DATA
+        first = await call(server, get_node, graph_name="Social", node_id="a")
+        assert await call(server, get_node, graph_name="Social", node_id="a") == first
+
+        await call(server, TigerGraphToolName.REMOVE_NODE, graph_name="Retail", node_id="a")
+        assert await call(server, get_node, graph_name="Social", node_id="a") == first
+
+        await call(server, TigerGraphToolName.REMOVE_NODE, graph_name="Social", node_id="a")
+        assert await call(server, get_node, graph_name="Social", node_id="a") != first
+
+    @pytest.mark.asyncio
+    async def test_schema_changes_invalidate_calls_naming_no_graph(self, server):
+        list_metadata = TigerGraphToolName.LIST_METADATA
+        first = await call(server, list_metadata)
+        assert await call(server, list_metadata) == first
+
+        await call(server, TigerGraphToolName.DROP_GRAPH, graph_name="Social")
+        assert await call(server, list_metadata) != first
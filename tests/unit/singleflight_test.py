@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from tigergraph_mcp.singleflight import SingleFlight, call_key
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_merges_concurrent_calls_with_the_same_key(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ["result"]
+
+        tasks = [asyncio.create_task(flights.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert results == [["result"]] * 3
+        assert results[0] is results[1] is results[2]
+
+    @pytest.mark.asyncio
+    async def test_runs_different_keys_separately(self):
+        flights = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flights.do("a", lambda: work("a")), flights.do("b", lambda: work("b"))
+        )
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_runs_again_once_the_call_has_finished(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flights.do("key", work) == 1
+        assert await flights.do("key", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_propagates_errors_to_every_waiter(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(flights.do("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+        async def recovered():
+            return "ok"
+
+        assert await flights.do("key", recovered) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_the_call_for_the_others(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flights.do("key", work))
+        second = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_last_waiter_cancels_the_call(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(flights.do("key", work))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+
+def test_call_key_ignores_argument_order():
+    assert call_key("get_node", {"a": 1, "b": [2]}) == call_key("get_node", {"b": [2], "a": 1})
+    assert call_key("get_node", {"a": 1}) != call_key("get_nodes", {"a": 1})
+    assert call_key("get_node", {"a": 1}) != call_key("get_node", {"a": 2})
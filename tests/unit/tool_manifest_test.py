@@ -0,0 +1,75 @@
+import json
+import sys
+
+import pytest
+
+from tigergraph_mcp.tools import TigerGraphToolName, tool_manifest
+from tigergraph_mcp.tools.tool_manifest import build_manifest, dump_manifest, main
+from tigergraph_mcp.tools.tool_registry import MANIFEST_PATH, get_tool_entry
+
+
+@pytest.fixture(scope="module")
+def manifest():
+    return build_manifest()
+
+
+@pytest.fixture
+def manifest_path(tmp_path, monkeypatch):
+    path = tmp_path / MANIFEST_PATH.name
+    monkeypatch.setattr(tool_manifest, "MANIFEST_PATH", path)
+    return path
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["tool_manifest", *args])
+    main()
+
+
+class TestToolManifest:
+    def test_committed_manifest_is_up_to_date(self, manifest):
+        assert MANIFEST_PATH.read_text(encoding="utf-8") == dump_manifest(manifest)
+
+    def test_lists_every_tool_once(self, manifest):
+        names = [entry["tool"]["name"] for entry in manifest]
+        assert len(names) == len(set(names))
+        assert set(names) == {name.value for name in TigerGraphToolName}
+
+    def test_only_reads_are_idempotent(self, manifest):
+        for entry in manifest:
+            if entry["idempotent"]:
+                assert entry["category"] == "read"
+        run_query = next(
+            entry for entry in manifest if entry["tool"]["name"] == TigerGraphToolName.RUN_QUERY
+        )
+        assert not run_query["idempotent"]
+
+    def test_writes_the_manifest(self, monkeypatch, manifest_path, manifest):
+        run_main(monkeypatch)
+        assert json.loads(manifest_path.read_text(encoding="utf-8")) == manifest
+
+    def test_check_passes_when_up_to_date(self, monkeypatch, manifest_path, manifest):
+        manifest_path.write_text(dump_manifest(manifest), encoding="utf-8")
+        run_main(monkeypatch, "--check")
+
+    def test_check_fails_when_out_of_date(self, monkeypatch, manifest_path, manifest):
+        stale = json.loads(dump_manifest(manifest))
+        stale[0]["tool"]["description"] += " Changed."
+        manifest_path.write_text(dump_manifest(stale), encoding="utf-8")
+        with pytest.raises(SystemExit, match="out of date"):
+            run_main(monkeypatch, "--check")
+        # A failed check leaves the file as it was.
+        assert "Changed." in manifest_path.read_text(encoding="utf-8")
+
+
+class TestParseArguments:
+    def test_keeps_only_the_arguments_provided(self):
+        entry = get_tool_entry(TigerGraphToolName.GET_NODES)
+        arguments = entry.parse_arguments({"graph_name": "Social", "node_type": "Person"})
+        assert arguments == {"graph_name": "Social", "node_type": "Person"}
+
+    def test_rejects_unknown_arguments(self):
+        entry = get_tool_entry(TigerGraphToolName.GET_NODES)
+        with pytest.raises(ValueError, match="filter_expresion"):
+            entry.parse_arguments(
+                {"graph_name": "Social", "node_type": "Person", "filter_expresion": "s.age > 3"}
+            )
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+import requests
+
+from tigergraph_mcp.config import ServerConfig, get_config, set_config
+from tigergraph_mcp.tools.graph.bulk import upsert_pipeline
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import (
+    _chunks,
+    _is_transient,
+    _row_size,
+    _send,
+    encode_attributes,
+)
+
+
+@pytest.fixture
+def config():
+    previous = get_config()
+
+    def configure(**values):
+        set_config(ServerConfig(**values))
+
+    yield configure
+    set_config(previous)
+
+
+def node_row(node_id, **attributes):
+    return node_id, encode_attributes(attributes)
+
+
+def http_error(status_code):
+    """An HTTP error as TigerGraphX raises it: a RuntimeError caused by the requests error."""
+    response = requests.Response()
+    response.status_code = status_code
+    try:
+        raise requests.HTTPError(response=response)
+    except requests.HTTPError as cause:
+        try:
+            raise RuntimeError(f"HTTP {status_code}") from cause
+        except RuntimeError as error:
+            return error
+
+
+class FakeApi:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def upsert_graph_data(self, graph_name, payload):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return [{"accepted_vertices": outcome}]
+
+
+class TestChunks:
+    def test_splits_by_row_count(self, config):
+        config(upsert_chunk_size=2)
+        rows = [node_row(str(i)) for i in range(5)]
+        assert [len(chunk) for chunk in _chunks(rows)] == [2, 2, 1]
+
+    def test_splits_by_estimated_size(self, config):
+        rows = [node_row(str(i), name="x" * 100) for i in range(6)]
+        config(upsert_chunk_bytes=3 * _row_size(rows[0]))
+        assert [len(chunk) for chunk in _chunks(rows)] == [3, 3]
+
+    def test_sends_a_row_larger_than_the_limit_on_its_own(self, config):
+        rows = [node_row("a"), node_row("b", name="x" * 1000), node_row("c")]
+        config(upsert_chunk_bytes=100)
+        assert [[row[0] for row in chunk] for chunk in _chunks(rows)] == [["a"], ["b"], ["c"]]
+
+    def test_keeps_every_row_in_order(self, config):
+        config(upsert_chunk_size=3, upsert_chunk_bytes=200)
+        rows = [node_row(str(i), name="x" * (i * 10)) for i in range(20)]
+        chunks = list(_chunks(rows))
+        assert [row for chunk in chunks for row in chunk] == rows
+        assert all(len(chunk) <= 3 for chunk in chunks)
+
+    def test_consumes_rows_lazily(self, config):
+        config(upsert_chunk_size=2)
+        consumed = []
+
+        def rows():
+            for i in range(100):
+                consumed.append(i)
+                yield node_row(str(i))
+
+        next(_chunks(rows()))
+        assert len(consumed) == 3
+
+    def test_estimate_covers_the_encoded_payload(self):
+        rows = [
+            node_row("user_1", name="Alice", age=30, tags=["a", "b"]),
+            node_row("user_2", name="Bob", active=True, score=0.5),
+            node_row("user_3"),
+        ]
+        payload = json.dumps({"vertices": {"Person": dict(rows)}})
+        wrapper = len(json.dumps({"vertices": {"Person": {}}}))
+        assert sum(_row_size(row) for row in rows) >= len(payload) - wrapper
+
+
+class TestSend:
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch, config):
+        monkeypatch.setattr(upsert_pipeline, "RETRY_BACKOFF", 0)
+        config(upsert_retries=2)
+
+    def test_retries_transient_errors(self):
+        api = FakeApi(ConnectionError("reset"), http_error(503), 3)
+        assert _send(api, "Social", {}, "accepted_vertices") == 3
+        assert api.calls == 3
+
+    def test_gives_up_after_the_last_retry(self):
+        api = FakeApi(*[TimeoutError("timed out")] * 3)
+        with pytest.raises(TimeoutError):
+            _send(api, "Social", {}, "accepted_vertices")
+        assert api.calls == 3
+
+    def test_does_not_retry_rejected_requests(self):
+        api = FakeApi(http_error(400), 3)
+        with pytest.raises(RuntimeError):
+            _send(api, "Social", {}, "accepted_vertices")
+        assert api.calls == 1
+
+    def test_does_not_retry_other_errors(self):
+        api = FakeApi(ValueError("bad payload"), 3)
+        with pytest.raises(ValueError):
+            _send(api, "Social", {}, "accepted_vertices")
+        assert api.calls == 1
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (ConnectionError("reset"), True),
+        (TimeoutError("timed out"), True),
+        (http_error(500), True),
+        (http_error(503), True),
+        (http_error(408), True),
+        (http_error(429), True),
+        (http_error(400), False),
+        (http_error(404), False),
+        (RuntimeError("no response"), False),
+        (ValueError("bad payload"), False),
+    ],
+)
+def test_is_transient(error, transient):
+    assert _is_transient(error) is transient
@@ -0,0 +1,195 @@
+import asyncio
+import json
+
+import pytest
+from mcp.types import TextContent
+
+from tigergraph_mcp.result_cache import is_failure
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.write_buffer import MISSING_RESULT, WriteBuffer
+
+
+class FakeExecutor:
+    """Stands in for the tool executor, answering `graph__batch` calls without a server."""
+
+    def __init__(self):
+        self.batches = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.respond = self.results
+
+    @staticmethod
+    def results(operations):
+        results = [{"result": f"✅ {op['arguments']['node_id']}"} for op in operations]
+        return json.dumps(results)
+
+    async def run(self, category, func, kwargs):
+        operations = kwargs["arguments"]["operations"]
+        self.batches.append([op["arguments"]["node_id"] for op in operations])
+        await self.release.wait()
+        return [TextContent(type="text", text=self.respond(operations))]
+
+
+def add_node(node_id, node_type="Person", graph_name="Social"):
+    return {"graph_name": graph_name, "node_type": node_type, "node_id": node_id}
+
+
+def texts(results):
+    return [content[0].text for content in results]
+
+
+class TestWriteBuffer:
+    @pytest.mark.asyncio
+    async def test_writes_a_lone_call_right_away(self):
+        executor = FakeExecutor()
+        buffer = WriteBuffer(executor, max_size=10, max_delay=60)
+        result = await asyncio.wait_for(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")), 1)
+        assert texts([result]) == ["✅ a"]
+        assert executor.batches == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_merges_calls_arriving_during_a_write(self):
+        executor = FakeExecutor()
+        executor.release.clear()
+        written = []
+        buffer = WriteBuffer(executor, max_size=3, max_delay=60, on_write=written.append)
+
+        first = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")))
+        await asyncio.sleep(0)
+        rest = [
+            asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node(node_id)))
+            for node_id in "bcd"
+        ]
+        await asyncio.sleep(0.01)
+        executor.release.set()
+
+        results = await asyncio.gather(first, *rest)
+        assert texts(results) == ["✅ a", "✅ b", "✅ c", "✅ d"]
+        assert executor.batches == [["a"], ["b", "c", "d"]]
+        assert written == ["Social", "Social"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_the_delay(self):
+        executor = FakeExecutor()
+        executor.release.clear()
+        buffer = WriteBuffer(executor, max_size=100, max_delay=0.05)
+
+        first = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("b")))
+        await asyncio.sleep(0.01)
+        assert executor.batches == [["a"]]
+
+        executor.release.set()
+        await asyncio.wait_for(asyncio.gather(first, second), 1)
+        assert executor.batches == [["a"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_keeps_different_types_apart(self):
+        executor = FakeExecutor()
+        executor.release.clear()
+        buffer = WriteBuffer(executor, max_size=100, max_delay=60)
+
+        first = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")))
+        await asyncio.sleep(0)
+        people = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("b")))
+        places = asyncio.create_task(
+            buffer.add(TigerGraphToolName.ADD_NODE, add_node("c", node_type="Place"))
+        )
+        await asyncio.sleep(0)
+        executor.release.set()
+        await buffer.flush("Social")
+
+        assert sorted(executor.batches) == [["a"], ["b"], ["c"]]
+        assert texts(await asyncio.gather(first, people, places)) == ["✅ a", "✅ b", "✅ c"]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_buffered_calls_before_returning(self):
+        executor = FakeExecutor()
+        executor.release.clear()
+        buffer = WriteBuffer(executor, max_size=100, max_delay=60)
+
+        first = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")))
+        await asyncio.sleep(0)
+        buffered = [
+            asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node(node_id)))
+            for node_id in "bc"
+        ]
+        other_graph = asyncio.create_task(
+            buffer.add(TigerGraphToolName.ADD_NODE, add_node("x", graph_name="Retail"))
+        )
+        await asyncio.sleep(0)
+        flush = asyncio.create_task(buffer.flush("Social"))
+        await asyncio.sleep(0.01)
+        assert not flush.done()
+
+        executor.release.set()
+        await asyncio.wait_for(flush, 1)
+        assert first.done() and all(task.done() for task in buffered)
+        assert executor.batches[:1] == [["a"]]
+        assert ["b", "c"] in executor.batches
+        await other_graph
+
+    @pytest.mark.asyncio
+    async def test_reports_a_failed_write_to_every_call(self):
+        executor = FakeExecutor()
+        executor.respond = lambda operations: "❌ Failed to run batch"
+        executor.release.clear()
+        buffer = WriteBuffer(executor, max_size=2, max_delay=60)
+
+        first = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")))
+        await asyncio.sleep(0)
+        rest = [
+            asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node(node_id)))
+            for node_id in "bc"
+        ]
+        executor.release.set()
+        results = await asyncio.gather(first, *rest)
+        assert texts(results) == ["❌ Failed to run batch"] * 3
+
+    @pytest.mark.asyncio
+    async def test_reports_an_error_to_every_call(self):
+        executor = FakeExecutor()
+
+        def fail(operations):
+            raise RuntimeError("connection reset")
+
+        executor.respond = fail
+        written = []
+        buffer = WriteBuffer(executor, max_size=2, max_delay=60, on_write=written.append)
+
+        # The server passes tool names as plain strings.
+        result = await buffer.add(TigerGraphToolName.ADD_NODE.value, add_node("a"))
+        assert texts([result]) == [
+            "❌ Failed to write buffered graph__add_node calls to graph 'Social': connection reset"
+        ]
+        assert is_failure(result)
+        assert written == ["Social"]
+
+    @pytest.mark.asyncio
+    async def test_calls_without_a_result_are_not_left_waiting(self):
+        executor = FakeExecutor()
+        executor.respond = lambda operations: FakeExecutor.results(operations[:1])
+        executor.release.clear()
+        buffer = WriteBuffer(executor, max_size=2, max_delay=60)
+
+        first = asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node("a")))
+        await asyncio.sleep(0)
+        rest = [
+            asyncio.create_task(buffer.add(TigerGraphToolName.ADD_NODE, add_node(node_id)))
+            for node_id in "bc"
+        ]
+        executor.release.set()
+        results = await asyncio.wait_for(asyncio.gather(first, *rest), 1)
+        assert texts(results) == ["✅ a", "✅ b", MISSING_RESULT]
+
+    @pytest.mark.asyncio
+    async def test_rejects_calls_without_a_graph_name(self):
+        buffer = WriteBuffer(FakeExecutor(), max_size=2, max_delay=60)
+        with pytest.raises(ValueError):
+            await buffer.add(TigerGraphToolName.ADD_NODE, {"node_id": "a"})
+
+    def test_buffers_only_single_element_writes(self):
+        assert WriteBuffer.is_buffered(TigerGraphToolName.ADD_NODE)
+        assert WriteBuffer.is_buffered(TigerGraphToolName.ADD_EDGE)
+        assert not WriteBuffer.is_buffered(TigerGraphToolName.ADD_NODES)
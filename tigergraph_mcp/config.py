@@ -0,0 +1,199 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import os
+from typing import Literal, Mapping, Optional
+from pydantic import BaseModel, Field
+
+ENV_PREFIX = "TG_MCP_"
+
+
+class ServerConfig(BaseModel):
+    """Server-side settings for TigerGraph-MCP.
+
+    Every field can be set through an environment variable named after the field with the
+    `TG_MCP_` prefix, e.g. `TG_MCP_GRAPH_CACHE_TTL=60`.
+    """
+
+    graph_cache_ttl: float = Field(
+        300.0,
+        ge=0,
+        description="Seconds a cached graph handle stays valid. Set to 0 to disable the cache.",
+    )
+    output_format: Literal["text", "json"] = Field(
+        "text",
+        description="Default result format of tools returning lists of nodes, neighbors or "
+        "search results when the call does not set `output_format`.",
+    )
+    max_page_size: int = Field(
+        1000, ge=1, description="Maximum number of results returned in one page."
+    )
+    page_chunk_size: int = Field(
+        500, ge=1, description="Number of vertices fetched from TigerGraph per paging query."
+    )
+    max_response_rows: int = Field(
+        1000,
+        ge=0,
+        description="Maximum number of rows in the response of get_nodes, get_node_edges and "
+        "run_query. Larger results are truncated and summarized. Set to 0 for no limit.",
+    )
+    max_response_bytes: int = Field(
+        262144,
+        ge=0,
+        description="Maximum serialized size in bytes of the rows in one response. Set to 0 "
+        "for no limit.",
+    )
+    summary_top_k: int = Field(
+        5, ge=1, description="Number of most frequent values listed per attribute in summaries."
+    )
+    coalesce_reads: bool = Field(
+        True,
+        description="Whether identical read tool calls running at the same time share a single "
+        "execution.",
+    )
+    result_cache_size: int = Field(
+        0,
+        ge=0,
+        description="Maximum total size in bytes of cached read tool results. Set to 0 to "
+        "disable the result cache.",
+    )
+    result_cache_ttl: float = Field(
+        60.0, ge=0, description="Seconds a cached read tool result stays valid."
+    )
+    write_behind: bool = Field(
+        False,
+        description="Whether concurrent add_node and add_edge calls on the same graph and types "
+        "are buffered and written together.",
+    )
+    write_buffer_size: int = Field(
+        100, ge=1, description="Number of buffered calls that triggers a write."
+    )
+    write_buffer_delay: float = Field(
+        0.05,
+        ge=0,
+        description="Seconds the first buffered call waits for others before they are written.",
+    )
+    membership_cache_size: int = Field(
+        100_000,
+        ge=0,
+        description="Maximum number of node IDs and edges known to exist that are cached for "
+        "has_nodes and has_edges. 0 disables the cache.",
+    )
+    membership_cache_ttl: float = Field(
+        300.0, gt=0, description="Seconds after which the cached members of a type expire."
+    )
+    count_cache_ttl: float = Field(
+        60.0,
+        ge=0,
+        description="Seconds after which the node and edge counts kept up to date by this "
+        "server's writes are counted again in the database. Set to 0 to always count.",
+    )
+    lookup_chunk_size: int = Field(
+        500,
+        ge=1,
+        description="Maximum number of node IDs or edges sent in each request of the bulk "
+        "lookup tools and remove_nodes.",
+    )
+    upsert_chunk_size: int = Field(
+        5000,
+        ge=1,
+        description="Maximum number of rows sent in each upsert request of a bulk write.",
+    )
+    upsert_chunk_bytes: int = Field(
+        4 * 1024 * 1024,
+        ge=1,
+        description="Maximum size in bytes of each upsert request of a bulk write, as estimated "
+        "from the lengths of the IDs and attribute values.",
+    )
+    upsert_concurrency: int = Field(
+        4,
+        ge=1,
+        description="Maximum number of upsert and delete requests of bulk writes in flight at "
+        "once.",
+    )
+    delete_chunk_size: int = Field(
+        10000,
+        ge=1,
+        description="Maximum number of nodes selected by a filter that are removed in each "
+        "request of remove_nodes.",
+    )
+    upsert_retries: int = Field(
+        2,
+        ge=0,
+        description="Number of times an upsert request failing with a transient error is retried.",
+    )
+    install_generated_queries: bool = Field(
+        False,
+        description="Whether the queries generated by tools such as profile and get_nodes are "
+        "installed in the background once used repeatedly, as `mcp_*` queries of the graph. "
+        "Until then, and if disabled, they run in interpreted mode.",
+    )
+    query_template_threshold: int = Field(
+        3,
+        ge=1,
+        description="Number of calls of the same shape after which a generated query is installed.",
+    )
+    max_generated_queries: int = Field(
+        20, ge=1, description="Maximum number of generated queries installed per graph."
+    )
+    pool_size: int = Field(
+        32, ge=1, description="Maximum number of keep-alive connections per TigerGraph host."
+    )
+    token_lifetime: int = Field(
+        3600,
+        ge=0,
+        description="Lifetime in seconds of auth tokens created from TG_SECRET. "
+        "Set to 0 to authenticate every request with the secret instead.",
+    )
+    token_refresh_margin: float = Field(
+        60.0, ge=0, description="Seconds before expiry at which an auth token is refreshed."
+    )
+    max_in_flight: int = Field(
+        64,
+        ge=1,
+        description="Maximum number of tool calls in flight. Further calls wait for a free slot.",
+    )
+    read_workers: int = Field(
+        32, ge=1, description="Maximum number of read tools executing at the same time."
+    )
+    write_workers: int = Field(
+        8, ge=1, description="Maximum number of node/edge write tools executing at the same time."
+    )
+    load_workers: int = Field(
+        2, ge=1, description="Maximum number of data loading jobs executing at the same time."
+    )
+    schema_workers: int = Field(
+        1,
+        ge=1,
+        description="Maximum number of schema, query installation and data source changes "
+        "executing at the same time.",
+    )
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "ServerConfig":
+        environ = os.environ if environ is None else environ
+        values = {}
+        for field_name in cls.model_fields:
+            env_name = f"{ENV_PREFIX}{field_name.upper()}"
+            if env_name in environ:
+                values[field_name] = environ[env_name]
+        return cls(**values)
+
+
+_config: Optional[ServerConfig] = None
+
+
+def get_config() -> ServerConfig:
+    global _config
+    if _config is None:
+        _config = ServerConfig.from_env()
+    return _config
+
+
+def set_config(config: ServerConfig) -> None:
+    global _config
+    _config = config
@@ -0,0 +1,182 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, TypeVar
+
+from .config import ServerConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ToolCategory(str, Enum):
+    """Groups tools by how they load TigerGraph, each group getting its own concurrency limit."""
+
+    READ = "read"
+    WRITE = "write"
+    LOAD = "load"
+    SCHEMA = "schema"
+
+
+class ToolExecutor:
+    """Runs tool bodies on per-category thread pools.
+
+    Tool functions are coroutines, but every one of them blocks on synchronous TigerGraphX
+    calls. Running them on worker threads keeps the server's event loop free, and giving each
+    category its own bounded pool means a long `install_query` or `load_data` only ever
+    queues behind work of its own kind while reads keep flowing.
+    """
+
+    def __init__(self, max_workers: Mapping[ToolCategory, int], max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._pools: Dict[ToolCategory, ThreadPoolExecutor] = {
+            category: ThreadPoolExecutor(
+                max_workers=max_workers[category],
+                thread_name_prefix=f"tigergraph-mcp-{category.value}",
+            )
+            for category in ToolCategory
+        }
+
+    @classmethod
+    def from_config(cls, config: ServerConfig) -> "ToolExecutor":
+        return cls(
+            {
+                ToolCategory.READ: config.read_workers,
+                ToolCategory.WRITE: config.write_workers,
+                ToolCategory.LOAD: config.load_workers,
+                ToolCategory.SCHEMA: config.schema_workers,
+            },
+            max_in_flight=config.max_in_flight,
+        )
+
+    async def run(
+        self,
+        category: ToolCategory,
+        func: Callable[..., Awaitable[T]],
+        arguments: Dict[str, Any],
+    ) -> T:
+        """Run `func(**arguments)` on the pool for `category`.
+
+        At most `max_in_flight` calls are admitted at once; further calls wait here until a slot
+        frees up. If the awaiting task is cancelled, e.g. because the client cancelled the
+        request, a call that has not started yet is dropped. A running call cannot be
+        interrupted, since it blocks its worker thread on TigerGraph requests: it is only marked
+        as cancelled, and keeps its worker until it reaches a `raise_if_cancelled` check.
+        """
+        if self._in_flight.locked():
+            logger.debug(f"{self.max_in_flight} tool calls in flight, waiting for a free slot.")
+        async with self._in_flight:
+            loop = asyncio.get_running_loop()
+            call = _Call(func, arguments)
+            future = loop.run_in_executor(self._pools[category], self._bind(call))
+            try:
+                return await future
+            except asyncio.CancelledError:
+                call.cancel()
+                raise
+
+    def submit(
+        self,
+        category: ToolCategory,
+        func: Callable[..., Awaitable[T]],
+        arguments: Dict[str, Any],
+    ) -> "Future[T]":
+        """Run `func(**arguments)` on the pool for `category` from within a running tool call.
+
+        The call shares the category's concurrency limit with all others but is not counted
+        against `max_in_flight`, since the calling tool already holds a slot. It is cancelled
+        together with the calling tool.
+        """
+        return self._pools[category].submit(self._bind(_Call(func, arguments)))
+
+    def _bind(self, call: "_Call") -> Callable[[], Any]:
+        context = contextvars.copy_context()
+        context.run(_current_executor.set, self)
+        return functools.partial(context.run, call.run)
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_thread_local = threading.local()
+
+# The tool call running in the current context, and the executor running it.
+_current_call: contextvars.ContextVar[Optional["_Call"]] = contextvars.ContextVar(
+    "tigergraph_mcp_call", default=None
+)
+_current_executor: contextvars.ContextVar[Optional[ToolExecutor]] = contextvars.ContextVar(
+    "tigergraph_mcp_executor", default=None
+)
+
+
+def current_executor() -> Optional[ToolExecutor]:
+    """Return the executor running the current tool call, or None outside of one."""
+    return _current_executor.get()
+
+
+def raise_if_cancelled() -> None:
+    """Raise `CancelledError` if the tool call running in the current context was cancelled.
+
+    Long-running tool bodies call this between requests to TigerGraph, so that a cancelled call
+    stops there and frees its worker. Work submitted to other threads must carry the context,
+    e.g. with `contextvars.copy_context().run`, for the check to see the call.
+    """
+    call = _current_call.get()
+    if call is not None and call.cancelled:
+        raise asyncio.CancelledError()
+
+
+class _Call:
+    """A single tool invocation on a worker thread that can be cancelled from the server loop."""
+
+    def __init__(self, func: Callable[..., Awaitable[T]], arguments: Dict[str, Any]):
+        self._func = func
+        self._arguments = arguments
+        # A call made from within another one, e.g. by `graph__batch`, is cancelled with it.
+        self._parent = _current_call.get()
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self._parent is not None and self._parent.cancelled)
+
+    def run(self) -> Any:
+        # Each worker thread keeps one event loop of its own to drive tool coroutines.
+        loop = getattr(_thread_local, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            _thread_local.loop = loop
+        with self._lock:
+            if self.cancelled:
+                raise asyncio.CancelledError()
+            self._loop = loop
+            # The task runs in a copy of the current context, which then holds this call.
+            token = _current_call.set(self)
+            try:
+                self._task = loop.create_task(self._func(**self._arguments))
+            finally:
+                _current_call.reset(token)
+        return loop.run_until_complete(self._task)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            if self._task is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(self._task.cancel)
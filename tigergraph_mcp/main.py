@@ -9,12 +9,22 @@ import logging
 import sys
 import click
 
-from .server import serve
+from .server import Transport, serve
 
 
 @click.command()
 @click.option("-v", "--verbose", count=True)
-def main(verbose: bool) -> None:
+@click.option(
+    "-t",
+    "--transport",
+    type=click.Choice([transport.value for transport in Transport]),
+    default=Transport.STDIO.value,
+    show_default=True,
+    help="Transport to serve MCP over. The HTTP transports let many clients share one server.",
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help="Host for HTTP transports.")
+@click.option("--port", default=8000, show_default=True, help="Port for HTTP transports.")
+def main(verbose: bool, transport: str, host: str, port: int) -> None:
     """TigerGraph MCP Server - TigerGraph functionality for MCP"""
     import asyncio
 
@@ -25,7 +35,7 @@ def main(verbose: bool) -> None:
         logging_level = logging.DEBUG
 
     logging.basicConfig(level=logging_level, stream=sys.stderr)
-    asyncio.run(serve())
+    asyncio.run(serve(Transport(transport), host, port))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from mcp.types import TextContent
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Rough per-entry bookkeeping cost, added to the size of the cached text.
+ENTRY_OVERHEAD = 256
+
+
+class ResultCache:
+    """LRU cache of read tool results, bounded by the total size of the cached content.
+
+    Keys carry a write epoch per graph, plus a global one. Every call that may modify a graph
+    bumps that graph's epoch (or the global epoch if it names no graph), so results cached
+    before the change are never served again; they simply age out of the LRU. Entries also
+    expire after `ttl` seconds, to pick up changes made outside this server.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._entries: OrderedDict[Hashable, Tuple[float, int, List[TextContent]]] = OrderedDict()
+        self._epochs: Dict[Optional[str], int] = {}
+        self._global_epoch = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def key(self, call_key: Hashable, graph_name: Optional[str]) -> Hashable:
+        with self._lock:
+            return call_key, self._global_epoch, self._epochs.get(graph_name, 0)
+
+    def get(self, key: Hashable) -> Optional[List[TextContent]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, size, content = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return content
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, content: Sequence[TextContent]) -> None:
+        size = ENTRY_OVERHEAD + sum(len(item.text) for item in content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, list(content))
+            self._size += size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def bump_epoch(self, graph_name: Optional[str] = None) -> None:
+        """Invalidate the cached results of `graph_name`, or of every graph if it is None."""
+        with self._lock:
+            if graph_name is None:
+                self._global_epoch += 1
+            else:
+                self._epochs[graph_name] = self._epochs.get(graph_name, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+
+def is_failure(content: Sequence[TextContent]) -> bool:
+    """Whether a tool reported a failure, which should not be cached."""
+    return any(item.text.startswith("❌") for item in content)
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            config = get_config()
+            _result_cache = ResultCache(config.result_cache_size, config.result_cache_ttl)
+        return _result_cache
@@ -5,164 +5,209 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+import contextlib
+import json
 import logging
-from typing import Dict, List
+import sys
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Optional, Sequence
+from mcp import types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
-
-from .tools import (
-    TigerGraphToolName,
-    get_all_tools,
-    create_schema,
-    get_schema,
-    drop_graph,
-    load_data,
-    add_node,
-    add_nodes,
-    remove_node,
-    has_node,
-    get_node_data,
-    get_node_edges,
-    clear_graph_data,
-    add_edge,
-    add_edges,
-    has_edge,
-    get_edge_data,
-    degree,
-    number_of_nodes,
-    number_of_edges,
-    create_query,
-    install_query,
-    drop_query,
-    run_query,
-    is_query_installed,
-    get_nodes,
-    get_neighbors,
-    breadth_first_search,
-    upsert,
-    fetch_node,
-    fetch_nodes,
-    search,
-    search_multi_vector_attributes,
-    search_top_k_similar_nodes,
-    list_metadata,
-    create_data_source,
-    update_data_source,
-    get_data_source,
-    drop_data_source,
-    get_all_data_sources,
-    drop_all_data_sources,
-    preview_sample_data,
-)
+from mcp.types import TextContent
+
+from .config import get_config
+from .executor import ToolCategory, ToolExecutor
+from .result_cache import get_result_cache, is_failure
+from .singleflight import SingleFlight, call_key
+from .write_buffer import WriteBuffer
+from .tools import ToolEntry, get_all_tools, get_tool_entry
 
 logger = logging.getLogger(__name__)
 
+STATS_URI = "tigergraph-mcp://stats"
+
+
+class Transport(str, Enum):
+    STDIO = "stdio"
+    STREAMABLE_HTTP = "streamable-http"
+    SSE = "sse"
 
-async def serve() -> None:
+
+def create_server(executor: ToolExecutor) -> Server:
     server = Server("TigerGraph-MCP")
+    # The tool list never changes while the server runs, so the response is built only once.
+    list_tools_result = types.ServerResult(types.ListToolsResult(tools=get_all_tools()))
+    config = get_config()
+    flights = SingleFlight() if config.coalesce_reads else None
+    result_cache = get_result_cache()
+    write_buffer = None
+    if config.write_behind:
+        write_buffer = WriteBuffer(
+            executor,
+            max_size=config.write_buffer_size,
+            max_delay=config.write_buffer_delay,
+            on_write=result_cache.bump_epoch,
+        )
+    stats_resource = types.Resource(
+        uri=STATS_URI,
+        name="stats",
+        description="Hit and miss counters of the server's caches.",
+        mimeType="application/json",
+    )
 
-    @server.list_tools()
-    async def list_tools() -> List[Tool]:
-        return get_all_tools()
+    async def list_tools(request: types.ListToolsRequest) -> types.ServerResult:
+        return list_tools_result
 
-    @server.call_tool()
-    async def call_tool(name: str, arguments: Dict) -> List[TextContent]:
+    async def call_tool(request: types.CallToolRequest) -> types.ServerResult:
+        name = request.params.name
         try:
-            match name:
-                # Tools for Schema Operations
-                case TigerGraphToolName.CREATE_SCHEMA:
-                    return await create_schema(**arguments)
-                case TigerGraphToolName.GET_SCHEMA:
-                    return await get_schema(**arguments)
-                case TigerGraphToolName.DROP_GRAPH:
-                    return await drop_graph(**arguments)
-                # Tools for Data Operations
-                case TigerGraphToolName.LOAD_DATA:
-                    return await load_data(**arguments)
-                # Tools for Node Operations
-                case TigerGraphToolName.ADD_NODE:
-                    return await add_node(**arguments)
-                case TigerGraphToolName.ADD_NODES:
-                    return await add_nodes(**arguments)
-                case TigerGraphToolName.REMOVE_NODE:
-                    return await remove_node(**arguments)
-                case TigerGraphToolName.HAS_NODE:
-                    return await has_node(**arguments)
-                case TigerGraphToolName.GET_NODE_DATA:
-                    return await get_node_data(**arguments)
-                case TigerGraphToolName.GET_NODE_EDGES:
-                    return await get_node_edges(**arguments)
-                case TigerGraphToolName.CLEAR_GRAPH_DATA:
-                    return await clear_graph_data(**arguments)
-                # Tools for Edge Operations
-                case TigerGraphToolName.ADD_EDGE:
-                    return await add_edge(**arguments)
-                case TigerGraphToolName.ADD_EDGES:
-                    return await add_edges(**arguments)
-                case TigerGraphToolName.HAS_EDGE:
-                    return await has_edge(**arguments)
-                case TigerGraphToolName.GET_EDGE_DATA:
-                    return await get_edge_data(**arguments)
-                # Tools for Statistics Operations
-                case TigerGraphToolName.DEGREE:
-                    return await degree(**arguments)
-                case TigerGraphToolName.NUMBER_OF_NODES:
-                    return await number_of_nodes(**arguments)
-                case TigerGraphToolName.NUMBER_OF_EDGES:
-                    return await number_of_edges(**arguments)
-                # Tools for Query Operations
-                case TigerGraphToolName.CREATE_QUERY:
-                    return await create_query(**arguments)
-                case TigerGraphToolName.INSTALL_QUERY:
-                    return await install_query(**arguments)
-                case TigerGraphToolName.DROP_QUERY:
-                    return await drop_query(**arguments)
-                case TigerGraphToolName.RUN_QUERY:
-                    return await run_query(**arguments)
-                case TigerGraphToolName.IS_QUERY_INSTALLED:
-                    return await is_query_installed(**arguments)
-                case TigerGraphToolName.GET_NODES:
-                    return await get_nodes(**arguments)
-                case TigerGraphToolName.GET_NEIGHBORS:
-                    return await get_neighbors(**arguments)
-                case TigerGraphToolName.BREADTH_FIRST_SEARCH:
-                    return await breadth_first_search(**arguments)
-                # Tools for Vector Operations
-                case TigerGraphToolName.UPSERT:
-                    return await upsert(**arguments)
-                case TigerGraphToolName.FETCH_NODE:
-                    return await fetch_node(**arguments)
-                case TigerGraphToolName.FETCH_NODES:
-                    return await fetch_nodes(**arguments)
-                case TigerGraphToolName.SEARCH:
-                    return await search(**arguments)
-                case TigerGraphToolName.SEARCH_MULTI_VECTOR_ATTRIBUTES:
-                    return await search_multi_vector_attributes(**arguments)
-                case TigerGraphToolName.SEARCH_TOP_K_SIMILAR_NODES:
-                    return await search_top_k_similar_nodes(**arguments)
-                case TigerGraphToolName.LIST_METADATA:
-                    return await list_metadata(**arguments)
-                case TigerGraphToolName.CREATE_DATA_SOURCE:
-                    return await create_data_source(**arguments)
-                case TigerGraphToolName.UPDATE_DATA_SOURCE:
-                    return await update_data_source(**arguments)
-                case TigerGraphToolName.GET_DATA_SOURCE:
-                    return await get_data_source(**arguments)
-                case TigerGraphToolName.DROP_DATA_SOURCE:
-                    return await drop_data_source(**arguments)
-                case TigerGraphToolName.GET_ALL_DATA_SOURCES:
-                    return await get_all_data_sources(**arguments)
-                case TigerGraphToolName.DROP_ALL_DATA_SOURCES:
-                    return await drop_all_data_sources(**arguments)
-                case TigerGraphToolName.PREVIEW_SAMPLE_DATA:
-                    return await preview_sample_data(**arguments)
-                case _:
-                    raise ValueError(f"Unknown tool: {name}")
+            entry = get_tool_entry(name)
+            # The tool module is imported, and the arguments validated, on the worker thread.
+            arguments = {"arguments": request.params.arguments or {}}
+            graph_name = arguments["arguments"].get("graph_name")
+            graph_name = graph_name if isinstance(graph_name, str) else None
+            buffered = write_buffer is not None and write_buffer.is_buffered(name)
+            if write_buffer is not None and not buffered:
+                # Any other call on a graph sees the writes buffered for it before the call.
+                await write_buffer.flush(graph_name)
+            if buffered:
+                content = await write_buffer.add(name, arguments["arguments"])
+            elif entry.idempotent:
+                content = await read(entry, arguments, graph_name)
+            else:
+                try:
+                    content = await executor.run(entry.category, entry.call, arguments)
+                finally:
+                    # Even a failed call may have changed part of the graph.
+                    result_cache.bump_epoch(graph_name)
+                    if entry.category == ToolCategory.SCHEMA and graph_name is not None:
+                        # Schema changes also show in calls naming no graph, or another one,
+                        # such as listing the graphs, queries or data sources.
+                        result_cache.bump_epoch()
         except Exception as e:
             logger.exception("Error in tool execution")
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
+            content = [TextContent(type="text", text=f"Error: {str(e)}")]
+            return types.ServerResult(types.CallToolResult(content=content, isError=True))
+        # Tools report their own failures as a message rather than an exception.
+        return types.ServerResult(
+            types.CallToolResult(content=list(content), isError=is_failure(content))
+        )
+
+    async def read(
+        entry: ToolEntry, arguments: Dict[str, Any], graph_name: Optional[str]
+    ) -> Sequence[TextContent]:
+        # The key includes the graph's write epoch, so neither a cached result nor a call in
+        # flight from before a write is reused after it.
+        key = result_cache.key(call_key(entry.tool.name, arguments["arguments"]), graph_name)
+        content = result_cache.get(key) if result_cache.enabled else None
+        if content is not None:
+            return content
+        if flights is not None:
+            # Identical reads arriving while one is running share its result.
+            content = await flights.do(
+                key, lambda: executor.run(entry.category, entry.call, arguments)
+            )
+        else:
+            content = await executor.run(entry.category, entry.call, arguments)
+        if result_cache.enabled and not is_failure(content):
+            result_cache.put(key, content)
+        return content
+
+    async def list_resources(request: types.ListResourcesRequest) -> types.ServerResult:
+        return types.ServerResult(types.ListResourcesResult(resources=[stats_resource]))
+
+    async def read_resource(request: types.ReadResourceRequest) -> types.ServerResult:
+        if str(request.params.uri) != STATS_URI:
+            raise ValueError(f"Unknown resource: {request.params.uri}")
+        contents = types.TextResourceContents(
+            uri=STATS_URI,
+            mimeType="application/json",
+            text=json.dumps({"result_cache": result_cache.stats()}),
+        )
+        return types.ServerResult(types.ReadResourceResult(contents=[contents]))
+
+    # Registered directly rather than through the decorators, which rebuild the tool list and
+    # validate arguments against the JSON schema on every call in newer MCP versions; the input
+    # models already do that validation.
+    server.request_handlers[types.ListToolsRequest] = list_tools
+    server.request_handlers[types.CallToolRequest] = call_tool
+    server.request_handlers[types.ListResourcesRequest] = list_resources
+    server.request_handlers[types.ReadResourceRequest] = read_resource
+    return server
+
+
+async def serve(
+    transport: Transport = Transport.STDIO,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+) -> None:
+    """Run the MCP server.
+
+    With the stdio transport the server talks to the single client that spawned it. The HTTP
+    transports instead serve any number of clients from one long-lived process, so all of them
+    share the same connections, graph handles and thread pools.
+    """
+    executor = ToolExecutor.from_config(get_config())
+    server = create_server(executor)
+    try:
+        if transport == Transport.STDIO:
+            options = server.create_initialization_options()
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, options, raise_exceptions=True)
+        else:
+            await _serve_http(server, transport, host, port)
+    finally:
+        executor.shutdown(wait=False)
+        # Tool modules are loaded lazily: the query templates exist only if a tool used them.
+        query_templates = sys.modules.get("tigergraph_mcp.tools.query_templates")
+        if query_templates is not None:
+            query_templates.close_query_templates()
+
+
+async def _serve_http(server: Server, transport: Transport, host: str, port: int) -> None:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+
+    if transport == Transport.STREAMABLE_HTTP:
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+        session_manager = StreamableHTTPSessionManager(app=server)
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app: Starlette) -> AsyncIterator[None]:
+            async with session_manager.run():
+                yield
+
+        app = Starlette(
+            routes=[Mount("/mcp", app=session_manager.handle_request)],
+            lifespan=lifespan,
+        )
+        endpoint = "/mcp"
+    else:
+        from mcp.server.sse import SseServerTransport
+
+        sse = SseServerTransport("/messages/")
+
+        async def handle_sse(request: Request) -> Response:
+            async with sse.connect_sse(request.scope, request.receive, request._send) as (
+                read_stream,
+                write_stream,
+            ):
+                await server.run(read_stream, write_stream, server.create_initialization_options())
+            return Response()
+
+        app = Starlette(
+            routes=[
+                Route("/sse", endpoint=handle_sse, methods=["GET"]),
+                Mount("/messages/", app=sse.handle_post_message),
+            ]
+        )
+        endpoint = "/sse"
 
-    options = server.create_initialization_options()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, options, raise_exceptions=True)
+    logger.info(f"Serving TigerGraph-MCP over {transport.value} at http://{host}:{port}{endpoint}")
+    config = uvicorn.Config(app, host=host, port=port, log_level="warning")
+    await uvicorn.Server(config).serve()
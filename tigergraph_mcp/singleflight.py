@@ -0,0 +1,59 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Mapping, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def call_key(name: str, arguments: Mapping[str, Any]) -> Tuple[str, str]:
+    """Return a key identifying a tool call, independent of the order of its arguments."""
+    return name, json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class _Flight(Generic[T]):
+    def __init__(self, task: "asyncio.Task[T]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single execution.
+
+    The first call for a key starts the work; calls arriving with the same key while it runs
+    wait for it and get the same result or exception. Once it finishes the key is forgotten, so
+    later calls run again. A waiter that is cancelled only stops waiting, unless it was the last
+    one, in which case the shared execution is cancelled too.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            logger.debug(f"Joining the call already in flight for {key}.")
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
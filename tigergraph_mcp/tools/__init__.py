@@ -6,57 +6,15 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from .tigergraph_tool_names import TigerGraphToolName
-from .tool_registry import get_all_tools
-from .graph import (
-    create_schema,
-    get_schema,
-    drop_graph,
-    load_data,
-    add_node,
-    add_nodes,
-    remove_node,
-    has_node,
-    get_node_data,
-    get_node_edges,
-    clear_graph_data,
-    add_edge,
-    add_edges,
-    has_edge,
-    get_edge_data,
-    degree,
-    number_of_nodes,
-    number_of_edges,
-    create_query,
-    install_query,
-    drop_query,
-    run_query,
-    is_query_installed,
-    get_nodes,
-    get_neighbors,
-    breadth_first_search,
-    upsert,
-    fetch_node,
-    fetch_nodes,
-    search,
-    search_multi_vector_attributes,
-    search_top_k_similar_nodes,
-)
-from .db import (
-    list_metadata,
-    create_data_source,
-    update_data_source,
-    get_data_source,
-    drop_data_source,
-    get_all_data_sources,
-    drop_all_data_sources,
-    preview_sample_data,
-)
+from .tool_registry import ToolEntry, get_all_tools, get_tool_entry, get_tool_handler
 
 __all__ = [
     # TigerGraph Tool Names
     "TigerGraphToolName",
-    # Get All Tools
+    # Tool Registry
+    "ToolEntry",
     "get_all_tools",
+    "get_tool_entry",
     # Tools for Schema Operations
     "create_schema",
     "get_schema",
@@ -67,20 +25,27 @@ __all__ = [
     "add_node",
     "add_nodes",
     "remove_node",
+    "remove_nodes",
     "has_node",
+    "has_nodes",
     "get_node_data",
-    "has_node",
+    "get_nodes_data",
     "get_node_edges",
     "clear_graph_data",
     # Tools for Edge Operations
     "add_edge",
     "add_edges",
     "has_edge",
+    "has_edges",
     "get_edge_data",
+    "get_edges_data",
     # Tools for Statistics Operations
     "degree",
+    "degrees",
+    "degree_distribution",
     "number_of_nodes",
     "number_of_edges",
+    "profile",
     # Tools for Query Operations
     "create_query",
     "install_query",
@@ -88,6 +53,9 @@ __all__ = [
     "run_query",
     "is_query_installed",
     "get_nodes",
+    "aggregate_nodes",
+    "top_k_nodes",
+    "top_k_edges",
     "get_neighbors",
     "breadth_first_search",
     # Tools for Vector Operations
@@ -97,6 +65,8 @@ __all__ = [
     "search",
     "search_multi_vector_attributes",
     "search_top_k_similar_nodes",
+    # Tools for Bulk Operations
+    "batch",
     # Tools for GSQL Operations
     "list_metadata",
     # Tools for Data Source Operations
@@ -108,3 +78,10 @@ __all__ = [
     "drop_all_data_sources",
     "preview_sample_data",
 ]
+
+
+def __getattr__(name: str):
+    # Tool handlers are resolved on first access, so importing this package stays cheap.
+    if name in __all__:
+        return get_tool_handler(name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,186 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase, HTTPBasicAuth
+
+import tigergraphx.core.graph_context
+import tigergraphx.core.tigergraph_database
+from tigergraphx.config import TigerGraphConnectionConfig
+from tigergraphx.core.tigergraph_api import TigerGraphAPI
+from tigergraphx.core.tigergraph_api.api import SecurityAPI
+
+from tigergraph_mcp.config import get_config
+
+logger = logging.getLogger(__name__)
+
+ConnectionConfig = TigerGraphConnectionConfig | Dict | str | Path
+
+# How long to keep using the secret directly after a failed attempt to create a token.
+TOKEN_RETRY_INTERVAL = 60.0
+
+
+def connection_profile(tigergraph_connection_config: Optional[ConnectionConfig] = None) -> str:
+    """Return a stable key identifying the TigerGraph endpoint and credentials in use."""
+    if tigergraph_connection_config is None:
+        config = TigerGraphConnectionConfig()
+    else:
+        config = TigerGraphConnectionConfig.ensure_config(tigergraph_connection_config)
+    # Hash the whole config so secrets never end up in logs or cache keys in clear text.
+    return hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+
+
+class CachedTokenAuth(AuthBase):
+    """Authenticates with a token created from the configured secret and reused until shortly
+    before it expires.
+
+    If the server cannot issue tokens, e.g. because REST++ authentication is disabled, requests
+    fall back to authenticating with the secret itself.
+    """
+
+    def __init__(self, security_api: SecurityAPI, secret: str, lifetime: int, margin: float):
+        self._security_api = security_api
+        self._fallback = HTTPBasicAuth("__GSQL__secret", secret)
+        self._secret = secret
+        self._lifetime = lifetime
+        self._margin = min(margin, lifetime / 2)
+        self._token: Optional[str] = None
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, r: PreparedRequest) -> PreparedRequest:
+        token = self._get_token()
+        if token is None:
+            return self._fallback(r)
+        r.headers["Authorization"] = f"Bearer {token}"
+        r.register_hook("response", self._handle_response)
+        return r
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._token = None
+            self._refresh_at = 0.0
+
+    def _get_token(self) -> Optional[str]:
+        with self._lock:
+            if time.monotonic() < self._refresh_at:
+                return self._token
+            try:
+                self._token = self._security_api.create_token(
+                    self._secret, lifetime_seconds=self._lifetime
+                )
+                self._refresh_at = time.monotonic() + self._lifetime - self._margin
+                logger.debug("Created a new TigerGraph auth token.")
+            except Exception as e:
+                logger.warning(f"Failed to create an auth token, using the secret instead: {e}")
+                self._token = None
+                self._refresh_at = time.monotonic() + TOKEN_RETRY_INTERVAL
+            return self._token
+
+    def _handle_response(self, response: Response, **kwargs) -> Response:
+        # The token may have been revoked on the server; create a new one for the next request.
+        if response.status_code == 401:
+            self.invalidate()
+        return response
+
+
+class ConnectionPool:
+    """Process-wide `TigerGraphAPI` instances, one per connection profile.
+
+    Creating a `TigerGraphAPI` opens a new HTTP session and fetches the server version, and
+    TigerGraphX creates one for every `Graph` and `TigerGraphDatabase`. Sharing one instance per
+    profile keeps connections alive across tool calls, so a tool call costs a single request
+    round-trip. Each session holds up to `pool_size` connections per host, and secret-based
+    credentials are exchanged once for a token that is refreshed before it expires.
+    """
+
+    def __init__(self, pool_size: int, token_lifetime: int, token_refresh_margin: float):
+        self.pool_size = pool_size
+        self.token_lifetime = token_lifetime
+        self.token_refresh_margin = token_refresh_margin
+        self._apis: Dict[str, TigerGraphAPI] = {}
+        self._lock = threading.Lock()
+
+    def get_api(
+        self, tigergraph_connection_config: Optional[ConnectionConfig] = None
+    ) -> TigerGraphAPI:
+        key = connection_profile(tigergraph_connection_config)
+        with self._lock:
+            api = self._apis.get(key)
+            if api is None:
+                logger.debug(f"Opening TigerGraph connection pool for profile {key}.")
+                api = _create_api(tigergraph_connection_config)
+                self._configure_session(api)
+                self._apis[key] = api
+            return api
+
+    def close(self) -> None:
+        with self._lock:
+            for api in self._apis.values():
+                api.session.close()
+            self._apis.clear()
+
+    def _configure_session(self, api: TigerGraphAPI) -> None:
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+        api.session.mount("http://", adapter)
+        api.session.mount("https://", adapter)
+        if api.config.secret and self.token_lifetime > 0:
+            # Tokens are created over a session of their own that authenticates with the secret.
+            token_session = Session()
+            token_session.auth = HTTPBasicAuth("__GSQL__secret", api.config.secret)
+            security_api = SecurityAPI(
+                api.config, api.endpoint_registry, token_session, api.version
+            )
+            api.session.auth = CachedTokenAuth(
+                security_api,
+                api.config.secret,
+                lifetime=self.token_lifetime,
+                margin=self.token_refresh_margin,
+            )
+
+
+# Keep a reference to the original constructor, since `install_connection_pool` replaces the
+# name inside TigerGraphX.
+_create_api = TigerGraphAPI
+
+_connection_pool: Optional[ConnectionPool] = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            config = get_config()
+            _connection_pool = ConnectionPool(
+                pool_size=config.pool_size,
+                token_lifetime=config.token_lifetime,
+                token_refresh_margin=config.token_refresh_margin,
+            )
+        return _connection_pool
+
+
+def get_api(tigergraph_connection_config: Optional[ConnectionConfig] = None) -> TigerGraphAPI:
+    return get_connection_pool().get_api(tigergraph_connection_config)
+
+
+def install_connection_pool() -> None:
+    """Make every `Graph` and `TigerGraphDatabase` created from now on use the shared pool.
+
+    TigerGraphX constructs its `TigerGraphAPI` internally and offers no way to pass one in, so
+    the name is replaced in the modules that construct it.
+    """
+    tigergraphx.core.graph_context.TigerGraphAPI = get_api
+    tigergraphx.core.tigergraph_database.TigerGraphAPI = get_api
@@ -0,0 +1,177 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import threading
+import time
+from typing import Callable, Dict, Literal, Optional, Tuple
+
+from tigergraph_mcp.config import get_config
+
+CountKind = Literal["node", "edge"]
+# Counts are keyed by ("node", node_type) or ("edge", edge_type); a type of None stands for the
+# total over all types.
+CountKey = Tuple[CountKind, Optional[str]]
+
+
+class Count:
+    """A node or edge count, as returned by `CountCache.count`."""
+
+    def __init__(self, value: int, cached: bool, age: float = 0.0, upper_bound: bool = False):
+        self.value = value
+        self.cached = cached
+        self.age = age
+        self.upper_bound = upper_bound
+
+    def amount(self) -> str:
+        return f"at most {self.value}" if self.upper_bound else str(self.value)
+
+    def source(self) -> str:
+        return f"cached, counted {self.age:.0f}s ago" if self.cached else "exact"
+
+
+class _Entry:
+    def __init__(self, value: int):
+        self.value = value
+        self.counted_at = time.monotonic()
+        self.upper_bound = False
+
+
+class CountCache:
+    """Process-wide node and edge counts per graph and type, kept current by this server's writes.
+
+    A count is taken from the database once and then adjusted by every write made through this
+    server: removals by the exact number of nodes removed, additions and upserts by the number
+    of items TigerGraph accepted. An upsert of an item that already existed is accepted as well,
+    so after additions the count is only an upper bound, and reported as such. Writes whose
+    effect is unknown (data loading, installed queries, the edges going with removed nodes) drop
+    the affected counts, and every count is taken again from the database after `ttl` seconds,
+    which bounds how long changes made by other clients go unnoticed.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, CountKey], _Entry] = {}
+        # Bumped by every write to a graph, so that a count taken while a write was running is
+        # not cached: it may or may not include the write.
+        self._versions: Dict[str, int] = {}
+        self._global_version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def count(
+        self,
+        graph_name: str,
+        key: CountKey,
+        counter: Callable[[], int],
+        refresh: bool = False,
+    ) -> Count:
+        """Return the cached count for `key`, or take it with `counter` and cache it."""
+        if not refresh:
+            with self._lock:
+                entry = self._entries.get((graph_name, key))
+                if entry is not None:
+                    age = time.monotonic() - entry.counted_at
+                    if age < self.ttl:
+                        return Count(entry.value, True, age, entry.upper_bound)
+        with self._lock:
+            version = self._version(graph_name)
+        value = counter()
+        if self.enabled:
+            with self._lock:
+                if self._version(graph_name) == version:
+                    self._entries[(graph_name, key)] = _Entry(value)
+        return Count(value, False)
+
+    def adjust(
+        self,
+        graph_name: str,
+        kind: CountKind,
+        type_name: str,
+        delta: int,
+        upper_bound: bool = False,
+    ) -> None:
+        """Apply a change of `delta` items of a type to its count and to the total."""
+        with self._lock:
+            self._bump(graph_name)
+            for key in ((kind, type_name), (kind, None)):
+                entry = self._entries.get((graph_name, key))
+                if entry is not None:
+                    entry.value = max(entry.value + delta, 0)
+                    entry.upper_bound = entry.upper_bound or upper_bound
+
+    def reset(self, graph_name: str) -> None:
+        """Set every cached count of a graph whose data was cleared to zero."""
+        with self._lock:
+            self._bump(graph_name)
+            for cached_graph, key in list(self._entries):
+                if cached_graph == graph_name:
+                    self._entries[(cached_graph, key)] = _Entry(0)
+
+    def invalidate(
+        self,
+        graph_name: Optional[str] = None,
+        kind: Optional[CountKind] = None,
+        type_name: Optional[str] = None,
+    ) -> None:
+        """Drop the counts of `graph_name`, or of every graph, limited to those of `kind` or,
+        if `type_name` is given, to the count of that type and the total."""
+        with self._lock:
+            if graph_name is not None:
+                self._bump(graph_name)
+            else:
+                self._global_version += 1
+            for cached_graph, key in list(self._entries):
+                if graph_name not in (None, cached_graph) or kind not in (None, key[0]):
+                    continue
+                if type_name is None or key[1] in (None, type_name):
+                    del self._entries[(cached_graph, key)]
+
+    def _version(self, graph_name: str) -> Tuple[int, int]:
+        return self._global_version, self._versions.get(graph_name, 0)
+
+    def _bump(self, graph_name: str) -> None:
+        self._versions[graph_name] = self._versions.get(graph_name, 0) + 1
+
+
+_count_cache: Optional[CountCache] = None
+_count_cache_lock = threading.Lock()
+
+
+def get_count_cache() -> CountCache:
+    global _count_cache
+    with _count_cache_lock:
+        if _count_cache is None:
+            _count_cache = CountCache(get_config().count_cache_ttl)
+        return _count_cache
+
+
+def invalidate_counts(graph_name: Optional[str] = None) -> None:
+    get_count_cache().invalidate(graph_name)
+
+
+def record_nodes_added(graph_name: str, node_type: str, count: int) -> None:
+    get_count_cache().adjust(graph_name, "node", node_type, count, upper_bound=True)
+
+
+def record_edges_added(
+    graph_name: str, src_node_type: str, edge_type: str, tgt_node_type: str, count: int
+) -> None:
+    cache = get_count_cache()
+    cache.adjust(graph_name, "edge", edge_type, count, upper_bound=True)
+    # Upserting an edge also creates its missing end nodes.
+    cache.invalidate(graph_name, "node", src_node_type)
+    cache.invalidate(graph_name, "node", tgt_node_type)
+
+
+def record_nodes_removed(graph_name: str, node_type: str, count: int) -> None:
+    cache = get_count_cache()
+    cache.adjust(graph_name, "node", node_type, -count)
+    # The edges of the removed nodes went with them.
+    cache.invalidate(graph_name, "edge")
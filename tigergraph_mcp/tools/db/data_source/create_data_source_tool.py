@@ -80,7 +80,7 @@ async def create_data_source(
     access_key: Optional[str] = None,
     secret_key: Optional[str] = None,
     extra_config: Optional[Dict[str, Any]] = None,
-    graph_name: Optional[str] = None,
+    graph: Optional[str] = None,
 ) -> List[TextContent]:
     try:
         db = TigerGraphDatabase()
@@ -91,7 +91,7 @@ async def create_data_source(
             access_key=access_key,
             secret_key=secret_key,
             extra_config=extra_config,
-            graph_name=graph_name,
+            graph_name=graph,
         )
 
         if isinstance(response, str) and f"Data source {name} is created" in response:
@@ -41,11 +41,11 @@ graph = "MyGraph"  # optional
 ]
 
 
-async def drop_data_source(name: str, graph_name: Optional[str] = None) -> List[TextContent]:
+async def drop_data_source(name: str, graph: Optional[str] = None) -> List[TextContent]:
     try:
         db = TigerGraphDatabase()
 
-        response = db.drop_data_source(name=name, graph_name=graph_name)
+        response = db.drop_data_source(name=name, graph_name=graph)
 
         if isinstance(response, str) and f"Data source {name} is dropped" in response:
             message = (
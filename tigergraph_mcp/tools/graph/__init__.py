@@ -17,8 +17,11 @@ from .node import (
     add_node,
     add_nodes,
     remove_node,
+    remove_nodes,
     has_node,
+    has_nodes,
     get_node_data,
+    get_nodes_data,
     get_node_edges,
     clear_graph_data,
 )
@@ -26,12 +29,17 @@ from .edge import (
     add_edge,
     add_edges,
     has_edge,
+    has_edges,
     get_edge_data,
+    get_edges_data,
 )
 from .statistics import (
     degree,
+    degrees,
+    degree_distribution,
     number_of_nodes,
     number_of_edges,
+    profile,
 )
 from .query import (
     create_query,
@@ -40,6 +48,9 @@ from .query import (
     run_query,
     is_query_installed,
     get_nodes,
+    aggregate_nodes,
+    top_k_nodes,
+    top_k_edges,
     get_neighbors,
     breadth_first_search,
 )
@@ -51,6 +62,9 @@ from .vector import (
     search_multi_vector_attributes,
     search_top_k_similar_nodes,
 )
+from .bulk import (
+    batch,
+)
 
 
 __all__ = [
@@ -64,20 +78,27 @@ __all__ = [
     "add_node",
     "add_nodes",
     "remove_node",
+    "remove_nodes",
     "has_node",
+    "has_nodes",
     "get_node_data",
-    "has_node",
+    "get_nodes_data",
     "get_node_edges",
     "clear_graph_data",
     # Tools for Edge Operations
     "add_edge",
     "add_edges",
     "has_edge",
+    "has_edges",
     "get_edge_data",
+    "get_edges_data",
     # Tools for Statistics Operations
     "degree",
+    "degrees",
+    "degree_distribution",
     "number_of_nodes",
     "number_of_edges",
+    "profile",
     # Tools for Query Operations
     "create_query",
     "install_query",
@@ -85,6 +106,9 @@ __all__ = [
     "run_query",
     "is_query_installed",
     "get_nodes",
+    "aggregate_nodes",
+    "top_k_nodes",
+    "top_k_edges",
     "get_neighbors",
     "breadth_first_search",
     # Tools for Vector Operations
@@ -94,4 +118,6 @@ __all__ = [
     "search",
     "search_multi_vector_attributes",
     "search_top_k_similar_nodes",
+    # Tools for Bulk Operations
+    "batch",
 ]
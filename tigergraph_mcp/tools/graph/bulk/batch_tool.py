@@ -0,0 +1,253 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+from typing import Any, Dict, Hashable, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.executor import ToolCategory, current_executor
+from tigergraph_mcp.tools import TigerGraphToolName, ToolEntry, get_tool_entry
+from tigergraph_mcp.tools.count_cache import record_edges_added, record_nodes_added
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_edge_type, resolve_node_type
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+
+
+class BatchOperation(BaseModel):
+    """A single tool call inside a batch."""
+
+    tool: str = Field(..., description="The name of the tool to run, e.g. 'graph__has_node'.")
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="The arguments of the tool. `graph_name` can be omitted; it is taken from "
+        "the batch.",
+    )
+
+
+class BatchToolInput(BaseModel):
+    """Input schema for running several graph operations in one call."""
+
+    graph_name: str = Field(..., description="The name of the graph the operations apply to.")
+    operations: List[BatchOperation] = Field(
+        ..., min_length=1, description="The operations to run, in order."
+    )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.BATCH,
+        description="""Runs a list of node, edge, statistics, query and vector operations on a
+TigerGraph graph in a single call.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+operations = [
+    {"tool": "graph__add_node", "arguments": {"node_id": "Alice", "node_type": "Person"}},
+    {"tool": "graph__add_node", "arguments": {"node_id": "Mike", "node_type": "Person"}},
+    {
+        "tool": "graph__add_edge",
+        "arguments": {"src_node_id": "Alice", "tgt_node_id": "Mike", "edge_type": "Friendship"},
+    },
+    {"tool": "graph__has_node", "arguments": {"node_id": "Alice", "node_type": "Person"}},
+    {"tool": "graph__get_node_data", "arguments": {"node_id": "Mike", "node_type": "Person"}},
+]
+```
+
+Notes:
+- Each operation takes the same arguments as the tool it names, except `graph_name`.
+- Operations run in order. Consecutive read operations run concurrently, and consecutive
+  `graph__add_node` or `graph__add_edge` operations with the same types are written together.
+- Schema, data loading, query management, data source and `graph__run_query` operations
+  cannot be batched.
+- Returns one result per operation, in order. A failed operation does not stop the others.
+""",
+        inputSchema=BatchToolInput.model_json_schema(),
+    )
+]
+
+# Tools whose consecutive calls are merged into one bulk write.
+_MERGEABLE_WRITES = {TigerGraphToolName.ADD_NODE, TigerGraphToolName.ADD_EDGE}
+
+
+class _Operation:
+    def __init__(self, index: int, tool: str):
+        self.index = index
+        self.tool = tool
+        self.entry: Optional[ToolEntry] = None
+        self.arguments: Dict[str, Any] = {}
+        self.result: Optional[str] = None
+
+    @property
+    def is_read(self) -> bool:
+        return self.entry is not None and self.entry.idempotent
+
+    @property
+    def merge_key(self) -> Optional[Hashable]:
+        """Operations sharing a merge key can be written in one bulk request."""
+        if self.entry is None or self.tool not in _MERGEABLE_WRITES:
+            return None
+        if self.tool == TigerGraphToolName.ADD_NODE:
+            return self.tool, self.arguments.get("node_type")
+        return (
+            self.tool,
+            self.arguments.get("src_node_type"),
+            self.arguments.get("edge_type"),
+            self.arguments.get("tgt_node_type"),
+        )
+
+    async def run(self) -> None:
+        assert self.entry is not None
+        self.result = _join(await self.entry.handler(**self.arguments))
+
+
+async def batch(
+    graph_name: str,
+    operations: List[BatchOperation],
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        prepared = [
+            _prepare(graph_name, index, BatchOperation.model_validate(operation))
+            for index, operation in enumerate(operations)
+        ]
+        for group in _group(prepared):
+            await _run_group(graph_name, group)
+        if use_json(output_format):
+            message = dumps([{"tool": op.tool, "result": op.result} for op in prepared])
+        else:
+            message = f"✅ Ran {len(prepared)} operations on graph '{graph_name}':\n" + "\n".join(
+                f"[{op.index}] {op.tool}: {op.result}" for op in prepared
+            )
+    except Exception as e:
+        message = f"❌ Failed to run batch on graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+def _prepare(graph_name: str, index: int, operation: BatchOperation) -> _Operation:
+    prepared = _Operation(index, operation.tool)
+    try:
+        entry = get_tool_entry(operation.tool)
+        batchable = entry.idempotent or entry.category == ToolCategory.WRITE
+        if not batchable or operation.tool == TigerGraphToolName.BATCH:
+            raise ValueError(f"Tool '{operation.tool}' cannot be used in a batch.")
+        if operation.arguments.get("graph_name", graph_name) != graph_name:
+            raise ValueError(f"All operations must apply to graph '{graph_name}'.")
+        arguments = dict(operation.arguments)
+        if "graph_name" in entry.input_model.model_fields:
+            arguments["graph_name"] = graph_name
+        prepared.arguments = entry.parse_arguments(arguments)
+        prepared.entry = entry
+    except Exception as e:
+        prepared.result = f"❌ Invalid operation: {str(e)}"
+    return prepared
+
+
+def _group(operations: List[_Operation]) -> List[List[_Operation]]:
+    """Split the operations into consecutive runs of reads or of mergeable writes."""
+    groups: List[List[_Operation]] = []
+    for operation in operations:
+        if operation.entry is None:
+            continue
+        if groups:
+            last = groups[-1][-1]
+            same_reads = operation.is_read and last.is_read
+            same_writes = operation.merge_key is not None and operation.merge_key == last.merge_key
+            if same_reads or same_writes:
+                groups[-1].append(operation)
+                continue
+        groups.append([operation])
+    return groups
+
+
+async def _run_group(graph_name: str, group: List[_Operation]) -> None:
+    executor = current_executor()
+    if len(group) > 1 and group[0].is_read and executor is not None:
+        # The reads run in parallel on the server's pools, within the limits of their category.
+        results = await asyncio.gather(
+            *(
+                asyncio.wrap_future(
+                    executor.submit(op.entry.category, op.entry.handler, op.arguments)
+                )
+                for op in group
+            ),
+            return_exceptions=True,
+        )
+        for op, content in zip(group, results):
+            if isinstance(content, BaseException):
+                op.result = f"❌ Failed to run '{op.tool}': {str(content)}"
+            else:
+                op.result = _join(content)
+    elif len(group) == 1 or group[0].is_read:
+        for op in group:
+            await op.run()
+    elif group[0].tool == TigerGraphToolName.ADD_NODE:
+        _add_nodes(graph_name, group)
+    else:
+        _add_edges(graph_name, group)
+
+
+def _add_nodes(graph_name: str, group: List[_Operation]) -> None:
+    node_type = group[0].arguments.get("node_type")
+    nodes = [(op.arguments["node_id"], op.arguments.get("attributes") or {}) for op in group]
+    try:
+        graph = get_graph(graph_name)
+        count = graph.add_nodes_from(nodes, node_type)
+        # TigerGraphX returns None when the request fails; 0 is a valid count.
+        error = None if count is not None else "the bulk write failed"
+        record_nodes_added(graph_name, resolve_node_type(graph, node_type), count or 0)
+    except Exception as e:
+        error = str(e)
+    for op in group:
+        node_id = op.arguments["node_id"]
+        if error is None:
+            op.result = (
+                f"✅ Node '{node_id}' (Type: {node_type or 'default'}) "
+                f"added successfully to graph '{graph_name}' ({len(group)} nodes written together)."
+            )
+        else:
+            op.result = f"❌ Failed to add node '{node_id}' to graph '{graph_name}': {error}"
+
+
+def _add_edges(graph_name: str, group: List[_Operation]) -> None:
+    arguments = group[0].arguments
+    edge_type = arguments.get("edge_type")
+    edges = [
+        (
+            op.arguments["src_node_id"],
+            op.arguments["tgt_node_id"],
+            op.arguments.get("attributes") or {},
+        )
+        for op in group
+    ]
+    try:
+        graph = get_graph(graph_name)
+        types = (arguments.get("src_node_type"), edge_type, arguments.get("tgt_node_type"))
+        count = graph.add_edges_from(edges, *types)
+        error = None if count is not None else "the bulk write failed"
+        record_edges_added(graph_name, *resolve_edge_type(graph, *types)[:3], count or 0)
+    except Exception as e:
+        error = str(e)
+    for op, (src_node_id, tgt_node_id, _) in zip(group, edges):
+        if error is None:
+            op.result = (
+                f"✅ Edge from '{src_node_id}' to '{tgt_node_id}' (EdgeType: "
+                f"{edge_type or 'default'}) added successfully to graph '{graph_name}' "
+                f"({len(group)} edges written together)."
+            )
+        else:
+            op.result = (
+                f"❌ Failed to add edge from '{src_node_id}' to '{tgt_node_id}' "
+                f"in graph '{graph_name}': {error}"
+            )
+
+
+def _join(content: List[TextContent]) -> str:
+    return "\n".join(item.text for item in content)
@@ -0,0 +1,205 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Columnar input for the bulk write tools.
+
+Instead of one record per node or edge, clients can send one array per attribute, either as
+JSON lists, as base64-encoded NumPy buffers or as a base64-encoded Arrow IPC stream. The columns
+are converted into REST++ upsert rows one slice at a time, each column slice being turned into
+Python values in a single vectorized call, and fed to the chunked upsert pipeline, so only the
+rows being sent are ever held in memory.
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from pydantic import BaseModel, Field
+from tigergraphx import Graph
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import (
+    EdgeRow,
+    NodeRow,
+    UpsertResult,
+    encode_attributes,
+    resolve_edge_type,
+    resolve_node_type,
+    upsert_edges,
+    upsert_nodes,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy is optional
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pyarrow = None
+
+NODE_ID_COLUMN = "node_id"
+SRC_NODE_ID_COLUMN = "src_node_id"
+TGT_NODE_ID_COLUMN = "tgt_node_id"
+
+ARROW_IPC_DESCRIPTION = (
+    "Alternative to `columns`: a base64-encoded Arrow IPC stream holding the same columns. "
+    "Requires pyarrow on the server."
+)
+
+
+class EncodedArray(BaseModel):
+    """A NumPy array sent as base64-encoded raw bytes."""
+
+    dtype: str = Field(..., description="The NumPy dtype of the array, e.g. 'float32' or '<i8'.")
+    data: str = Field(..., description="The base64-encoded bytes of the array, in C order.")
+    shape: Optional[List[int]] = Field(
+        None,
+        description="The shape of the array. Defaults to one dimension. With two dimensions, "
+        "each row becomes a list value, e.g. for a vector attribute.",
+    )
+
+
+Column = List[Any] | EncodedArray
+
+
+def columns_description(id_columns: str) -> str:
+    return (
+        "Columnar alternative to the list of records: a mapping from column name to an array "
+        f"with one value per row. {id_columns} Every other column is written as the attribute "
+        "of the same name. Each array is either a JSON list or an encoded NumPy array "
+        "(`dtype`, base64 `data`, optional `shape`)."
+    )
+
+
+class ColumnarTable:
+    """Equal-length columns that can be read as Python lists one slice at a time."""
+
+    def __init__(self, columns: Dict[str, Any]):
+        if not columns:
+            raise ValueError("No columns were provided.")
+        lengths = {name: len(column) for name, column in columns.items()}
+        if len(set(lengths.values())) != 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}.")
+        self.columns = columns
+        self.num_rows = next(iter(lengths.values()))
+
+    @classmethod
+    def from_input(
+        cls, columns: Optional[Dict[str, Column]], arrow_ipc: Optional[str]
+    ) -> "ColumnarTable":
+        if (columns is None) == (arrow_ipc is None):
+            raise ValueError("Provide exactly one of `columns` and `arrow_ipc`.")
+        if arrow_ipc is not None:
+            return cls(_read_arrow_ipc(arrow_ipc))
+        return cls({name: _decode_column(column) for name, column in (columns or {}).items()})
+
+    def require(self, *names: str) -> None:
+        missing = [name for name in names if name not in self.columns]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}.")
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[Dict[str, List[Any]]]:
+        for start in range(0, self.num_rows, chunk_size):
+            stop = min(start + chunk_size, self.num_rows)
+            yield {name: _to_list(column, start, stop) for name, column in self.columns.items()}
+
+
+def add_nodes_columnar(
+    graph: Graph,
+    node_type: Optional[str],
+    columns: Optional[Dict[str, Column]],
+    arrow_ipc: Optional[str],
+    common_attributes: Optional[Dict[str, Any]] = None,
+    id_column: str = NODE_ID_COLUMN,
+) -> UpsertResult:
+    """Upsert the nodes described by the columns."""
+    table = ColumnarTable.from_input(columns, arrow_ipc)
+    table.require(id_column)
+    node_type = resolve_node_type(graph, node_type)
+    return upsert_nodes(graph, node_type, node_rows(table, id_column, common_attributes))
+
+
+def add_edges_columnar(
+    graph: Graph,
+    src_node_type: Optional[str],
+    edge_type: Optional[str],
+    tgt_node_type: Optional[str],
+    columns: Optional[Dict[str, Column]],
+    arrow_ipc: Optional[str],
+    common_attributes: Optional[Dict[str, Any]] = None,
+) -> UpsertResult:
+    """Upsert the edges described by the columns."""
+    table = ColumnarTable.from_input(columns, arrow_ipc)
+    table.require(SRC_NODE_ID_COLUMN, TGT_NODE_ID_COLUMN)
+    types = resolve_edge_type(graph, src_node_type, edge_type, tgt_node_type)
+    return upsert_edges(graph, *types, edge_rows(table, common_attributes))
+
+
+def primary_key(graph: Graph, node_type: Optional[str]) -> Tuple[str, str]:
+    """Return the node type and the name of its primary key."""
+    node_type = resolve_node_type(graph, node_type)
+    return node_type, graph.get_schema("dict")["nodes"][node_type]["primary_key"]
+
+
+def node_rows(
+    table: ColumnarTable,
+    id_column: str,
+    common_attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[NodeRow]:
+    common = encode_attributes(common_attributes or {})
+    for chunk in table.iter_chunks(get_config().upsert_chunk_size):
+        ids = [str(node_id) for node_id in chunk.pop(id_column)]
+        names = list(chunk)
+        rows = zip(*chunk.values()) if names else ([] for _ in ids)
+        for node_id, row in zip(ids, rows):
+            yield node_id, {**common, **{name: {"value": value} for name, value in zip(names, row)}}
+
+
+def edge_rows(
+    table: ColumnarTable,
+    common_attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[EdgeRow]:
+    common = encode_attributes(common_attributes or {})
+    for chunk in table.iter_chunks(get_config().upsert_chunk_size):
+        src_ids = [str(node_id) for node_id in chunk.pop(SRC_NODE_ID_COLUMN)]
+        tgt_ids = [str(node_id) for node_id in chunk.pop(TGT_NODE_ID_COLUMN)]
+        names = list(chunk)
+        rows = zip(*chunk.values()) if names else ([] for _ in src_ids)
+        for src_id, tgt_id, row in zip(src_ids, tgt_ids, rows):
+            attributes = {**common, **{name: {"value": value} for name, value in zip(names, row)}}
+            yield src_id, tgt_id, attributes
+
+
+def _decode_column(column: Column) -> Sequence[Any]:
+    if not isinstance(column, EncodedArray):
+        return column
+    if numpy is None:
+        raise ValueError("Encoded NumPy columns require numpy to be installed on the server.")
+    try:
+        array = numpy.frombuffer(base64.b64decode(column.data), dtype=numpy.dtype(column.dtype))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid encoded array: {e}") from e
+    return array.reshape(column.shape) if column.shape else array
+
+
+def _read_arrow_ipc(arrow_ipc: str) -> Dict[str, Any]:
+    if pyarrow is None:
+        raise ValueError("Arrow IPC input requires pyarrow to be installed on the server.")
+    try:
+        table = pyarrow.ipc.open_stream(base64.b64decode(arrow_ipc)).read_all()
+    except (binascii.Error, pyarrow.ArrowException) as e:
+        raise ValueError(f"Invalid Arrow IPC stream: {e}") from e
+    return {name: table.column(name) for name in table.column_names}
+
+
+def _to_list(column: Any, start: int, stop: int) -> List[Any]:
+    if pyarrow is not None and isinstance(column, pyarrow.ChunkedArray):
+        return column.slice(start, stop - start).to_pylist()
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column[start:stop].tolist()
+    return list(column[start:stop])
@@ -0,0 +1,286 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Chunked, parallel upserts for large node and edge writes.
+
+Rows are grouped into chunks bounded both by row count and by encoded size, and each chunk is
+sent to REST++ as its own upsert request, with a bounded number of requests in flight at once.
+Rows are consumed lazily, so only the chunks being sent are held in memory. A chunk that fails
+with a transient error is retried on its own; a chunk that still fails is reported without
+affecting the others.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from tigergraphx import Graph
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.executor import raise_if_cancelled
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.count_cache import (
+    invalidate_counts,
+    record_edges_added,
+    record_nodes_added,
+)
+
+logger = logging.getLogger(__name__)
+
+# A node row is (node ID, encoded attributes); an edge row is (source ID, target ID, encoded
+# attributes). Attributes are encoded as REST++ expects them: {name: {"value": value}}.
+NodeRow = Tuple[str, Dict[str, Any]]
+EdgeRow = Tuple[str, str, Dict[str, Any]]
+
+# Delay before the first retry of a failed chunk, doubled for each further retry.
+RETRY_BACKOFF = 0.5
+
+# HTTP statuses of requests that may succeed when sent again, besides 5xx.
+RETRYABLE_STATUSES = {408, 429}
+
+# Bytes of JSON syntax around each ID and each attribute of a row in an upsert payload, e.g.
+# `"id": {...}, ` and `"name": {"value": ...}, `; string values add their two quotes.
+_ID_OVERHEAD = 8
+_ATTRIBUTE_OVERHEAD = 17
+
+
+class UpsertResult:
+    """Aggregated outcome of a chunked upsert."""
+
+    def __init__(self):
+        self.accepted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.chunks = 0
+        self.failed_chunks = 0
+        self.error: Optional[str] = None
+
+    def counts(self) -> str:
+        counts = f"{self.accepted} accepted, {self.skipped} skipped"
+        if self.failed:
+            counts += (
+                f", {self.failed} failed in {self.failed_chunks} of {self.chunks} requests: "
+                f"{self.error}"
+            )
+        return counts
+
+    def message(self, added: Callable[[int], str], failed: str) -> str:
+        """Build the tool response. `added` describes the write given the number of rows
+        accepted, e.g. "added 3 nodes to graph 'G'"; `failed` is the action that failed, e.g.
+        "add nodes to graph 'G'"."""
+        if self.failed and not self.accepted:
+            return f"❌ Failed to {failed}: {self.error}"
+        if self.failed:
+            return f"⚠️ Partially {added(self.accepted)} ({self.counts()})."
+        if not self.accepted:
+            return f"❌ Failed to {failed} ({self.counts()})."
+        return f"✅ Successfully {added(self.accepted)} ({self.counts()})."
+
+
+def encode_attributes(*attribute_dicts: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge attribute dicts, later ones winning, into the REST++ attribute encoding."""
+    return {
+        name: {"value": value}
+        for attributes in attribute_dicts
+        for name, value in attributes.items()
+    }
+
+
+def resolve_node_type(graph: Graph, node_type: Optional[str]) -> str:
+    if node_type is not None:
+        if node_type not in graph.node_types:
+            raise ValueError(f"Invalid node type '{node_type}'. Must be one of {graph.node_types}.")
+        return node_type
+    if len(graph.node_types) != 1:
+        raise ValueError("Multiple node types detected. Please specify a node type.")
+    return next(iter(graph.node_types))
+
+
+def resolve_edge_type(
+    graph: Graph,
+    src_node_type: Optional[str],
+    edge_type: Optional[str],
+    tgt_node_type: Optional[str],
+) -> Tuple[str, str, str, bool]:
+    """Return the source node, edge and target node types, and whether the edge type allows
+    multiple edges between the same nodes."""
+    if edge_type is not None:
+        if edge_type not in graph.edge_types:
+            raise ValueError(f"Invalid edge type '{edge_type}'. Must be one of {graph.edge_types}.")
+    elif len(graph.edge_types) == 1:
+        edge_type = next(iter(graph.edge_types))
+    else:
+        raise ValueError("Multiple edge types detected. Please specify an edge type.")
+    edge_schema = graph.get_schema("dict")["edges"][edge_type]
+    return (
+        src_node_type or edge_schema["from_node_type"],
+        edge_type,
+        tgt_node_type or edge_schema["to_node_type"],
+        bool(edge_schema.get("discriminator")),
+    )
+
+
+def upsert_nodes(graph: Graph, node_type: str, rows: Iterable[NodeRow]) -> UpsertResult:
+    def payload(chunk: List[NodeRow]) -> Dict[str, Any]:
+        return {"vertices": {node_type: dict(chunk)}}
+
+    result = _run(graph.name, _chunks(rows), payload, "accepted_vertices")
+    if result.failed_chunks:
+        # A failed request may still have been applied.
+        invalidate_counts(graph.name)
+    else:
+        record_nodes_added(graph.name, node_type, result.accepted)
+    return result
+
+
+def upsert_edges(
+    graph: Graph,
+    src_node_type: str,
+    edge_type: str,
+    tgt_node_type: str,
+    multi_edge: bool,
+    rows: Iterable[EdgeRow],
+) -> UpsertResult:
+    def payload(chunk: List[EdgeRow]) -> Dict[str, Any]:
+        sources: Dict[str, Any] = {}
+        for src_id, tgt_id, attributes in chunk:
+            targets = sources.setdefault(src_id, {}).setdefault(edge_type, {})
+            targets = targets.setdefault(tgt_node_type, {})
+            if multi_edge:
+                targets.setdefault(tgt_id, []).append(attributes)
+            else:
+                targets[tgt_id] = attributes
+        return {"edges": {src_node_type: sources}}
+
+    result = _run(graph.name, _chunks(rows), payload, "accepted_edges")
+    if result.failed_chunks:
+        invalidate_counts(graph.name)
+    else:
+        record_edges_added(graph.name, src_node_type, edge_type, tgt_node_type, result.accepted)
+    return result
+
+
+def _chunks(rows: Iterable[Any]) -> Iterator[List[Any]]:
+    config = get_config()
+    chunk: List[Any] = []
+    size = 0
+    for row in rows:
+        row_size = _row_size(row)
+        if chunk and (
+            len(chunk) >= config.upsert_chunk_size or size + row_size > config.upsert_chunk_bytes
+        ):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+def _row_size(row: Any) -> int:
+    """Estimate the encoded size of `row` from the lengths of its IDs and attribute values,
+    without serializing it a first time just to measure it."""
+    *ids, attributes = row
+    size = sum(len(str(node_id)) + _ID_OVERHEAD for node_id in ids)
+    for name, encoded in attributes.items():
+        value = encoded.get("value") if isinstance(encoded, dict) else encoded
+        size += len(name) + _ATTRIBUTE_OVERHEAD
+        size += len(value) + 2 if isinstance(value, str) else len(str(value))
+    return size
+
+
+def _run(
+    graph_name: str,
+    chunks: Iterator[List[Any]],
+    build_payload: Callable[[List[Any]], Dict[str, Any]],
+    accepted_key: str,
+) -> UpsertResult:
+    api = get_api()
+    pool = get_upsert_pool()
+    max_in_flight = get_config().upsert_concurrency
+    result = UpsertResult()
+    in_flight: Dict[Future, int] = {}
+
+    def collect(done: Iterable[Future]) -> None:
+        for future in done:
+            rows = in_flight.pop(future)
+            try:
+                accepted = future.result()
+            except Exception as e:
+                result.failed += rows
+                result.failed_chunks += 1
+                result.error = result.error or str(e)
+            else:
+                result.accepted += accepted
+                result.skipped += max(rows - accepted, 0)
+
+    try:
+        for chunk in chunks:
+            raise_if_cancelled()
+            if len(in_flight) >= max_in_flight:
+                collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+            payload = build_payload(chunk)
+            in_flight[pool.submit(_send, api, graph_name, payload, accepted_key)] = len(chunk)
+            result.chunks += 1
+        collect(wait(in_flight).done)
+    except asyncio.CancelledError:
+        # Part of the rows may have been written.
+        invalidate_counts(graph_name)
+        raise
+    finally:
+        for future in in_flight:
+            future.cancel()
+    logger.debug(f"Upserted {result.counts()} in {result.chunks} requests to '{graph_name}'.")
+    return result
+
+
+def _send(api: Any, graph_name: str, payload: Dict[str, Any], accepted_key: str) -> int:
+    retries = get_config().upsert_retries
+    for attempt in range(retries + 1):
+        try:
+            return api.upsert_graph_data(graph_name, payload)[0].get(accepted_key, 0)
+        except Exception as e:
+            # A request rejected by TigerGraph would fail the same way if sent again.
+            if attempt == retries or not _is_transient(e):
+                raise
+            logger.warning(f"Upsert request to '{graph_name}' failed, retrying: {e}")
+            time.sleep(RETRY_BACKOFF * 2**attempt)
+    raise AssertionError("unreachable")
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed request may succeed when sent again: the connection failed or timed
+    out, or TigerGraph answered with a server error, a request timeout or a rate limit.
+
+    TigerGraphX raises the builtin `ConnectionError` and `TimeoutError` for the former, and wraps
+    HTTP errors in a `RuntimeError` caused by the `requests` error holding the response.
+    """
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error.__cause__, "response", None), "status_code", None)
+    return isinstance(status, int) and (status >= 500 or status in RETRYABLE_STATUSES)
+
+
+_upsert_pool: Optional[ThreadPoolExecutor] = None
+_upsert_pool_lock = threading.Lock()
+
+
+def get_upsert_pool() -> ThreadPoolExecutor:
+    # Shared by all bulk write tools, so the number of upsert and delete requests in flight
+    # stays bounded however many bulk writes run at the same time.
+    global _upsert_pool
+    with _upsert_pool_lock:
+        if _upsert_pool is None:
+            _upsert_pool = ThreadPoolExecutor(
+                max_workers=get_config().upsert_concurrency,
+                thread_name_prefix="tigergraph-mcp-upsert",
+            )
+        return _upsert_pool
@@ -10,9 +10,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import invalidate_counts
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class LoadDataToolInput(BaseModel):
@@ -146,8 +146,10 @@ async def load_data(
     loading_job_config: Dict,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        # Loading jobs are generated from the schema, so always load it fresh from the database.
+        graph = get_graph(graph_name, refresh=True)
         result = graph.load_data(loading_job_config)
+        invalidate_counts(graph_name)
 
         if "[WARNING]" in result:
             message = (
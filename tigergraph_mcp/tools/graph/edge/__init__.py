@@ -8,12 +8,16 @@
 from .add_edge_tool import add_edge
 from .add_edges_tool import add_edges
 from .has_edge_tool import has_edge
+from .has_edges_tool import has_edges
 from .get_edge_data_tool import get_edge_data
+from .get_edges_data_tool import get_edges_data
 
 
 __all__ = [
     "add_edge",
     "add_edges",
     "has_edge",
+    "has_edges",
     "get_edge_data",
+    "get_edges_data",
 ]
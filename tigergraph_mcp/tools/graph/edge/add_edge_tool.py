@@ -10,9 +10,10 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import record_edges_added
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_edge_type
 
 
 class AddEdgeToolInput(BaseModel):
@@ -67,7 +68,7 @@ async def add_edge(
 ) -> List[TextContent]:
     try:
         attributes = attributes or {}
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         graph.add_edge(
             src_node_id,
             tgt_node_id,
@@ -76,6 +77,9 @@ async def add_edge(
             tgt_node_type,
             **attributes,
         )
+        record_edges_added(
+            graph_name, *resolve_edge_type(graph, src_node_type, edge_type, tgt_node_type)[:3], 1
+        )
         message = (
             f"✅ Edge from '{src_node_id}' to '{tgt_node_id}' (EdgeType: {edge_type or 'default'})"
             f"added successfully to graph '{graph_name}'."
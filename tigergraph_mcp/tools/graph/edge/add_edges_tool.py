@@ -10,18 +10,29 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.columnar import (
+    ARROW_IPC_DESCRIPTION,
+    Column,
+    add_edges_columnar,
+    columns_description,
+)
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import (
+    encode_attributes,
+    resolve_edge_type,
+    upsert_edges,
+)
 
 
 class AddEdgesFromToolInput(BaseModel):
     """Input schema for adding multiple edges to a graph."""
 
     graph_name: str = Field(..., description="The name of the graph where the edges will be added.")
-    ebunch_to_add: Sequence[List] = Field(
-        ...,
-        description="A list of (src, tgt) or (src, tgt, attribute_dict) edge tuples.",
+    ebunch_to_add: Optional[Sequence[List]] = Field(
+        None,
+        description="A list of (src, tgt) or (src, tgt, attribute_dict) edge tuples. "
+        "Required unless `columns` or `arrow_ipc` is given.",
     )
     src_node_type: Optional[str] = Field(
         None, description="The type of the source nodes (optional)."
@@ -34,6 +45,13 @@ class AddEdgesFromToolInput(BaseModel):
         default_factory=dict,
         description="Common attributes applied to all edges.",
     )
+    columns: Optional[Dict[str, Column]] = Field(
+        None,
+        description=columns_description(
+            "The source and target node IDs go in the `src_node_id` and `tgt_node_id` columns."
+        ),
+    )
+    arrow_ipc: Optional[str] = Field(None, description=ARROW_IPC_DESCRIPTION)
 
 
 tools = [
@@ -41,6 +59,10 @@ tools = [
         name=TigerGraphToolName.ADD_EDGES,
         description="""Adds multiple edges to a TigerGraph graph using TigerGraphX.
 
+Large lists are split into several upsert requests sent in parallel. The response reports how
+many edges were accepted and how many were skipped by TigerGraph, e.g. because an endpoint does
+not exist.
+
 Example input:
 ```python
 {
@@ -54,6 +76,21 @@ Example input:
   "tgt_node_type": "Person",
   "attributes": {"verified": true}
 }
+```
+
+Columnar input, for large numbers of edges:
+```python
+{
+  "graph_name": "SocialGraph",
+  "columns": {
+    "src_node_id": ["Alice", "Alice"],
+    "tgt_node_id": ["Mike", "John"],
+    "closeness": [1.0, 2.5]
+  },
+  "src_node_type": "Person",
+  "edge_type": "Friendship",
+  "tgt_node_type": "Person"
+}
 ```""",
         inputSchema=AddEdgesFromToolInput.model_json_schema(),
     )
@@ -62,48 +99,70 @@ Example input:
 
 async def add_edges(
     graph_name: str,
-    ebunch_to_add: Sequence[
-        List | Tuple[str | int, str | int] | Tuple[str | int, str | int, Dict[str, Any]]
-    ],
+    ebunch_to_add: Optional[
+        Sequence[List | Tuple[str | int, str | int] | Tuple[str | int, str | int, Dict[str, Any]]]
+    ] = None,
     src_node_type: Optional[str] = None,
     edge_type: Optional[str] = None,
     tgt_node_type: Optional[str] = None,
     attributes: Optional[Dict[str, Any]] = None,
+    columns: Optional[Dict[str, Column]] = None,
+    arrow_ipc: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        # Normalize ebunch so each item is a (src, tgt, attributes) tuple
-        normalized_edges = []
-        for item in ebunch_to_add:
-            if isinstance(item, (list, tuple)) and len(item) == 2:
-                src, tgt = item
-                normalized_edges.append((src, tgt, {}))
-            elif isinstance(item, (list, tuple)) and len(item) == 3:
-                src, tgt, attr = item
-                if not isinstance(attr, dict):
-                    raise ValueError("Edge attributes must be a dictionary.")
-                normalized_edges.append((src, tgt, attr))
-            else:
-                raise ValueError(
-                    "Each item in ebunch_to_add must be (src, tgt) or (src, tgt, attribute dict)."
-                )
-
-        graph = Graph.from_db(graph_name)
-        count = graph.add_edges_from(
-            normalized_edges,
-            src_node_type,
-            edge_type,
-            tgt_node_type,
-            **(attributes or {}),
-        )
-
-        if count:
-            message = (
-                f"✅ Successfully added {count} edge(s) of type "
-                f"'{edge_type or 'default'}' to graph '{graph_name}'."
+        if (ebunch_to_add is None) == (columns is None and arrow_ipc is None):
+            raise ValueError(
+                "Provide either `ebunch_to_add`, or columnar input in `columns` or `arrow_ipc`."
+            )
+        graph = get_graph(graph_name)
+        types = resolve_edge_type(graph, src_node_type, edge_type, tgt_node_type)
+        src_node_type, edge_type, tgt_node_type, _ = types
+        if ebunch_to_add is None:
+            result = add_edges_columnar(
+                graph,
+                src_node_type,
+                edge_type,
+                tgt_node_type,
+                columns,
+                arrow_ipc,
+                attributes,
             )
         else:
-            message = f"❌ Failed to add edges to graph '{graph_name}'."
+            common = attributes or {}
+            rows = (
+                (str(src), str(tgt), encode_attributes(common, attr))
+                for src, tgt, attr in _normalize_edges(ebunch_to_add)
+            )
+            result = upsert_edges(graph, *types, rows)
+
+        message = result.message(
+            lambda count: f"added {count} edge(s) of type '{edge_type}' to graph '{graph_name}'",
+            f"add edges to graph '{graph_name}'",
+        )
     except Exception as e:
         message = f"❌ Failed to add edges to graph '{graph_name}': {str(e)}"
 
     return [TextContent(type="text", text=message)]
+
+
+def _normalize_edges(
+    ebunch_to_add: Sequence[
+        List | Tuple[str | int, str | int] | Tuple[str | int, str | int, Dict[str, Any]]
+    ],
+) -> List[Tuple[str | int, str | int, Dict[str, Any]]]:
+    # Normalize ebunch so each item is a (src, tgt, attributes) tuple
+    normalized_edges = []
+    for item in ebunch_to_add:
+        if isinstance(item, (list, tuple)) and len(item) == 2:
+            src, tgt = item
+            normalized_edges.append((src, tgt, {}))
+        elif isinstance(item, (list, tuple)) and len(item) == 3:
+            src, tgt, attr = item
+            if not isinstance(attr, dict):
+                raise ValueError("Edge attributes must be a dictionary.")
+            normalized_edges.append((src, tgt, attr))
+        else:
+            raise ValueError(
+                "Each item in ebunch_to_add must be (src, tgt) or (src, tgt, attribute dict)."
+            )
+    return normalized_edges
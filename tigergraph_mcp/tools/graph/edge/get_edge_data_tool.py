@@ -10,9 +10,8 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class GetEdgeDataToolInput(BaseModel):
@@ -63,7 +62,7 @@ async def get_edge_data(
     tgt_node_type: Optional[str] = None,
 ) -> list[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         response = graph.get_edge_data(
             src_node_id=src_node_id,
             tgt_node_id=tgt_node_id,
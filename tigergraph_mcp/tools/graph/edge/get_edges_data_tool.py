@@ -0,0 +1,161 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_edge_type
+from tigergraph_mcp.tools.output import dumps
+
+Pair = Tuple[str, str]
+
+
+class GetEdgesDataToolInput(BaseModel):
+    """Input schema for retrieving the data of many edges from a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph where the edges are located.")
+    edges: List[Tuple[str | int, str | int]] = Field(
+        ...,
+        min_length=1,
+        description="The edges to retrieve, as [source node ID, target node ID] pairs.",
+    )
+    src_node_type: Optional[str] = Field(
+        None, description="The type of the source nodes (optional)."
+    )
+    edge_type: Optional[str] = Field(None, description="The type of the edges (optional).")
+    tgt_node_type: Optional[str] = Field(
+        None, description="The type of the target nodes (optional)."
+    )
+    return_attributes: Optional[List[str]] = Field(
+        None, description="The attributes to return. All attributes are returned if omitted."
+    )
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.GET_EDGES_DATA,
+        description="""Retrieves the attributes of many edges of a TigerGraph graph in one call.
+
+Use this instead of calling `graph__get_edge_data` once per edge.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+edges = [["Alice", "Mike"], ["Alice", "Zoe"]]
+src_node_type = "Person"
+edge_type = "Friendship"
+tgt_node_type = "Person"
+return_attributes = ["closeness"]  # Optional
+```
+
+The result is compact JSON keyed by source and then target node ID, listing the pairs that are
+not connected. With an edge type allowing several edges between the same nodes, each pair maps
+to a list of attribute sets:
+```json
+{"edges":{"Alice":{"Mike":{"closeness":2.5}}},"missing":[["Alice","Zoe"]]}
+```
+""",
+        inputSchema=GetEdgesDataToolInput.model_json_schema(),
+    )
+]
+
+
+async def get_edges_data(
+    graph_name: str,
+    edges: List[Tuple[str | int, str | int]],
+    src_node_type: Optional[str] = None,
+    edge_type: Optional[str] = None,
+    tgt_node_type: Optional[str] = None,
+    return_attributes: Optional[List[str]] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        src_node_type, edge_type, tgt_node_type, multi_edge = resolve_edge_type(
+            graph, src_node_type, edge_type, tgt_node_type
+        )
+        if return_attributes is not None:
+            attributes = graph.get_schema("dict")["edges"][edge_type]["attributes"]
+            unknown = [attr for attr in return_attributes if attr not in attributes]
+            if unknown:
+                raise ValueError(
+                    f"Unknown attribute(s) of edge type '{edge_type}': {', '.join(unknown)}."
+                )
+        requested = list(dict.fromkeys((str(src), str(tgt)) for src, tgt in edges))
+        found: Dict[Pair, List[Dict[str, Any]]] = {}
+        chunk_size = get_config().lookup_chunk_size
+        for start in range(0, len(requested), chunk_size):
+            chunk = requested[start : start + chunk_size]
+            for pair, attributes in _fetch_edges(
+                graph_name, src_node_type, edge_type, tgt_node_type, chunk
+            ):
+                if return_attributes is not None:
+                    attributes = {attr: attributes.get(attr) for attr in return_attributes}
+                found.setdefault(pair, []).append(attributes)
+        result: Dict[str, Any] = {"edges": {}, "missing": []}
+        for src, tgt in requested:
+            if (src, tgt) not in found:
+                result["missing"].append([src, tgt])
+                continue
+            values = found[(src, tgt)]
+            result["edges"].setdefault(src, {})[tgt] = values if multi_edge else values[0]
+        message = dumps(result)
+    except Exception as e:
+        message = f"❌ Failed to retrieve edge data in graph '{graph_name}': {str(e)}"
+
+    return [TextContent(type="text", text=message)]
+
+
+def _fetch_edges(
+    graph_name: str,
+    src_node_type: str,
+    edge_type: str,
+    tgt_node_type: str,
+    pairs: List[Pair],
+) -> List[Tuple[Pair, Dict[str, Any]]]:
+    # One traversal from all requested sources to all requested targets; it may find pairs
+    # that were not asked for, which are filtered out below.
+    gsql = f"""
+INTERPRET QUERY(SET<STRING> src_ids, SET<STRING> tgt_ids) FOR GRAPH {graph_name} {{
+  OrAccum @requested;
+  ListAccum<EDGE> @@edges;
+  Targets = to_vertex_set(tgt_ids, "{tgt_node_type}");
+  Targets = SELECT t FROM Targets:t POST-ACCUM t.@requested = TRUE;
+  Sources = to_vertex_set(src_ids, "{src_node_type}");
+  Sources =
+    SELECT s
+    FROM Sources:s -({edge_type}:e)- {tgt_node_type}:t
+    WHERE t.@requested
+    ACCUM @@edges += e;
+  PRINT @@edges;
+}}""".strip()
+    params = {
+        "src_ids": list({src for src, _ in pairs}),
+        "tgt_ids": list({tgt for _, tgt in pairs}),
+    }
+    result = get_api().run_interpreted_query(gsql, params)
+    wanted = set(pairs)
+    matches = []
+    seen = set()
+    for edge in result[0].get("@@edges", []) if result else []:
+        # An undirected edge between two requested nodes is reached from both of them, and
+        # answers for both directions.
+        key = dumps(edge)
+        if key in seen:
+            continue
+        seen.add(key)
+        src, tgt = str(edge["from_id"]), str(edge["to_id"])
+        directions = [(src, tgt)] if edge.get("directed", True) else [(src, tgt), (tgt, src)]
+        for pair in directions:
+            if pair in wanted:
+                matches.append((pair, edge.get("attributes", {})))
+    return matches
@@ -10,9 +10,8 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class HasEdgeToolInput(BaseModel):
@@ -62,7 +61,7 @@ async def has_edge(
     tgt_node_type: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         exists = graph.has_edge(
             src_node_id,
             tgt_node_id,
@@ -0,0 +1,132 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import List, Optional, Set, Tuple
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_edge_type
+from tigergraph_mcp.tools.membership_cache import get_membership_cache
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+
+
+class HasEdgesToolInput(BaseModel):
+    """Input schema for checking the existence of many edges in a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph to check for the edges.")
+    edges: List[Tuple[str | int, str | int]] = Field(
+        ...,
+        min_length=1,
+        description="The edges to check, as [source node ID, target node ID] pairs.",
+    )
+    src_node_type: Optional[str] = Field(
+        None, description="The type of the source nodes (optional)."
+    )
+    edge_type: Optional[str] = Field(None, description="The type of the edges (optional).")
+    tgt_node_type: Optional[str] = Field(
+        None, description="The type of the target nodes (optional)."
+    )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.HAS_EDGES,
+        description="""Checks which of many edges exist in a TigerGraph graph.
+
+Use this instead of calling `graph__has_edge` once per edge: the edges are checked in a few
+set-based requests, and edges already known to exist are answered from a cache.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+edges = [["Alice", "Mike"], ["Alice", "Zoe"]]
+src_node_type = "Person"
+edge_type = "Friendship"
+tgt_node_type = "Person"
+```
+
+The response lists the existing and the missing edges.
+""",
+        inputSchema=HasEdgesToolInput.model_json_schema(),
+    )
+]
+
+
+async def has_edges(
+    graph_name: str,
+    edges: List[Tuple[str | int, str | int]],
+    src_node_type: Optional[str] = None,
+    edge_type: Optional[str] = None,
+    tgt_node_type: Optional[str] = None,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        src_node_type, edge_type, tgt_node_type, _ = resolve_edge_type(
+            graph, src_node_type, edge_type, tgt_node_type
+        )
+        requested = list(dict.fromkeys((str(src), str(tgt)) for src, tgt in edges))
+        cache = get_membership_cache()
+        key = ("edge", src_node_type, edge_type, tgt_node_type)
+        found, unknown = cache.partition(graph_name, key, requested)
+        chunk_size = get_config().lookup_chunk_size
+        for start in range(0, len(unknown), chunk_size):
+            chunk = unknown[start : start + chunk_size]
+            existing = _existing_edges(graph_name, src_node_type, edge_type, tgt_node_type, chunk)
+            cache.add(graph_name, key, existing)
+            found |= existing
+        existing = [list(edge) for edge in requested if edge in found]
+        missing = [list(edge) for edge in requested if edge not in found]
+        if use_json(output_format):
+            message = dumps({"existing": existing, "missing": missing})
+        else:
+            message = (
+                f"✅ {len(existing)} of {len(requested)} edge(s) of type '{edge_type}' exist "
+                f"in graph '{graph_name}'.\nExisting: {existing}\nMissing: {missing}"
+            )
+    except Exception as e:
+        message = f"❌ Failed to check edge existence in graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+def _existing_edges(
+    graph_name: str,
+    src_node_type: str,
+    edge_type: str,
+    tgt_node_type: str,
+    edges: List[Tuple[str, str]],
+) -> Set[Tuple[str, str]]:
+    # One traversal from all requested sources to all requested targets; it may find pairs
+    # that were not asked for, which are filtered out below.
+    gsql = f"""
+INTERPRET QUERY(SET<STRING> src_ids, SET<STRING> tgt_ids) FOR GRAPH {graph_name} {{
+  OrAccum @requested;
+  MapAccum<VERTEX, SetAccum<VERTEX>> @@existing;
+  Targets = to_vertex_set(tgt_ids, "{tgt_node_type}");
+  Targets = SELECT t FROM Targets:t POST-ACCUM t.@requested = TRUE;
+  Sources = to_vertex_set(src_ids, "{src_node_type}");
+  Sources =
+    SELECT s
+    FROM Sources:s -({edge_type}:e)- {tgt_node_type}:t
+    WHERE t.@requested
+    ACCUM @@existing += (s -> t);
+  PRINT @@existing;
+}}""".strip()
+    params = {
+        "src_ids": list({src for src, _ in edges}),
+        "tgt_ids": list({tgt for _, tgt in edges}),
+    }
+    result = get_api().run_interpreted_query(gsql, params)
+    targets_by_source = result[0].get("@@existing", {}) if result else {}
+    found = {(str(src), str(tgt)) for src, targets in targets_by_source.items() for tgt in targets}
+    return found & set(edges)
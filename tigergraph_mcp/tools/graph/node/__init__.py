@@ -8,8 +8,11 @@
 from .add_node_tool import add_node
 from .add_nodes_tool import add_nodes
 from .remove_node_tool import remove_node
+from .remove_nodes_tool import remove_nodes
 from .has_node_tool import has_node
+from .has_nodes_tool import has_nodes
 from .get_node_data_tool import get_node_data
+from .get_nodes_data_tool import get_nodes_data
 from .get_node_edges_tool import get_node_edges
 from .clear_graph_data_tool import clear_graph_data
 
@@ -18,9 +21,11 @@ __all__ = [
     "add_node",
     "add_nodes",
     "remove_node",
+    "remove_nodes",
     "has_node",
+    "has_nodes",
     "get_node_data",
-    "has_node",
+    "get_nodes_data",
     "get_node_edges",
     "clear_graph_data",
 ]
@@ -10,9 +10,10 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import record_nodes_added
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
 
 
 class AddNodeToolInput(BaseModel):
@@ -52,8 +53,9 @@ async def add_node(
 ) -> List[TextContent]:
     try:
         attributes = attributes or {}
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         graph.add_node(node_id, node_type, **attributes)
+        record_nodes_added(graph_name, resolve_node_type(graph, node_type), 1)
         message = (
             f"✅ Node '{node_id}' (Type: {node_type or 'default'}) "
             f"added successfully to graph '{graph_name}'."
@@ -10,24 +10,40 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.columnar import (
+    ARROW_IPC_DESCRIPTION,
+    Column,
+    add_nodes_columnar,
+    columns_description,
+)
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import (
+    encode_attributes,
+    resolve_node_type,
+    upsert_nodes,
+)
 
 
 class AddNodesToolInput(BaseModel):
     """Input schema for adding multiple nodes to a graph."""
 
     graph_name: str = Field(..., description="The name of the graph where the nodes will be added.")
-    nodes_for_adding: List[str | int] | List[List] = Field(
-        ...,
-        description="A list of node IDs or [node ID, attribute dict] pairs to be added.",
+    nodes_for_adding: Optional[List[str | int] | List[List]] = Field(
+        None,
+        description="A list of node IDs or [node ID, attribute dict] pairs to be added. "
+        "Required unless `columns` or `arrow_ipc` is given.",
     )
     node_type: Optional[str] = Field(None, description="The type of the nodes (optional).")
     common_attributes: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
         description="Attributes applied to all nodes in the list.",
     )
+    columns: Optional[Dict[str, Column]] = Field(
+        None,
+        description=columns_description("The node IDs go in the `node_id` column."),
+    )
+    arrow_ipc: Optional[str] = Field(None, description=ARROW_IPC_DESCRIPTION)
 
 
 tools = [
@@ -35,6 +51,9 @@ tools = [
         name=TigerGraphToolName.ADD_NODES,
         description="""Adds multiple nodes to a TigerGraph graph using TigerGraphX.
 
+Large lists are split into several upsert requests sent in parallel. The response reports how
+many nodes were accepted and how many were skipped by TigerGraph.
+
 Example input:
 ```python
 {
@@ -47,6 +66,19 @@ Example input:
   "common_attributes": {"city": "New York"},
 }
 ```
+
+Columnar input, for large numbers of nodes:
+```python
+{
+  "graph_name": "SocialGraph",
+  "columns": {
+    "node_id": ["Alice", "Mike"],
+    "age": [30, 29],
+    "gender": ["Female", "Male"]
+  },
+  "node_type": "Person"
+}
+```
 """,
         inputSchema=AddNodesToolInput.model_json_schema(),
     )
@@ -55,39 +87,59 @@ Example input:
 
 async def add_nodes(
     graph_name: str,
-    nodes_for_adding: List[str | int] | List[List | Tuple[str | int, Dict[str, Any]]],
+    nodes_for_adding: Optional[
+        List[str | int] | List[List | Tuple[str | int, Dict[str, Any]]]
+    ] = None,
     node_type: Optional[str] = None,
     common_attributes: Optional[Dict[str, Any]] = None,
+    columns: Optional[Dict[str, Column]] = None,
+    arrow_ipc: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        # Normalize the nodes_for_adding list to ensure each item is a (node_id, attributes_dict)
-        # tuple. This is necessary because JSON doesn't distinguish between lists and tuples —
-        # any tuple (e.g., ("User_A", {"age": 25})) sent by the client will arrive as a list
-        # (["User_A", {"age": 25}]). To handle this gracefully, we treat any 2-element list or
-        # tuple where the second item is a dict as a valid node+attribute pair, and any
-        # string/int as a bare node ID with no attributes.
-        normalized_nodes = []
-        for item in nodes_for_adding:
-            if isinstance(item, (str, int)):
-                normalized_nodes.append((item, {}))
-            elif isinstance(item, (list, tuple)) and len(item) == 2:
-                node_id, attributes = item
-                if not isinstance(attributes, dict):
-                    raise ValueError("Each node's attributes must be a dictionary.")
-                normalized_nodes.append((node_id, attributes))
-            else:
-                raise ValueError(
-                    "Each item in nodes_for_adding must be a node ID or [node ID, attribute dict]."
-                )
-        graph = Graph.from_db(graph_name)
-        count = graph.add_nodes_from(normalized_nodes, node_type, **(common_attributes or {}))
-        if count:
-            message = (
-                f"✅ Successfully added {str(count)} nodes of type"
-                f"'{node_type or 'default'}' to graph '{graph_name}'."
+        if (nodes_for_adding is None) == (columns is None and arrow_ipc is None):
+            raise ValueError(
+                "Provide either `nodes_for_adding`, or columnar input in `columns` or `arrow_ipc`."
             )
+        graph = get_graph(graph_name)
+        node_type = resolve_node_type(graph, node_type)
+        if nodes_for_adding is None:
+            result = add_nodes_columnar(graph, node_type, columns, arrow_ipc, common_attributes)
         else:
-            message = f"❌ Failed to add nodes to graph '{graph_name}'"
+            common = common_attributes or {}
+            rows = (
+                (str(node_id), encode_attributes(common, attributes))
+                for node_id, attributes in _normalize_nodes(nodes_for_adding)
+            )
+            result = upsert_nodes(graph, node_type, rows)
+        message = result.message(
+            lambda count: f"added {count} nodes of type '{node_type}' to graph '{graph_name}'",
+            f"add nodes to graph '{graph_name}'",
+        )
     except Exception as e:
         message = f"❌ Failed to add nodes to graph '{graph_name}': {str(e)}"
     return [TextContent(type="text", text=message)]
+
+
+def _normalize_nodes(
+    nodes_for_adding: List[str | int] | List[List | Tuple[str | int, Dict[str, Any]]],
+) -> List[Tuple[str | int, Dict[str, Any]]]:
+    # Normalize the nodes_for_adding list to ensure each item is a (node_id, attributes_dict)
+    # tuple. This is necessary because JSON doesn't distinguish between lists and tuples —
+    # any tuple (e.g., ("User_A", {"age": 25})) sent by the client will arrive as a list
+    # (["User_A", {"age": 25}]). To handle this gracefully, we treat any 2-element list or
+    # tuple where the second item is a dict as a valid node+attribute pair, and any
+    # string/int as a bare node ID with no attributes.
+    normalized_nodes = []
+    for item in nodes_for_adding:
+        if isinstance(item, (str, int)):
+            normalized_nodes.append((item, {}))
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            node_id, attributes = item
+            if not isinstance(attributes, dict):
+                raise ValueError("Each node's attributes must be a dictionary.")
+            normalized_nodes.append((node_id, attributes))
+        else:
+            raise ValueError(
+                "Each item in nodes_for_adding must be a node ID or [node ID, attribute dict]."
+            )
+    return normalized_nodes
@@ -10,8 +10,10 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import get_count_cache
+from tigergraph_mcp.tools.graph_cache import get_graph, invalidate_graph
+from tigergraph_mcp.tools.membership_cache import invalidate_membership
 
 
 class ClearGraphDataToolInput(BaseModel):
@@ -41,11 +43,15 @@ async def clear_graph_data(
     graph_name: str,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         result = graph.clear()
+        invalidate_graph(graph_name)
+        invalidate_membership(graph_name)
         if result:
+            get_count_cache().reset(graph_name)
             message = f"\u2705 All data cleared from graph '{graph_name}' successfully."
         else:
+            get_count_cache().invalidate(graph_name)
             message = f"\u274c Failed to clear data from graph '{graph_name}'."
     except Exception as e:
         message = f"\u274c Failed to clear data from graph '{graph_name}': {str(e)}"
@@ -5,13 +5,16 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.result_budget import ResultBudget
+
+EDGE_FIELDS = ("from_id", "to_id", "discriminator")
 
 
 class GetNodeEdgesToolInput(BaseModel):
@@ -39,6 +42,10 @@ node_id = "Alice"
 node_type = "Person"  # Optional
 edge_types = ["Friendship", "Colleague"]  # Optional filter
 ```
+
+Notes:
+- Results over the server's response budget are truncated and summarized. All edges of the
+  node are still read from TigerGraph first.
 """,
         inputSchema=GetNodeEdgesToolInput.model_json_schema(),
     )
@@ -52,8 +59,9 @@ async def get_node_edges(
     edge_types: Optional[str | List[str]] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        edges = graph.get_node_edges(node_id, node_type, edge_types)
+        graph = get_graph(graph_name)
+        budget = ResultBudget.from_config(fields=_edge_fields)
+        edges = budget.take(graph.get_node_edges(node_id, node_type, edge_types))
 
         if not edges:
             message = (
@@ -61,10 +69,17 @@ async def get_node_edges(
                 f"in graph '{graph_name}'."
             )
         else:
-            message = f"✅ Edges connected to node '{node_id}' in graph '{graph_name}': {edges}"
+            message = (
+                f"✅ Edges connected to node '{node_id}' in graph '{graph_name}': {edges}"
+                + budget.note()
+            )
     except Exception as e:
         message = (
             f"❌ Failed to retrieve edges for node '{node_id}' in graph '{graph_name}': {str(e)}"
         )
 
     return [TextContent(type="text", text=message)]
+
+
+def _edge_fields(edge: Tuple) -> Dict[str, Any]:
+    return dict(zip(EDGE_FIELDS, edge))
@@ -0,0 +1,118 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+from tigergraph_mcp.tools.output import dumps
+
+
+class GetNodesDataToolInput(BaseModel):
+    """Input schema for retrieving the data of many nodes from a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph containing the nodes.")
+    node_ids: List[str | int] = Field(
+        ..., min_length=1, description="The identifiers of the nodes to retrieve data for."
+    )
+    node_type: Optional[str] = Field(None, description="The type of the nodes (optional).")
+    return_attributes: Optional[List[str]] = Field(
+        None, description="The attributes to return. All attributes are returned if omitted."
+    )
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.GET_NODES_DATA,
+        description="""Retrieves the attributes of many nodes of a TigerGraph graph in one call.
+
+Use this instead of calling `graph__get_node_data` once per node, e.g. to enrich a list of
+search results.
+
+Example Input:
+```python
+graph_name = "SocialGraph"
+node_ids = ["Alice", "Mike", "Zoe"]
+node_type = "Person"  # Optional
+return_attributes = ["age"]  # Optional
+```
+
+The result is compact JSON keyed by node ID, listing the IDs that were not found:
+```json
+{"nodes":{"Alice":{"age":30},"Mike":{"age":29}},"missing":["Zoe"]}
+```
+""",
+        inputSchema=GetNodesDataToolInput.model_json_schema(),
+    )
+]
+
+
+async def get_nodes_data(
+    graph_name: str,
+    node_ids: List[str | int],
+    node_type: Optional[str] = None,
+    return_attributes: Optional[List[str]] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        node_type = resolve_node_type(graph, node_type)
+        if return_attributes is not None:
+            attributes = graph.get_schema("dict")["nodes"][node_type]["attributes"]
+            unknown = [attr for attr in return_attributes if attr not in attributes]
+            if unknown:
+                raise ValueError(
+                    f"Unknown attribute(s) of node type '{node_type}': {', '.join(unknown)}."
+                )
+        requested = list(dict.fromkeys(str(node_id) for node_id in node_ids))
+        nodes: Dict[str, Dict[str, Any]] = {}
+        chunk_size = get_config().lookup_chunk_size
+        for start in range(0, len(requested), chunk_size):
+            chunk = requested[start : start + chunk_size]
+            nodes.update(_fetch_nodes(graph_name, node_type, return_attributes, chunk))
+        result = {
+            "nodes": {node_id: nodes[node_id] for node_id in requested if node_id in nodes},
+            "missing": [node_id for node_id in requested if node_id not in nodes],
+        }
+        message = dumps(result)
+    except Exception as e:
+        message = f"❌ Failed to retrieve node data in graph '{graph_name}': {str(e)}"
+
+    return [TextContent(type="text", text=message)]
+
+
+def _fetch_nodes(
+    graph_name: str,
+    node_type: str,
+    return_attributes: Optional[List[str]],
+    node_ids: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    if return_attributes:
+        projections = ", ".join(f"Nodes.{attr} AS {attr}" for attr in return_attributes)
+        print_statement = f"PRINT Nodes[{projections}];"
+    else:
+        print_statement = "PRINT Nodes;"
+    # to_vertex_set() silently drops the IDs that do not exist.
+    gsql = f"""
+INTERPRET QUERY(SET<STRING> node_ids) FOR GRAPH {graph_name} {{
+  Nodes = to_vertex_set(node_ids, "{node_type}");
+  {print_statement}
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {"node_ids": node_ids})
+    vertices = result[0].get("Nodes", []) if result else []
+    nodes = {}
+    for vertex in vertices:
+        attributes = vertex.get("attributes", {})
+        if return_attributes is not None:
+            attributes = {attr: attributes.get(attr) for attr in return_attributes}
+        nodes[str(vertex["v_id"])] = attributes
+    return nodes
@@ -10,9 +10,8 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class HasNodeToolInput(BaseModel):
@@ -46,7 +45,7 @@ async def has_node(
     node_type: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         exists = graph.has_node(node_id, node_type)
         message = (
             f"✅ Node '{node_id}' of type '{node_type or 'default'}' exists "
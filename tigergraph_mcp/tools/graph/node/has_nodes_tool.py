@@ -0,0 +1,97 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import List, Optional, Set
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+from tigergraph_mcp.tools.membership_cache import get_membership_cache
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+
+
+class HasNodesToolInput(BaseModel):
+    """Input schema for checking the existence of many nodes in a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph where the nodes exist.")
+    node_ids: List[str | int] = Field(
+        ..., min_length=1, description="The identifiers of the nodes to check."
+    )
+    node_type: Optional[str] = Field(None, description="The type of the nodes (optional).")
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.HAS_NODES,
+        description="""Checks which of many nodes exist in a TigerGraph graph.
+
+Use this instead of calling `graph__has_node` once per node: the IDs are checked in a few
+set-based requests, and nodes already known to exist are answered from a cache.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+node_ids = ["Alice", "Mike", "Zoe"]
+node_type = "Person"  # Optional
+```
+
+The response lists the existing and the missing node IDs.
+""",
+        inputSchema=HasNodesToolInput.model_json_schema(),
+    )
+]
+
+
+async def has_nodes(
+    graph_name: str,
+    node_ids: List[str | int],
+    node_type: Optional[str] = None,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        node_type = resolve_node_type(graph, node_type)
+        requested = list(dict.fromkeys(str(node_id) for node_id in node_ids))
+        cache = get_membership_cache()
+        key = ("node", node_type)
+        found, unknown = cache.partition(graph_name, key, requested)
+        chunk_size = get_config().lookup_chunk_size
+        for start in range(0, len(unknown), chunk_size):
+            existing = _existing_nodes(graph_name, node_type, unknown[start : start + chunk_size])
+            cache.add(graph_name, key, existing)
+            found |= existing
+        existing = [node_id for node_id in requested if node_id in found]
+        missing = [node_id for node_id in requested if node_id not in found]
+        if use_json(output_format):
+            message = dumps({"existing": existing, "missing": missing})
+        else:
+            message = (
+                f"✅ {len(existing)} of {len(requested)} node(s) of type '{node_type}' exist "
+                f"in graph '{graph_name}'.\nExisting: {existing}\nMissing: {missing}"
+            )
+    except Exception as e:
+        message = f"❌ Failed to check node existence in graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+def _existing_nodes(graph_name: str, node_type: str, node_ids: List[str]) -> Set[str]:
+    # to_vertex_set() silently drops the IDs that do not exist.
+    gsql = f"""
+INTERPRET QUERY(SET<STRING> node_ids) FOR GRAPH {graph_name} {{
+  SetAccum<VERTEX> @@existing;
+  Nodes = to_vertex_set(node_ids, "{node_type}");
+  Nodes = SELECT s FROM Nodes:s POST-ACCUM @@existing += s;
+  PRINT @@existing;
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {"node_ids": node_ids})
+    return {str(node_id) for node_id in result[0].get("@@existing", [])} if result else set()
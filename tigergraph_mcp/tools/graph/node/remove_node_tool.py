@@ -10,9 +10,11 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import record_nodes_removed
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+from tigergraph_mcp.tools.membership_cache import get_membership_cache
 
 
 class RemoveNodeToolInput(BaseModel):
@@ -48,9 +50,12 @@ async def remove_node(
     node_type: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         success = graph.remove_node(node_id, node_type)
+        node_type_name = resolve_node_type(graph, node_type)
+        get_membership_cache().discard_node(graph_name, node_type_name, str(node_id))
         if success:
+            record_nodes_removed(graph_name, node_type_name, 1)
             message = (
                 f"✅ Node '{node_id}' of type '{node_type or 'default'}' removed "
                 f"successfully from graph '{graph_name}'."
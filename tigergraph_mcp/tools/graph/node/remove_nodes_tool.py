@@ -0,0 +1,214 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import contextvars
+import math
+from typing import Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.executor import raise_if_cancelled
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.count_cache import invalidate_counts, record_nodes_removed
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import get_upsert_pool, resolve_node_type
+from tigergraph_mcp.tools.membership_cache import get_membership_cache
+
+
+class NodeRemoval(BaseModel):
+    """The nodes of one type to remove, given by ID or selected by a filter."""
+
+    node_type: Optional[str] = Field(None, description="The type of the nodes (optional).")
+    node_ids: Optional[List[str | int]] = Field(
+        None, description="The identifiers of the nodes to remove."
+    )
+    filter_expression: Optional[str] = Field(
+        None,
+        description="A condition selecting the nodes to remove, referring to each node as `s`, "
+        'e.g. "s.age < 18".',
+    )
+
+
+class RemoveNodesToolInput(BaseModel):
+    """Input schema for removing many nodes from a TigerGraph graph."""
+
+    graph_name: str = Field(
+        ..., description="The name of the graph from which the nodes will be removed."
+    )
+    removals: List[NodeRemoval] = Field(
+        ...,
+        min_length=1,
+        description="The nodes to remove. Each entry gives either `node_ids` or a "
+        "`filter_expression` for one node type.",
+    )
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.REMOVE_NODES,
+        description="""Removes many nodes, along with their edges, from a TigerGraph graph.
+
+Use this instead of calling `graph__remove_node` once per node, e.g. to clean up after a bad load.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+removals = [
+    {"node_type": "Person", "node_ids": ["Alice", "Mike"]},
+    {"node_type": "Post", "filter_expression": "s.spam_score > 0.9"},
+]
+```
+
+Notes:
+- Each entry gives either `node_ids` or a `filter_expression`, in which the node is `s`.
+- The nodes are deleted in batches; different node types are processed in parallel.
+- Returns the number of nodes removed per type.
+""",
+        inputSchema=RemoveNodesToolInput.model_json_schema(),
+    )
+]
+
+
+async def remove_nodes(
+    graph_name: str,
+    removals: List[NodeRemoval],
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        by_type: Dict[str, List[NodeRemoval]] = {}
+        for removal in removals:
+            removal = NodeRemoval.model_validate(removal)
+            if (removal.node_ids is None) == (removal.filter_expression is None):
+                raise ValueError(
+                    "Each removal must give either `node_ids` or a `filter_expression`."
+                )
+            by_type.setdefault(resolve_node_type(graph, removal.node_type), []).append(removal)
+
+        # Types are removed in parallel, the batches of one type one after the other.
+        pool = get_upsert_pool()
+        futures = {
+            node_type: pool.submit(
+                contextvars.copy_context().run, _remove_type, graph_name, node_type, type_removals
+            )
+            for node_type, type_removals in by_type.items()
+        }
+        removed: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        try:
+            for node_type, future in futures.items():
+                try:
+                    removed[node_type] = future.result()
+                except Exception as e:
+                    errors[node_type] = str(e)
+        except asyncio.CancelledError:
+            # Part of the nodes may have been removed.
+            invalidate_counts(graph_name)
+            for node_type in by_type:
+                get_membership_cache().discard_nodes(graph_name, node_type)
+            raise
+
+        # The caches are updated once all batches are done, including for failed types, which
+        # may have been partially removed.
+        for node_type, count in removed.items():
+            record_nodes_removed(graph_name, node_type, count)
+        if errors:
+            invalidate_counts(graph_name)
+        cache = get_membership_cache()
+        for node_type, type_removals in by_type.items():
+            if any(removal.filter_expression is not None for removal in type_removals):
+                cache.discard_nodes(graph_name, node_type)
+            else:
+                cache.discard_nodes(
+                    graph_name,
+                    node_type,
+                    [str(node_id) for removal in type_removals for node_id in removal.node_ids],
+                )
+
+        counts = ", ".join(f"{node_type}: {count}" for node_type, count in removed.items())
+        failures = "; ".join(f"type '{node_type}': {error}" for node_type, error in errors.items())
+        if not errors:
+            message = (
+                f"✅ Removed {sum(removed.values())} node(s) from graph '{graph_name}' ({counts})."
+            )
+        elif removed:
+            message = (
+                f"⚠️ Partially removed nodes from graph '{graph_name}': "
+                f"{sum(removed.values())} node(s) removed ({counts}). Failed for {failures}."
+            )
+        else:
+            message = f"❌ Failed to remove nodes from graph '{graph_name}': {failures}"
+    except Exception as e:
+        message = f"❌ Failed to remove nodes from graph '{graph_name}': {str(e)}"
+
+    return [TextContent(type="text", text=message)]
+
+
+def _remove_type(graph_name: str, node_type: str, removals: List[NodeRemoval]) -> int:
+    config = get_config()
+    removed = 0
+    for removal in removals:
+        if removal.node_ids is not None:
+            node_ids = list(dict.fromkeys(str(node_id) for node_id in removal.node_ids))
+            for start in range(0, len(node_ids), config.lookup_chunk_size):
+                raise_if_cancelled()
+                chunk = node_ids[start : start + config.lookup_chunk_size]
+                removed += _delete_ids(graph_name, node_type, chunk)
+        else:
+            # Each batch removes the first matches, until fewer than a full batch are left. The
+            # number of batches is capped by the matches counted beforehand, so that matches the
+            # DELETE leaves in place cannot keep the loop going.
+            matches = _count_matching(graph_name, node_type, removal.filter_expression)
+            deleted = 0
+            for _ in range(math.ceil(matches / config.delete_chunk_size)):
+                raise_if_cancelled()
+                count = _delete_matching(
+                    graph_name, node_type, removal.filter_expression, config.delete_chunk_size
+                )
+                deleted += count
+                if count < config.delete_chunk_size:
+                    break
+            removed += min(deleted, matches)
+    return removed
+
+
+def _delete_ids(graph_name: str, node_type: str, node_ids: List[str]) -> int:
+    # to_vertex_set() silently drops the IDs that do not exist, so only existing nodes count.
+    gsql = f"""
+INTERPRET QUERY(SET<STRING> node_ids) FOR GRAPH {graph_name} {{
+  Nodes = to_vertex_set(node_ids, "{node_type}");
+  PRINT Nodes.size() AS removed;
+  DELETE s FROM Nodes:s;
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {"node_ids": node_ids})
+    return result[0].get("removed", 0) if result else 0
+
+
+def _count_matching(graph_name: str, node_type: str, filter_expression: str) -> int:
+    gsql = f"""
+INTERPRET QUERY() FOR GRAPH {graph_name} {{
+  Nodes = {{{node_type}.*}};
+  Nodes = SELECT s FROM Nodes:s WHERE {filter_expression};
+  PRINT Nodes.size() AS matches;
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {})
+    return result[0].get("matches", 0) if result else 0
+
+
+def _delete_matching(graph_name: str, node_type: str, filter_expression: str, limit: int) -> int:
+    gsql = f"""
+INTERPRET QUERY(INT batch_size) FOR GRAPH {graph_name} {{
+  Nodes = {{{node_type}.*}};
+  Nodes = SELECT s FROM Nodes:s WHERE {filter_expression} LIMIT batch_size;
+  PRINT Nodes.size() AS removed;
+  DELETE s FROM Nodes:s;
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {"batch_size": limit})
+    return result[0].get("removed", 0) if result else 0
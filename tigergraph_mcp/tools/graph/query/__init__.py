@@ -11,6 +11,9 @@ from .drop_query_tool import drop_query
 from .run_query_tool import run_query
 from .is_query_installed_tool import is_query_installed
 from .get_nodes_tool import get_nodes
+from .aggregate_nodes_tool import aggregate_nodes
+from .top_k_nodes_tool import top_k_nodes
+from .top_k_edges_tool import top_k_edges
 from .get_neighbors_tool import get_neighbors
 from .breadth_first_search_tool import breadth_first_search
 
@@ -21,6 +24,9 @@ __all__ = [
     "run_query",
     "is_query_installed",
     "get_nodes",
+    "aggregate_nodes",
+    "top_k_nodes",
+    "top_k_edges",
     "get_neighbors",
     "breadth_first_search",
 ]
@@ -0,0 +1,215 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+from tigergraphx import Graph
+
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.query_templates import QueryTemplate, run_template
+from tigergraph_mcp.tools.result_budget import ResultBudget
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+
+NUMERIC_TYPES = {"INT", "UINT", "FLOAT", "DOUBLE"}
+GROUP_BY_TYPES = NUMERIC_TYPES | {"BOOL", "STRING", "DATETIME"}
+
+# The accumulator computing each aggregate function.
+_ACCUMULATORS = {
+    "count": "SumAccum<INT>",
+    "sum": "SumAccum<DOUBLE>",
+    "avg": "AvgAccum",
+    "min": "MinAccum<DOUBLE>",
+    "max": "MaxAccum<DOUBLE>",
+}
+
+
+class Aggregate(BaseModel):
+    """One aggregate computed per group."""
+
+    function: Literal["count", "sum", "avg", "min", "max"] = Field(
+        ..., description="The aggregate function."
+    )
+    attribute: Optional[str] = Field(
+        None, description="The numeric attribute to aggregate. Not used by `count`."
+    )
+    alias: Optional[str] = Field(
+        None,
+        description="The name of the aggregate in the results. Defaults to `count`, or to the "
+        "function and attribute, e.g. `avg_age`.",
+    )
+
+    def name(self) -> str:
+        if self.alias:
+            return self.alias
+        return "count" if self.function == "count" else f"{self.function}_{self.attribute}"
+
+
+class AggregateNodesToolInput(BaseModel):
+    """Input schema for aggregating the nodes of a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph to query.")
+    node_type: Optional[str] = Field(None, description="The type of the nodes to aggregate.")
+    filter_expression: Optional[str] = Field(
+        None,
+        description="A condition selecting the nodes to aggregate, referring to each node as "
+        '`s`, e.g. "s.age >= 18".',
+    )
+    group_by: Optional[List[str]] = Field(
+        None,
+        description="The attributes to group the nodes by. If omitted, all selected nodes form "
+        "a single group.",
+    )
+    aggregates: List[Aggregate] = Field(
+        default_factory=lambda: [Aggregate(function="count")],
+        min_length=1,
+        description="The aggregates to compute per group. Defaults to the number of nodes.",
+    )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.AGGREGATE_NODES,
+        description="""Groups the nodes of a type and computes aggregates per group in TigerGraph.
+
+Use this instead of retrieving nodes with `graph__get_nodes` and counting or summing them
+yourself: only one row per group is returned.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+node_type = "Person"
+filter_expression = "s.age >= 18"
+group_by = ["gender"]
+aggregates = [
+    {"function": "count"},
+    {"function": "avg", "attribute": "age"},
+    {"function": "max", "attribute": "age", "alias": "oldest"},
+]
+```
+
+Notes:
+- Supported functions are `count`, `sum`, `avg`, `min` and `max`; all but `count` take a numeric
+  attribute.
+- Each result row holds the group's `group_by` attribute values and its aggregates.
+- If the server installs generated queries, the query is installed once its shape has been
+  used a few times; calls of the same shape, even with different values in
+  `filter_expression`, then run the installed query.
+""",
+        inputSchema=AggregateNodesToolInput.model_json_schema(),
+    )
+]
+
+
+async def aggregate_nodes(
+    graph_name: str,
+    node_type: Optional[str] = None,
+    filter_expression: Optional[str] = None,
+    group_by: Optional[List[str]] = None,
+    aggregates: Optional[List[Aggregate]] = None,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        node_type = resolve_node_type(graph, node_type)
+        group_by = list(dict.fromkeys(group_by or []))
+        aggregates = [
+            Aggregate.model_validate(aggregate)
+            for aggregate in aggregates or [Aggregate(function="count")]
+        ]
+        template = _aggregate_query(graph, node_type, filter_expression, group_by, aggregates)
+        result = run_template(template)
+        groups = result[0].get("groups", []) if result else []
+
+        rows: List[Dict[str, Any]] = []
+        for group in groups:
+            row = {attr: group.get(f"k{i}") for i, attr in enumerate(group_by)}
+            row.update(
+                {aggregate.name(): group.get(f"a{i}") for i, aggregate in enumerate(aggregates)}
+            )
+            rows.append(row)
+        if not group_by and not rows:
+            # No node matched: the single group is empty.
+            rows = [{a.name(): 0 if a.function == "count" else None for a in aggregates}]
+        rows.sort(key=lambda row: tuple(row[attr] for attr in group_by))
+
+        budget = ResultBudget.from_config()
+        rows = budget.take(rows)
+        if use_json(output_format):
+            message = dumps(budget.wrap(rows))
+        elif not rows:
+            message = f"⚠️ No '{node_type}' nodes matched in graph '{graph_name}'."
+        else:
+            message = (
+                f"📊 Aggregated '{node_type}' nodes of graph '{graph_name}' into "
+                f"{budget.total_rows} group(s):\n"
+                + "\n".join(str(row) for row in rows)
+                + budget.note()
+            )
+    except Exception as e:
+        message = f"❌ Failed to aggregate nodes of graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+def _aggregate_query(
+    graph: Graph,
+    node_type: str,
+    filter_expression: Optional[str],
+    group_by: List[str],
+    aggregates: List[Aggregate],
+) -> QueryTemplate:
+    attributes = graph.get_schema("dict")["nodes"][node_type]["attributes"]
+
+    def data_type(attr: str) -> str:
+        if attr not in attributes:
+            raise ValueError(
+                f"Invalid attribute '{attr}' for node type '{node_type}'. "
+                f"Must be one of {list(attributes)}."
+            )
+        return getattr(attributes[attr]["data_type"], "value", attributes[attr]["data_type"])
+
+    # Without group_by, every node goes to the same group, under a constant key.
+    keys, key_values = ["INT k0"], ["0"]
+    if group_by:
+        keys, key_values = [], []
+        for i, attr in enumerate(group_by):
+            if data_type(attr) not in GROUP_BY_TYPES:
+                raise ValueError(f"Cannot group by attribute '{attr}' of type {data_type(attr)}.")
+            keys.append(f"{data_type(attr)} k{i}")
+            key_values.append(f"s.{attr}")
+
+    values = []
+    for i, aggregate in enumerate(aggregates):
+        if aggregate.function == "count":
+            values.append("1")
+            continue
+        if aggregate.attribute is None:
+            raise ValueError(f"The `{aggregate.function}` aggregate requires an attribute.")
+        if data_type(aggregate.attribute) not in NUMERIC_TYPES:
+            raise ValueError(
+                f"Cannot compute `{aggregate.function}` of non-numeric attribute "
+                f"'{aggregate.attribute}'."
+            )
+        values.append(f"s.{aggregate.attribute}")
+    accumulators = [
+        f"{_ACCUMULATORS[aggregate.function]} a{i}" for i, aggregate in enumerate(aggregates)
+    ]
+
+    def render(where: Optional[str]) -> str:
+        where_clause = f" WHERE {where}" if where else ""
+        return f"""
+  GroupByAccum<{", ".join(keys + accumulators)}> @@groups;
+  Nodes = {{{node_type}.*}};
+  Nodes = SELECT s FROM Nodes:s{where_clause}
+    ACCUM @@groups += ({", ".join(key_values)} -> {", ".join(values)});
+  PRINT @@groups AS groups;"""
+
+    return QueryTemplate.render(graph.name, "aggregate", "", render, filter_expression)
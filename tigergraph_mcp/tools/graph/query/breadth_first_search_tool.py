@@ -10,8 +10,16 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.graph.query.pagination import (
+    CURSOR_DESCRIPTION,
+    PAGE_SIZE_DESCRIPTION,
+    fetch_bfs_page,
+    format_page,
+    is_paginated,
+)
 
 
 class BFSToolInput(BaseModel):
@@ -31,6 +39,9 @@ class BFSToolInput(BaseModel):
     limit: Optional[int] = Field(
         None, description="Maximum number of neighbors to retrieve per hop."
     )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+    page_size: Optional[int] = Field(None, ge=1, description=PAGE_SIZE_DESCRIPTION)
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
 
 
 tools = [
@@ -54,6 +65,9 @@ Notes:
 - Returns all reachable nodes up to the specified depth with a '_bfs_level' indicating distance
   from the start node.
 - Results are returned as a list of dictionaries.
+- For large results, set `page_size` and pass the returned `cursor` to fetch the next page.
+  Each page runs the whole traversal again, so pagination keeps responses small but does not
+  reduce the work; prefer `limit` and `max_hops` to bound it.
 """,
         inputSchema=BFSToolInput.model_json_schema(),
     )
@@ -67,9 +81,23 @@ async def breadth_first_search(
     edge_types: Optional[Union[str, List[str]]] = None,
     max_hops: Optional[int] = None,
     limit: Optional[int] = None,
+    output_format: Optional[OutputFormat] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
+        if is_paginated(page_size, cursor):
+            page = fetch_bfs_page(
+                graph, start_nodes, node_type, edge_types, max_hops, limit, page_size, cursor
+            )
+            message = format_page(
+                page,
+                output_format,
+                "✅ BFS traversal results:",
+                "⚠️ No nodes found during BFS traversal.",
+            )
+            return [TextContent(type="text", text=message)]
         bfs_result = graph.bfs(
             start_nodes=start_nodes,
             node_type=node_type,
@@ -79,7 +107,9 @@ async def breadth_first_search(
             output_type="List",  # Force output as a List
         )
         assert isinstance(bfs_result, list)
-        if not bfs_result:
+        if use_json(output_format):
+            message = dumps(bfs_result)
+        elif not bfs_result:
             message = "⚠️ No nodes found during BFS traversal."
         else:
             message = "✅ BFS traversal results:\n" + "\n".join(
@@ -2,8 +2,8 @@ from typing import List
 from pydantic import BaseModel, Field
 from mcp.types import Tool, TextContent
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class CreateQueryToolInput(BaseModel):
@@ -48,7 +48,7 @@ Notes:
 
 async def create_query(graph_name: str, gsql_query: str) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         success = graph.create_query(gsql_query)
         if success:
             message = f"✅ GSQL query successfully created on graph '{graph_name}'."
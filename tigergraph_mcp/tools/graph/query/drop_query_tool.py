@@ -2,8 +2,8 @@ from typing import List
 from pydantic import BaseModel, Field
 from mcp.types import Tool, TextContent
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class DropQueryToolInput(BaseModel):
@@ -41,7 +41,7 @@ async def drop_query(
     query_name: str,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         success = graph.drop_query(query_name)
         if success:
             message = f"✅ Query '{query_name}' was successfully dropped from graph '{graph_name}'."
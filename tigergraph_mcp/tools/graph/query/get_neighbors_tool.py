@@ -10,8 +10,17 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.graph.query.pagination import (
+    CURSOR_DESCRIPTION,
+    PAGE_SIZE_DESCRIPTION,
+    fetch_neighbors_page,
+    format_page,
+    is_paginated,
+)
+from tigergraph_mcp.tools.graph.query.query_shapes import fetch_neighbors
 
 
 class GetNeighborsToolInput(BaseModel):
@@ -47,6 +56,9 @@ class GetNeighborsToolInput(BaseModel):
         "If omitted, returns all attributes.",
     )
     limit: Optional[int] = Field(None, description="Maximum number of neighbors to retrieve.")
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+    page_size: Optional[int] = Field(None, ge=1, description=PAGE_SIZE_DESCRIPTION)
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
 
 
 tools = [
@@ -72,6 +84,7 @@ Notes:
 - Filter neighbors using edge or node attributes via `filter_expression`.
 - If `return_attributes` is specified, only those attributes will be included in the results.
 - Results are always returned as a list of dictionaries.
+- For large results, set `page_size` and pass the returned `cursor` to fetch the next page.
 """,
         inputSchema=GetNeighborsToolInput.model_json_schema(),
     )
@@ -90,24 +103,48 @@ async def get_neighbors(
     filter_expression: Optional[str] = None,
     return_attributes: Optional[List[str]] = None,
     limit: Optional[int] = None,
+    output_format: Optional[OutputFormat] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        neighbors = graph.get_neighbors(
-            start_nodes=start_nodes,
-            start_node_type=start_node_type,
-            start_node_alias=start_node_alias,
-            edge_types=edge_types,
-            edge_alias=edge_alias,
-            target_node_types=target_node_types,
-            target_node_alias=target_node_alias,
-            filter_expression=filter_expression,
-            return_attributes=return_attributes,
-            limit=limit,
-            output_type="List",  # Ensure consistent return format
+        graph = get_graph(graph_name)
+        if is_paginated(page_size, cursor):
+            page = fetch_neighbors_page(
+                graph,
+                start_nodes,
+                start_node_type,
+                start_node_alias,
+                edge_types,
+                edge_alias,
+                target_node_types,
+                target_node_alias,
+                filter_expression,
+                return_attributes,
+                limit,
+                page_size,
+                cursor,
+            )
+            message = format_page(
+                page, output_format, "✅ Retrieved neighbors:", "⚠️ No neighbors found."
+            )
+            return [TextContent(type="text", text=message)]
+        neighbors = fetch_neighbors(
+            graph,
+            start_nodes,
+            start_node_type,
+            start_node_alias,
+            edge_types,
+            edge_alias,
+            target_node_types,
+            target_node_alias,
+            filter_expression,
+            return_attributes,
+            limit,
         )
-        assert isinstance(neighbors, list)
-        if not neighbors:
+        if use_json(output_format):
+            message = dumps(neighbors)
+        elif not neighbors:
             message = "⚠️ No neighbors found."
         else:
             message = "✅ Retrieved neighbors:\n" + "\n".join([str(n) for n in neighbors])
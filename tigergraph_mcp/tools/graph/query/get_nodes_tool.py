@@ -9,9 +9,18 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.result_budget import ResultBudget
+from tigergraph_mcp.tools.graph.query.pagination import (
+    CURSOR_DESCRIPTION,
+    PAGE_SIZE_DESCRIPTION,
+    fetch_nodes_page,
+    format_page,
+    is_paginated,
+)
+from tigergraph_mcp.tools.graph.query.query_shapes import fetch_nodes
 
 
 class GetNodesToolInput(BaseModel):
@@ -41,6 +50,9 @@ class GetNodesToolInput(BaseModel):
         "If omitted, returns all attributes.",
     )
     limit: Optional[int] = Field(None, description="The maximum number of nodes to retrieve.")
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+    page_size: Optional[int] = Field(None, ge=1, description=PAGE_SIZE_DESCRIPTION)
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
 
 
 tools = [
@@ -64,6 +76,9 @@ Notes:
 - Use `filter_expression` to apply conditions (e.g., "s.age >= 25 and s.gender == 'Female'").
 - If `return_attributes` is specified, only the listed attributes will be returned.
 - Results are always returned as a list of dictionaries.
+- Results over the server's response budget are truncated and summarized. The whole result is
+  still read from TigerGraph, so use `limit` or `page_size` to bound the work on large types.
+- For large results, set `page_size` and pass the returned `cursor` to fetch the next page.
 """,
         inputSchema=GetNodesToolInput.model_json_schema(),
     )
@@ -78,23 +93,45 @@ async def get_nodes(
     filter_expression: Optional[str] = None,
     return_attributes: Optional[List[str]] = None,
     limit: Optional[int] = None,
+    output_format: Optional[OutputFormat] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        nodes = graph.get_nodes(
-            node_type=node_type,
-            all_node_types=all_node_types,
-            node_alias=node_alias,
-            filter_expression=filter_expression,
-            return_attributes=return_attributes,
-            limit=limit,
-            output_type="List",  # Always enforce List output
+        graph = get_graph(graph_name)
+        if is_paginated(page_size, cursor):
+            page = fetch_nodes_page(
+                graph,
+                node_type,
+                all_node_types,
+                node_alias,
+                filter_expression,
+                return_attributes,
+                limit,
+                page_size,
+                cursor,
+            )
+            message = format_page(page, output_format, "✅ Retrieved nodes:", "⚠️ No nodes found.")
+            return [TextContent(type="text", text=message)]
+        nodes = fetch_nodes(
+            graph,
+            node_type,
+            all_node_types,
+            node_alias,
+            filter_expression,
+            return_attributes,
+            limit,
         )
-        assert isinstance(nodes, List)
-        if not nodes:
+        budget = ResultBudget.from_config()
+        nodes = budget.take(nodes)
+        if use_json(output_format):
+            message = dumps(budget.wrap(nodes))
+        elif not nodes:
             message = "⚠️ No nodes found."
         else:
-            message = "✅ Retrieved nodes:\n" + "\n".join([str(node) for node in nodes])
+            message = (
+                "✅ Retrieved nodes:\n" + "\n".join([str(node) for node in nodes]) + budget.note()
+            )
     except Exception as e:
         message = f"❌ Failed to retrieve nodes from graph '{graph_name}': {str(e)}"
     return [TextContent(type="text", text=message)]
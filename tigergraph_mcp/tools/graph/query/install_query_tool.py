@@ -2,8 +2,8 @@ from pydantic import BaseModel, Field
 from mcp.types import Tool, TextContent
 from typing import List
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class InstallQueryToolInput(BaseModel):
@@ -38,7 +38,7 @@ Notes:
 
 async def install_query(graph_name: str, query_name: str) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         success = graph.install_query(query_name)
         if success:
             message = f"✅ Query '{query_name}' successfully installed on graph '{graph_name}'."
@@ -2,8 +2,8 @@ from typing import List
 from pydantic import BaseModel, Field
 from mcp.types import Tool, TextContent
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class IsQueryInstalledToolInput(BaseModel):
@@ -39,7 +39,7 @@ async def is_query_installed(
     query_name: str,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         installed = graph.is_query_installed(query_name)
         if installed:
             message = f"✅ Query '{query_name}' is installed on graph '{graph_name}'."
@@ -0,0 +1,436 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Cursor-based pagination for the node, neighbor and BFS query tools.
+
+Pages are cut with keyset pagination on TigerGraph's internal vertex ID: every query selects
+vertices with `getvid(v) > after`, ordered by that ID and limited to one chunk. Results are pulled
+from TigerGraph chunk by chunk through generators, so the server only ever holds one page in
+memory regardless of how many vertices match. The continuation token returned to the client
+records the last vertex ID served, together with a fingerprint of the request so that a token
+cannot be replayed against a different query. The chunk queries are query templates, which can be
+installed once their shape is used repeatedly.
+
+No state is kept between pages, so every chunk query starts from scratch. For nodes and neighbors
+that costs no more than the chunk itself, but the BFS frontier can only be computed by running
+the whole traversal: BFS pages are fetched in a single chunk, and reading N pages still costs N
+traversals. BFS pagination bounds the size of each response, not the traversal work.
+"""
+
+import base64
+import hashlib
+import itertools
+import json
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from tigergraphx import Graph
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.executor import raise_if_cancelled
+from tigergraph_mcp.tools.output import OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.query_templates import QueryTemplate, run_template
+
+PAGE_SIZE_DESCRIPTION = (
+    "Enables pagination: the maximum number of results to return in this call. When more "
+    "results are available, the response includes a `cursor` to pass in the next call."
+)
+CURSOR_DESCRIPTION = (
+    "Continuation token returned by the previous page. Pass it together with otherwise "
+    "identical arguments to get the next page."
+)
+
+# The vertex accumulator holding each vertex's internal ID, and the name it is printed under.
+_VID_ACCUM = "@page_vid"
+_VID_ALIAS = "page_vid"
+
+
+class Page:
+    def __init__(self, results: List[Dict[str, Any]], next_cursor: Optional[str]):
+        self.results = results
+        self.next_cursor = next_cursor
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"results": self.results, "next_cursor": self.next_cursor}
+
+    def continuation_note(self) -> str:
+        if self.next_cursor is None:
+            return "This is the last page."
+        return f'More results are available. Pass cursor="{self.next_cursor}" for the next page.'
+
+
+def is_paginated(page_size: Optional[int], cursor: Optional[str]) -> bool:
+    return page_size is not None or cursor is not None
+
+
+def format_page(
+    page: Page, output_format: Optional[OutputFormat], header: str, empty_message: str
+) -> str:
+    if use_json(output_format):
+        return dumps(page.to_dict())
+    if not page.results:
+        return empty_message
+    lines = "\n".join(str(result) for result in page.results)
+    return f"{header}\n{lines}\n\n{page.continuation_note()}"
+
+
+def fetch_nodes_page(
+    graph: Graph,
+    node_type: Optional[str],
+    all_node_types: bool,
+    node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[List[str]],
+    limit: Optional[int],
+    page_size: Optional[int],
+    cursor: Optional[str],
+) -> Page:
+    fingerprint = _fingerprint(
+        "get_nodes",
+        graph.name,
+        node_type,
+        all_node_types,
+        node_alias,
+        filter_expression,
+        return_attributes,
+        limit,
+    )
+    if not all_node_types:
+        node_type = _validate_node_type(graph, node_type)
+    template = _nodes_chunk_template(
+        graph.name, node_type, all_node_types, node_alias, filter_expression, return_attributes
+    )
+    return _fetch_page(
+        template, {}, "Nodes", return_attributes, fingerprint, limit, page_size, cursor
+    )
+
+
+def fetch_neighbors_page(
+    graph: Graph,
+    start_nodes: str | int | List[str] | List[int],
+    start_node_type: Optional[str],
+    start_node_alias: str,
+    edge_types: Optional[str | List[str]],
+    edge_alias: str,
+    target_node_types: Optional[str | List[str]],
+    target_node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[List[str]],
+    limit: Optional[int],
+    page_size: Optional[int],
+    cursor: Optional[str],
+) -> Page:
+    fingerprint = _fingerprint(
+        "get_neighbors",
+        graph.name,
+        start_nodes,
+        start_node_type,
+        start_node_alias,
+        edge_types,
+        edge_alias,
+        target_node_types,
+        target_node_alias,
+        filter_expression,
+        return_attributes,
+        limit,
+    )
+    start_node_type = _validate_node_type(graph, start_node_type)
+    template = _neighbors_chunk_template(
+        graph.name,
+        start_node_type,
+        start_node_alias,
+        validate_types(edge_types, graph.edge_types, "edge"),
+        edge_alias,
+        validate_types(target_node_types, graph.node_types, "node"),
+        target_node_alias,
+        filter_expression,
+        return_attributes,
+    )
+    params = {"start_nodes": to_str_list(start_nodes)}
+    return _fetch_page(
+        template, params, "Neighbors", return_attributes, fingerprint, limit, page_size, cursor
+    )
+
+
+def fetch_bfs_page(
+    graph: Graph,
+    start_nodes: str | int | List[str] | List[int],
+    node_type: Optional[str],
+    edge_types: Optional[str | List[str]],
+    max_hops: Optional[int],
+    limit: Optional[int],
+    page_size: Optional[int],
+    cursor: Optional[str],
+) -> Page:
+    fingerprint = _fingerprint(
+        "breadth_first_search", graph.name, start_nodes, node_type, edge_types, max_hops, limit
+    )
+    node_type = _validate_node_type(graph, node_type)
+    template = _bfs_chunk_template(
+        graph.name,
+        node_type,
+        validate_types(edge_types, graph.edge_types, "edge"),
+        max_hops,
+        limit,
+    )
+    params = {"start_nodes": to_str_list(start_nodes)}
+    page = _fetch_page(
+        template, params, "Frontier", None, fingerprint, None, page_size, cursor, whole_page=True
+    )
+    # Match the levels reported by TigerGraphX, which counts the first hop as level 0.
+    for node in page.results:
+        node["_bfs_level"] = (max_hops or 0) - 1
+    return page
+
+
+def _fetch_page(
+    template: QueryTemplate,
+    params: Dict[str, Any],
+    vertex_set: str,
+    return_attributes: Optional[List[str]],
+    fingerprint: str,
+    limit: Optional[int],
+    page_size: Optional[int],
+    cursor: Optional[str],
+    whole_page: bool = False,
+) -> Page:
+    """Fetch the page following `cursor`, in chunks of `page_chunk_size` vertices or, with
+    `whole_page`, in a single query."""
+    after, served = _decode_cursor(cursor, fingerprint)
+    size = min(page_size or get_config().max_page_size, get_config().max_page_size)
+    if limit is not None:
+        size = min(size, limit - served)
+    if size <= 0:
+        return Page([], None)
+
+    # Read one row past the page to find out whether another page follows.
+    chunk_size = size + 1 if whole_page else get_config().page_chunk_size
+    rows = _iter_vertices(
+        template, params, vertex_set, return_attributes, after, size + 1, chunk_size
+    )
+    page = list(itertools.islice(rows, size + 1))
+    has_more = len(page) > size and (limit is None or served + size < limit)
+    page = page[:size]
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_cursor(fingerprint, page[-1][0], served + len(page))
+    return Page([row for _, row in page], next_cursor)
+
+
+def _iter_vertices(
+    template: QueryTemplate,
+    params: Dict[str, Any],
+    vertex_set: str,
+    return_attributes: Optional[List[str]],
+    after: int,
+    total: int,
+    chunk_size: int,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield `(vid, attributes)` for up to `total` vertices, fetched in chunks by vertex ID."""
+    while total > 0:
+        raise_if_cancelled()
+        size = min(chunk_size, total)
+        result = run_template(template, {**params, "after": after, "chunk_size": size})
+        vertices = result[0].get(vertex_set) if isinstance(result, list) and result else None
+        if not vertices:
+            return
+        rows = sorted(
+            (_clean_vertex(vertex, return_attributes) for vertex in vertices),
+            key=lambda row: row[0],
+        )
+        yield from rows
+        if len(rows) < size:
+            return
+        after = rows[-1][0]
+        total -= len(rows)
+
+
+def _clean_vertex(
+    vertex: Dict[str, Any], return_attributes: Optional[List[str]]
+) -> Tuple[int, Dict[str, Any]]:
+    attributes = dict(vertex.get("attributes", {}))
+    vid = attributes.pop(_VID_ALIAS, None)
+    vid = attributes.pop(_VID_ACCUM, vid)
+    if return_attributes is not None:
+        attributes = {attr: attributes.get(attr) for attr in return_attributes}
+    return int(vid), attributes
+
+
+def _nodes_chunk_template(
+    graph_name: str,
+    node_type: Optional[str],
+    all_node_types: bool,
+    node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[List[str]],
+) -> QueryTemplate:
+    node_type_str = "ANY" if all_node_types else f"{node_type}.*"
+
+    def render(filter_expression: Optional[str]) -> str:
+        where = f"getvid({node_alias}) > after"
+        if filter_expression:
+            where += f" AND ({filter_expression})"
+        return f"""
+  SumAccum<INT> {_VID_ACCUM};
+  Nodes = {{{node_type_str}}};
+  Nodes =
+    SELECT {node_alias}
+    FROM Nodes:{node_alias}
+    WHERE {where}
+    POST-ACCUM {node_alias}.{_VID_ACCUM} = getvid({node_alias})
+    ORDER BY {node_alias}.{_VID_ACCUM} ASC
+    LIMIT chunk_size;
+  {_gsql_print("Nodes", return_attributes)}"""
+
+    return QueryTemplate.render(
+        graph_name, "nodes_page", "INT after, INT chunk_size", render, filter_expression
+    )
+
+
+def _neighbors_chunk_template(
+    graph_name: str,
+    start_node_type: str,
+    start_node_alias: str,
+    edge_type_set: Optional[Set[str]],
+    edge_alias: str,
+    target_node_type_set: Optional[Set[str]],
+    target_node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[List[str]],
+) -> QueryTemplate:
+    s, t = start_node_alias, target_node_alias
+    edge_pattern = f"({type_union(edge_type_set)}:{edge_alias})"
+
+    def render(filter_expression: Optional[str]) -> str:
+        where = f"getvid({t}) > after"
+        if filter_expression:
+            where += f" AND ({filter_expression})"
+        return f"""
+  SumAccum<INT> {_VID_ACCUM};
+  Nodes = {{start_nodes}};
+  Neighbors =
+    SELECT {t}
+    FROM Nodes:{s} -{edge_pattern}- {type_union(target_node_type_set)}:{t}
+    WHERE {where}
+    POST-ACCUM {t}.{_VID_ACCUM} = getvid({t})
+    ORDER BY {t}.{_VID_ACCUM} ASC
+    LIMIT chunk_size;
+  {_gsql_print("Neighbors", return_attributes)}"""
+
+    parameters = f"SET<VERTEX<{start_node_type}>> start_nodes, INT after, INT chunk_size"
+    return QueryTemplate.render(graph_name, "neighbors_page", parameters, render, filter_expression)
+
+
+def _bfs_chunk_template(
+    graph_name: str,
+    node_type: str,
+    edge_type_set: Optional[Set[str]],
+    max_hops: Optional[int],
+    limit: Optional[int],
+) -> QueryTemplate:
+    # Like TigerGraphX's BFS, the result is the frontier reached after `max_hops` hops, and
+    # `limit` caps the number of nodes visited per hop.
+    loop_limit = f" LIMIT {int(max_hops)}" if max_hops else ""
+    hop_limit = f"\n      LIMIT {int(limit)}" if limit else ""
+    edge_pattern = f"({type_union(edge_type_set)}:e)"
+    body = f"""
+  OrAccum @visited;
+  SumAccum<INT> {_VID_ACCUM};
+  Frontier = {{start_nodes}};
+  Frontier = SELECT s FROM Frontier:s POST-ACCUM s.@visited = TRUE;
+  WHILE Frontier.size() > 0{loop_limit} DO
+    Frontier =
+      SELECT t
+      FROM Frontier:s -{edge_pattern}- {node_type}:t
+      WHERE t.@visited == FALSE
+      POST-ACCUM t.@visited = TRUE{hop_limit};
+  END;
+  Frontier =
+    SELECT s
+    FROM Frontier:s
+    WHERE getvid(s) > after
+    POST-ACCUM s.{_VID_ACCUM} = getvid(s)
+    ORDER BY s.{_VID_ACCUM} ASC
+    LIMIT chunk_size;
+  PRINT Frontier;"""
+    parameters = f"SET<VERTEX<{node_type}>> start_nodes, INT after, INT chunk_size"
+    return QueryTemplate(graph_name, "bfs_page", parameters, body)
+
+
+def _gsql_print(vertex_set: str, return_attributes: Optional[List[str]]) -> str:
+    if not return_attributes:
+        return f"PRINT {vertex_set};"
+    projections = [f"{vertex_set}.{attr} AS {attr}" for attr in return_attributes]
+    projections.append(f"{vertex_set}.{_VID_ACCUM} AS {_VID_ALIAS}")
+    return f"PRINT {vertex_set}[{', '.join(projections)}];"
+
+
+def type_union(types: Optional[Set[str]]) -> str:
+    if not types:
+        return ""
+    if len(types) == 1:
+        return next(iter(types))
+    return f"({'|'.join(sorted(types))})"
+
+
+def _validate_node_type(graph: Graph, node_type: Optional[str]) -> str:
+    if node_type is not None:
+        if node_type not in graph.node_types:
+            raise ValueError(f"Invalid node type '{node_type}'. Must be one of {graph.node_types}.")
+        return node_type
+    if len(graph.node_types) != 1:
+        raise ValueError("Multiple node types detected. Please specify a node type.")
+    return next(iter(graph.node_types))
+
+
+def validate_types(
+    types: Optional[str | List[str]], valid_types: Set[str], kind: str
+) -> Optional[Set[str]]:
+    if types is None:
+        return None
+    types = [types] if isinstance(types, str) else types
+    invalid_types = [t for t in types if t not in valid_types]
+    if invalid_types:
+        raise ValueError(
+            f"Invalid {kind} type(s): {', '.join(invalid_types)}. "
+            f"Valid {kind} types are: {', '.join(sorted(valid_types))}."
+        )
+    return set(types)
+
+
+def to_str_list(node_ids: str | int | List[str] | List[int]) -> List[str]:
+    if isinstance(node_ids, (str, int)):
+        return [str(node_ids)]
+    return [str(node_id) for node_id in node_ids]
+
+
+def _fingerprint(*request: Any) -> str:
+    encoded = json.dumps(request, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _encode_cursor(fingerprint: str, after: int, served: int) -> str:
+    payload = json.dumps({"f": fingerprint, "a": after, "n": served}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str], fingerprint: str) -> Tuple[int, int]:
+    """Return `(after, served)` for `cursor`, or the start of the result set if it is None."""
+    if cursor is None:
+        return -1, 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        after, served = int(payload["a"]), int(payload["n"])
+        matches = payload["f"] == fingerprint
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor.") from e
+    if not matches:
+        raise ValueError(
+            "The cursor belongs to a different request. Repeat the original arguments when "
+            "passing a cursor."
+        )
+    return after, served
@@ -0,0 +1,155 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Installed queries for frequent `get_nodes` and `get_neighbors` call shapes.
+
+TigerGraphX runs every `get_nodes` and `get_neighbors` call as an interpreted query. Here, each
+call is first described as a query template equivalent to TigerGraphX's query, whose shape
+covers the node and edge types, the aliases, the filter expression with its literals lifted
+into parameters, the projected attributes and whether a limit is set. The start nodes and the
+limit are parameters. Each call counts a use of its shape; once the shape's query is installed,
+the call runs it and returns the same rows TigerGraphX would. Until then, the call goes through
+TigerGraphX as before.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from tigergraphx import Graph
+
+from tigergraph_mcp.tools.query_templates import QueryTemplate, get_query_templates
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+from tigergraph_mcp.tools.graph.query.pagination import to_str_list, type_union, validate_types
+
+
+def fetch_nodes(
+    graph: Graph,
+    node_type: Optional[str],
+    all_node_types: bool,
+    node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[List[str]],
+    limit: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Return the nodes `graph.get_nodes` would, from the installed query of the call's shape
+    if there is one."""
+    if not all_node_types:
+        node_type = resolve_node_type(graph, node_type)
+    node_type_str = "ANY" if all_node_types else f"{node_type}.*"
+
+    def render(filter_expression: Optional[str]) -> str:
+        select = ""
+        if filter_expression or limit:
+            where_clause = f"\n    WHERE {filter_expression}" if filter_expression else ""
+            limit_clause = "\n    LIMIT result_limit" if limit else ""
+            select = f"""
+  Nodes =
+    SELECT {node_alias}
+    FROM Nodes:{node_alias}{where_clause}{limit_clause};"""
+        return f"""
+  Nodes = {{{node_type_str}}};{select}
+  {_gsql_print("Nodes", return_attributes)}"""
+
+    parameters = "INT result_limit" if limit else ""
+    template = QueryTemplate.render(graph.name, "get_nodes", parameters, render, filter_expression)
+    params = {"result_limit": limit} if limit else {}
+    result = get_query_templates().run_installed(template, params)
+    if result is None:
+        nodes = graph.get_nodes(
+            node_type=node_type,
+            all_node_types=all_node_types,
+            node_alias=node_alias,
+            filter_expression=filter_expression,
+            return_attributes=return_attributes,
+            limit=limit,
+            output_type="List",
+        )
+        assert isinstance(nodes, list)
+        return nodes
+    return _clean_vertices(result, "Nodes", return_attributes)
+
+
+def fetch_neighbors(
+    graph: Graph,
+    start_nodes: str | int | List[str] | List[int],
+    start_node_type: Optional[str],
+    start_node_alias: str,
+    edge_types: Optional[str | List[str]],
+    edge_alias: str,
+    target_node_types: Optional[str | List[str]],
+    target_node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[List[str]],
+    limit: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Return the neighbors `graph.get_neighbors` would, from the installed query of the call's
+    shape if there is one."""
+    start_node_type = resolve_node_type(graph, start_node_type)
+    edge_type_set = validate_types(edge_types, graph.edge_types, "edge")
+    target_node_type_set = validate_types(target_node_types, graph.node_types, "node")
+    s, t = start_node_alias, target_node_alias
+    edge_pattern = f"({type_union(edge_type_set)}:{edge_alias})"
+    target_pattern = f"{type_union(target_node_type_set)}:{t}"
+
+    def render(filter_expression: Optional[str]) -> str:
+        where_clause = f"\n    WHERE {filter_expression}" if filter_expression else ""
+        limit_clause = "\n    LIMIT result_limit" if limit else ""
+        return f"""
+  Nodes = {{start_nodes}};
+  Neighbors =
+    SELECT {t}
+    FROM Nodes:{s} -{edge_pattern}- {target_pattern}{where_clause}{limit_clause};
+  {_gsql_print("Neighbors", return_attributes)}"""
+
+    parameters = f"SET<VERTEX<{start_node_type}>> start_nodes"
+    if limit:
+        parameters += ", INT result_limit"
+    template = QueryTemplate.render(
+        graph.name, "get_neighbors", parameters, render, filter_expression
+    )
+    params: Dict[str, Any] = {"start_nodes": to_str_list(start_nodes)}
+    if limit:
+        params["result_limit"] = limit
+    result = get_query_templates().run_installed(template, params)
+    if result is None:
+        neighbors = graph.get_neighbors(
+            start_nodes=start_nodes,
+            start_node_type=start_node_type,
+            start_node_alias=start_node_alias,
+            edge_types=edge_types,
+            edge_alias=edge_alias,
+            target_node_types=target_node_types,
+            target_node_alias=target_node_alias,
+            filter_expression=filter_expression,
+            return_attributes=return_attributes,
+            limit=limit,
+            output_type="List",
+        )
+        assert isinstance(neighbors, list)
+        return neighbors
+    return _clean_vertices(result, "Neighbors", return_attributes)
+
+
+def _gsql_print(vertex_set: str, return_attributes: Optional[List[str]]) -> str:
+    if not return_attributes:
+        return f"PRINT {vertex_set};"
+    projections = ", ".join(f"{vertex_set}.{attr} AS {attr}" for attr in return_attributes)
+    return f"PRINT {vertex_set}[{projections}];"
+
+
+def _clean_vertices(
+    result: List, vertex_set: str, return_attributes: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    vertices = result[0].get(vertex_set) if isinstance(result, list) and result else None
+    if not vertices or not isinstance(vertices, list):
+        return []
+    rows = []
+    for vertex in vertices:
+        attributes = vertex.get("attributes", {})
+        if return_attributes is not None:
+            attributes = {attr: attributes.get(attr) for attr in return_attributes}
+        rows.append(attributes)
+    return rows
@@ -1,9 +1,12 @@
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from pydantic import BaseModel, Field
 from mcp.types import Tool, TextContent
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import invalidate_counts
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.membership_cache import invalidate_membership
+from tigergraph_mcp.tools.result_budget import ResultBudget
 
 
 class RunQueryToolInput(BaseModel):
@@ -33,6 +36,7 @@ Notes:
 * The query must be installed on the graph.
 * Parameters must match those defined in the GSQL query.
 * Returns the query result as a list of dictionaries, or None if execution fails.
+* Results over the server's response budget are truncated and summarized.
   """,
         inputSchema=RunQueryToolInput.model_json_schema(),
     )
@@ -45,14 +49,51 @@ async def run_query(
     params: Optional[Dict] = {},
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        message = graph.run_query(query_name, params or {})
-        if message is None:
+        graph = get_graph(graph_name)
+        result = graph.run_query(query_name, params or {})
+        # Installed queries can add and delete nodes and edges.
+        invalidate_membership(graph_name)
+        invalidate_counts(graph_name)
+        if result is None:
             message = (
                 f"⚠️ Query '{query_name}' on graph '{graph_name}' returned no result or failed."
             )
         else:
-            message = f"✅ Query result for '{query_name}' on graph '{graph_name}':\n{message}"
+            budget = ResultBudget.from_config()
+            result = _apply_budget(result, budget)
+            message = (
+                f"✅ Query result for '{query_name}' on graph '{graph_name}':\n{result}"
+                + budget.note()
+            )
     except Exception as e:
         message = f"❌ Failed to run query '{query_name}' on graph '{graph_name}': {str(e)}"
     return [TextContent(type="text", text=message)]
+
+
+def _apply_budget(result: List, budget: ResultBudget) -> List:
+    """Truncate the lists and maps printed by the query, keeping the shape of the result."""
+    if not isinstance(result, list):
+        return result
+    truncated = []
+    for output in result:
+        if isinstance(output, dict):
+            truncated.append({key: _budget_value(value, budget) for key, value in output.items()})
+        else:
+            truncated.extend(budget.take([output]))
+    return truncated
+
+
+def _budget_value(value: Any, budget: ResultBudget) -> Any:
+    # The elements of a list, e.g. a vertex set, are rows. So are the entries of a map, e.g. a
+    # MapAccum, except those holding a list or map, which are truncated in turn.
+    if isinstance(value, list):
+        return budget.take(value)
+    if not isinstance(value, dict):
+        return value
+    truncated = {}
+    for key, item in value.items():
+        if isinstance(item, (list, dict)):
+            truncated[key] = _budget_value(item, budget)
+        elif budget.take([{"key": key, "value": item}]):
+            truncated[key] = item
+    return truncated
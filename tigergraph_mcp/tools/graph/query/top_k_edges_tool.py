@@ -0,0 +1,165 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.query_templates import QueryTemplate, run_template
+from tigergraph_mcp.tools.result_budget import ResultBudget
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_edge_type
+from tigergraph_mcp.tools.graph.query.top_k_nodes_tool import SORTABLE_TYPES
+
+
+class TopKEdgesToolInput(BaseModel):
+    """Input schema for retrieving the top edges of a type by an attribute."""
+
+    graph_name: str = Field(..., description="The name of the graph to query.")
+    edge_type: Optional[str] = Field(None, description="The type of the edges to rank.")
+    src_node_type: Optional[str] = Field(
+        None, description="The type of the source nodes. Defaults to the edge type's source type."
+    )
+    tgt_node_type: Optional[str] = Field(
+        None, description="The type of the target nodes. Defaults to the edge type's target type."
+    )
+    sort_by: str = Field(..., description="The edge attribute to rank the edges by.")
+    k: int = Field(10, ge=1, description="The number of edges to return.")
+    ascending: bool = Field(
+        False,
+        description="Whether to return the edges with the lowest values instead of the highest.",
+    )
+    filter_expression: Optional[str] = Field(
+        None,
+        description="A condition selecting the edges to rank, referring to the source node as "
+        '`s`, the edge as `e` and the target node as `t`, e.g. "e.quantity > 1".',
+    )
+    return_attributes: Optional[List[str]] = Field(
+        None,
+        description="The edge attributes to return for each edge, in addition to `sort_by`. "
+        "If omitted, returns all attributes.",
+    )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.TOP_K_EDGES,
+        description="""Retrieves the top k edges of a type, ranked by an attribute.
+
+Use this to find e.g. the largest transactions without retrieving every edge: the edges are
+ranked inside TigerGraph, and only the top k are returned.
+
+Example input:
+```python
+graph_name = "Shop"
+edge_type = "purchased"
+sort_by = "quantity"
+k = 20
+filter_expression = "t.category == 'books'"
+```
+
+Notes:
+- Set `ascending=True` to get the lowest values first.
+- Each result holds `from_id`, `to_id` and the edge's attributes, ordered by rank.
+- If the server installs generated queries, the query is installed once its shape has been
+  used a few times; calls with another `k`, or different values in `filter_expression`, then
+  run the installed query.
+""",
+        inputSchema=TopKEdgesToolInput.model_json_schema(),
+    )
+]
+
+
+async def top_k_edges(
+    graph_name: str,
+    sort_by: str,
+    edge_type: Optional[str] = None,
+    src_node_type: Optional[str] = None,
+    tgt_node_type: Optional[str] = None,
+    k: int = 10,
+    ascending: bool = False,
+    filter_expression: Optional[str] = None,
+    return_attributes: Optional[List[str]] = None,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        src_node_type, edge_type, tgt_node_type, _ = resolve_edge_type(
+            graph, src_node_type, edge_type, tgt_node_type
+        )
+        edge_schema = graph.get_schema("dict")["edges"][edge_type]
+        data_types = {
+            attr: getattr(attr_schema["data_type"], "value", attr_schema["data_type"])
+            for attr, attr_schema in edge_schema["attributes"].items()
+        }
+        if return_attributes is None:
+            return_attributes = [
+                attr for attr, data_type in data_types.items() if data_type in SORTABLE_TYPES
+            ]
+        return_attributes = list(dict.fromkeys([sort_by, *return_attributes]))
+        for attr in return_attributes:
+            if attr not in data_types:
+                raise ValueError(
+                    f"Invalid attribute '{attr}' for edge type '{edge_type}'. "
+                    f"Must be one of {list(data_types)}."
+                )
+            if data_types[attr] not in SORTABLE_TYPES:
+                raise ValueError(f"Cannot return attribute '{attr}' of type {data_types[attr]}.")
+
+        # An undirected edge between two nodes of the same type is reached from both ends:
+        # keep one direction.
+        where_clauses = []
+        if not edge_schema.get("is_directed_edge", True) and src_node_type == tgt_node_type:
+            where_clauses.append("getvid(s) <= getvid(t)")
+        fields = ", ".join(f"{data_types[attr]} a{i}" for i, attr in enumerate(return_attributes))
+        values = ", ".join(f"e.{attr}" for attr in return_attributes)
+
+        def render(where: Optional[str]) -> str:
+            conditions = where_clauses + ([f"({where})"] if where else [])
+            where_clause = f"\n    WHERE {' AND '.join(conditions)}" if conditions else ""
+            return f"""
+  TYPEDEF TUPLE<VERTEX from_v, VERTEX to_v, {fields}> Ranked;
+  HeapAccum<Ranked>(k, a0 {"ASC" if ascending else "DESC"}) @@top;
+  Sources = {{{src_node_type}.*}};
+  Sources =
+    SELECT s
+    FROM Sources:s -({edge_type}:e)- {tgt_node_type}:t{where_clause}
+    ACCUM @@top += Ranked(s, t, {values});
+  PRINT @@top AS top;"""
+
+        template = QueryTemplate.render(
+            graph_name, "top_k_edges", "INT k", render, filter_expression
+        )
+        result = run_template(template, {"k": k})
+        ranked = result[0].get("top", []) if result else []
+
+        rows: List[Dict[str, Any]] = []
+        for edge in ranked:
+            row = {"from_id": edge.get("from_v"), "to_id": edge.get("to_v")}
+            row.update({attr: edge.get(f"a{i}") for i, attr in enumerate(return_attributes)})
+            rows.append(row)
+
+        budget = ResultBudget.from_config()
+        rows = budget.take(rows)
+        if use_json(output_format):
+            message = dumps(budget.wrap(rows))
+        elif not rows:
+            message = f"⚠️ No '{edge_type}' edges found in graph '{graph_name}'."
+        else:
+            order = "lowest" if ascending else "highest"
+            message = (
+                f"✅ Top {len(rows)} '{edge_type}' edge(s) with the {order} '{sort_by}':\n"
+                + "\n".join(str(row) for row in rows)
+                + budget.note()
+            )
+    except Exception as e:
+        message = f"❌ Failed to retrieve top edges from graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
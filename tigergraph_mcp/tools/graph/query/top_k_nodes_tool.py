@@ -0,0 +1,147 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+from tigergraph_mcp.tools.query_templates import QueryTemplate, run_template
+from tigergraph_mcp.tools.result_budget import ResultBudget
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+
+SORTABLE_TYPES = {"INT", "UINT", "FLOAT", "DOUBLE", "BOOL", "STRING", "DATETIME"}
+
+
+class TopKNodesToolInput(BaseModel):
+    """Input schema for retrieving the top nodes of a type by an attribute."""
+
+    graph_name: str = Field(..., description="The name of the graph to query.")
+    node_type: Optional[str] = Field(None, description="The type of the nodes to rank.")
+    sort_by: str = Field(..., description="The attribute to rank the nodes by.")
+    k: int = Field(10, ge=1, description="The number of nodes to return.")
+    ascending: bool = Field(
+        False,
+        description="Whether to return the nodes with the lowest values instead of the highest.",
+    )
+    filter_expression: Optional[str] = Field(
+        None,
+        description="A condition selecting the nodes to rank, referring to each node as `s`, "
+        'e.g. "s.in_stock == TRUE".',
+    )
+    return_attributes: Optional[List[str]] = Field(
+        None,
+        description="The attributes to return for each node, in addition to `sort_by`. "
+        "If omitted, returns all attributes.",
+    )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.TOP_K_NODES,
+        description="""Retrieves the top k nodes of a type, ranked by an attribute.
+
+Use this instead of retrieving all nodes with `graph__get_nodes` and sorting them yourself: the
+nodes are sorted and limited inside TigerGraph, and only the top k are returned.
+
+Example input:
+```python
+graph_name = "Shop"
+node_type = "Product"
+sort_by = "price"
+k = 20
+filter_expression = "s.category == 'books'"
+return_attributes = ["name"]
+```
+
+Notes:
+- Set `ascending=True` to get the lowest values first.
+- The results are ordered by rank; ties are returned in no particular order.
+- If the server installs generated queries, the query is installed once its shape has been
+  used a few times; calls with another `k`, or different values in `filter_expression`, then
+  run the installed query.
+""",
+        inputSchema=TopKNodesToolInput.model_json_schema(),
+    )
+]
+
+
+async def top_k_nodes(
+    graph_name: str,
+    sort_by: str,
+    node_type: Optional[str] = None,
+    k: int = 10,
+    ascending: bool = False,
+    filter_expression: Optional[str] = None,
+    return_attributes: Optional[List[str]] = None,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        node_type = resolve_node_type(graph, node_type)
+        attributes = graph.get_schema("dict")["nodes"][node_type]["attributes"]
+        if return_attributes is not None:
+            return_attributes = list(dict.fromkeys([sort_by, *return_attributes]))
+        for attr in [sort_by, *(return_attributes or [])]:
+            if attr not in attributes:
+                raise ValueError(
+                    f"Invalid attribute '{attr}' for node type '{node_type}'. "
+                    f"Must be one of {list(attributes)}."
+                )
+        data_type = attributes[sort_by]["data_type"]
+        data_type = getattr(data_type, "value", data_type)
+        if data_type not in SORTABLE_TYPES:
+            raise ValueError(f"Cannot sort by attribute '{sort_by}' of type {data_type}.")
+
+        def render(where: Optional[str]) -> str:
+            where_clause = f"\n    WHERE {where}" if where else ""
+            if return_attributes is None:
+                projection = "Nodes"
+            else:
+                projections = ", ".join(f"Nodes.{attr} AS {attr}" for attr in return_attributes)
+                projection = f"Nodes[{projections}]"
+            return f"""
+  Nodes = {{{node_type}.*}};
+  Nodes =
+    SELECT s
+    FROM Nodes:s{where_clause}
+    ORDER BY s.{sort_by} {"ASC" if ascending else "DESC"}
+    LIMIT k;
+  PRINT {projection};"""
+
+        template = QueryTemplate.render(
+            graph_name, "top_k_nodes", "INT k", render, filter_expression
+        )
+        result = run_template(template, {"k": k})
+        nodes = result[0].get("Nodes", []) if result else []
+
+        # Vertex sets are printed unordered: restore the ranking.
+        rows: List[Dict[str, Any]] = [
+            {"node_id": node["v_id"], **node.get("attributes", {})} for node in nodes
+        ]
+        rows.sort(key=lambda row: row.get(sort_by), reverse=not ascending)
+
+        budget = ResultBudget.from_config()
+        rows = budget.take(rows)
+        if use_json(output_format):
+            message = dumps(budget.wrap(rows))
+        elif not rows:
+            message = f"⚠️ No '{node_type}' nodes found in graph '{graph_name}'."
+        else:
+            order = "lowest" if ascending else "highest"
+            message = (
+                f"✅ Top {len(rows)} '{node_type}' node(s) with the {order} '{sort_by}':\n"
+                + "\n".join(str(row) for row in rows)
+                + budget.note()
+            )
+    except Exception as e:
+        message = f"❌ Failed to retrieve top nodes from graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
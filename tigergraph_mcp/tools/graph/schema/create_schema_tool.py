@@ -14,6 +14,8 @@ from tigergraphx import Graph
 from tigergraphx.core.tigergraph_api import TigerGraphAPIError
 
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph, invalidate_graph
+from tigergraph_mcp.tools.query_templates import invalidate_query_templates
 
 
 class CreateSchemaToolInput(BaseModel):
@@ -100,9 +102,11 @@ async def create_schema(graph_schema: Dict) -> List[TextContent]:
         # Step 1: Attempt to create the graph
         graph = Graph(graph_schema)
 
-        # Step 2: Verify that the graph exists in the database
+        # Step 2: Verify that the graph exists in the database, replacing any stale cached handle
+        invalidate_graph(graph.name)
+        invalidate_query_templates(graph.name)
         try:
-            _ = Graph.from_db(graph.name)
+            _ = get_graph(graph.name)
         except TigerGraphAPIError as e:
             raise Exception(
                 f"Graph '{graph.name}' not found in database after creation attempt: {str(e)}"
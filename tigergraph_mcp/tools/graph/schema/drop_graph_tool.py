@@ -10,9 +10,11 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import invalidate_counts
+from tigergraph_mcp.tools.graph_cache import get_graph, invalidate_graph
+from tigergraph_mcp.tools.membership_cache import invalidate_membership
+from tigergraph_mcp.tools.query_templates import invalidate_query_templates
 
 
 class GraphDropToolInput(BaseModel):
@@ -40,8 +42,12 @@ async def drop_graph(
     graph_name: str,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         graph.drop_graph()
+        invalidate_graph(graph_name)
+        invalidate_membership(graph_name)
+        invalidate_counts(graph_name)
+        invalidate_query_templates(graph_name, drop_queries=False)
         message = f"✅ Graph '{graph_name}' dropped successfully."
     except Exception as e:
         message = f"❌ Graph drop failed: {str(e)}"
@@ -11,9 +11,8 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class GetSchemaToolInput(BaseModel):
@@ -41,7 +40,7 @@ async def get_schema(
     graph_name: str,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         schema = graph.get_schema()
         message = f"✅ Schema for graph '{graph_name}': {schema}"
     except Exception as e:
@@ -6,12 +6,18 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from .degree_tool import degree
+from .degrees_tool import degrees
+from .degree_distribution_tool import degree_distribution
 from .number_of_nodes_tool import number_of_nodes
 from .number_of_edges_tool import number_of_edges
+from .profile_tool import profile
 
 
 __all__ = [
     "degree",
+    "degrees",
+    "degree_distribution",
     "number_of_nodes",
     "number_of_edges",
+    "profile",
 ]
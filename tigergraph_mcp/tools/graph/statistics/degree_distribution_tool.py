@@ -0,0 +1,143 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.statistics.degrees_tool import edge_type_pattern
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+
+
+class DegreeDistributionToolInput(BaseModel):
+    """Input schema for computing the degree distribution of a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph.")
+    node_type: Optional[str] = Field(
+        None, description="The type of the nodes to include. If omitted, all nodes are included."
+    )
+    edge_types: Optional[List[str] | str] = Field(
+        None,
+        description="A single edge type or list of edge types to consider. If omitted, all edge "
+        "types are included.",
+    )
+    top_k: int = Field(10, ge=1, le=1000, description="The number of highest-degree hubs to list.")
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.DEGREE_DISTRIBUTION,
+        description="""Returns the degree histogram and the top-k hubs of a TigerGraph graph.
+
+The degrees of all nodes are computed in a single pass inside TigerGraph; no edges are
+transferred. The histogram maps each degree to the number of nodes having it.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+node_type = "Person"  # Optional
+edge_types = ["Friendship"]  # Optional
+top_k = 5
+```
+
+With `output_format="json"`:
+```json
+{"nodes":3,"mean_degree":1.33,"max_degree":2,"histogram":{"0":1,"2":2},
+ "hubs":[{"id":"Alice","type":"Person","degree":2}]}
+```
+""",
+        inputSchema=DegreeDistributionToolInput.model_json_schema(),
+    )
+]
+
+
+async def degree_distribution(
+    graph_name: str,
+    node_type: Optional[str] = None,
+    edge_types: Optional[List[str] | str] = None,
+    top_k: int = 10,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        if node_type is not None and node_type not in graph.node_types:
+            raise ValueError(
+                f"Invalid node type: {node_type}. "
+                f"Valid node types are: {', '.join(sorted(graph.node_types))}."
+            )
+        pattern = edge_type_pattern(graph, edge_types)
+        distribution = _fetch_distribution(graph_name, node_type, pattern, top_k)
+        if use_json(output_format):
+            message = dumps(distribution)
+        else:
+            histogram = "\n".join(
+                f"{degree}: {count}" for degree, count in distribution["histogram"].items()
+            )
+            hubs = "\n".join(
+                f"{hub['id']} ({hub['type']}): {hub['degree']}" for hub in distribution["hubs"]
+            )
+            message = (
+                f"📊 Degree distribution of {distribution['nodes']} node(s) in graph "
+                f"'{graph_name}': mean {distribution['mean_degree']}, "
+                f"max {distribution['max_degree']}.\n"
+                f"Histogram (degree: nodes):\n{histogram}\n"
+                f"Top {len(distribution['hubs'])} hubs:\n{hubs}"
+            )
+    except Exception as e:
+        message = f"❌ Failed to compute the degree distribution of graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+def _fetch_distribution(
+    graph_name: str, node_type: Optional[str], pattern: str, top_k: int
+) -> Dict[str, Any]:
+    # Nodes without edges never reach the POST-ACCUM, so they are counted from the difference
+    # between the two vertex set sizes.
+    seed = f"{node_type}.*" if node_type else "ANY"
+    gsql = f"""
+INTERPRET QUERY(INT top_k) FOR GRAPH {graph_name} {{
+  TYPEDEF TUPLE<VERTEX node, STRING node_type, INT degree> Hub;
+  SumAccum<INT> @degree;
+  SumAccum<INT> @@total;
+  MaxAccum<INT> @@max_degree;
+  MapAccum<INT, SumAccum<INT>> @@histogram;
+  HeapAccum<Hub>(top_k, degree DESC) @@hubs;
+  Nodes = {{{seed}}};
+  Connected =
+    SELECT s
+    FROM Nodes:s -({pattern})- :t
+    ACCUM s.@degree += 1
+    POST-ACCUM
+      @@total += s.@degree,
+      @@max_degree += s.@degree,
+      @@histogram += (s.@degree -> 1),
+      @@hubs += Hub(s, s.type, s.@degree);
+  PRINT Nodes.size() AS nodes, Connected.size() AS connected, @@total AS total,
+        @@max_degree AS max_degree, @@histogram AS histogram, @@hubs AS hubs;
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {"top_k": top_k})
+    row = result[0] if result else {}
+    nodes = row.get("nodes", 0)
+    histogram = {int(degree): count for degree, count in row.get("histogram", {}).items()}
+    isolated = nodes - row.get("connected", 0)
+    if isolated:
+        histogram[0] = isolated
+    return {
+        "nodes": nodes,
+        "mean_degree": round(row.get("total", 0) / nodes, 2) if nodes else 0,
+        "max_degree": row.get("max_degree", 0) if row.get("connected") else 0,
+        "histogram": dict(sorted(histogram.items())),
+        "hubs": [
+            {"id": str(hub["node"]), "type": hub["node_type"], "degree": hub["degree"]}
+            for hub in row.get("hubs", [])
+        ],
+    }
@@ -10,9 +10,8 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class DegreeToolInput(BaseModel):
@@ -57,7 +56,7 @@ async def degree(
     edge_types: Optional[List[str] | str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         deg = graph.degree(node_id, node_type=node_type, edge_types=edge_types)
         message = (
             f"📏 Degree of node '{node_id}' (Type: {node_type or 'default'}) "
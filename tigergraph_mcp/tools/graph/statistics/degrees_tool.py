@@ -0,0 +1,132 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+from tigergraphx import Graph
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.connection_pool import get_api
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
+
+
+class DegreesToolInput(BaseModel):
+    """Input schema for computing the degrees of many nodes in a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph containing the nodes.")
+    node_ids: List[str | int] = Field(
+        ..., min_length=1, description="The identifiers of the nodes whose degree is computed."
+    )
+    node_type: Optional[str] = Field(None, description="The type of the nodes (optional).")
+    edge_types: Optional[List[str] | str] = Field(
+        None,
+        description="A single edge type or list of edge types to consider. If omitted, all edge "
+        "types are included.",
+    )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.DEGREES,
+        description="""Returns the degrees of many nodes of a TigerGraph graph in one call.
+
+Use this instead of calling `graph__degree` once per node, e.g. to find the hubs among a list
+of candidates. The degrees are counted inside TigerGraph.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+node_ids = ["Alice", "Mike", "Zoe"]
+node_type = "Person"  # Optional
+edge_types = ["Friendship", "Follow"]  # Optional
+```
+
+The response lists the nodes from highest to lowest degree, followed by the node IDs that were
+not found. With `output_format="json"`:
+```json
+{"degrees":{"Alice":12,"Mike":3},"missing":["Zoe"]}
+```
+""",
+        inputSchema=DegreesToolInput.model_json_schema(),
+    )
+]
+
+
+async def degrees(
+    graph_name: str,
+    node_ids: List[str | int],
+    node_type: Optional[str] = None,
+    edge_types: Optional[List[str] | str] = None,
+    output_format: Optional[OutputFormat] = None,
+) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        node_type = resolve_node_type(graph, node_type)
+        pattern = edge_type_pattern(graph, edge_types)
+        requested = list(dict.fromkeys(str(node_id) for node_id in node_ids))
+        found: Dict[str, int] = {}
+        chunk_size = get_config().lookup_chunk_size
+        for start in range(0, len(requested), chunk_size):
+            chunk = requested[start : start + chunk_size]
+            found.update(_fetch_degrees(graph_name, node_type, pattern, chunk))
+        ranked = sorted(
+            (node_id for node_id in requested if node_id in found),
+            key=lambda node_id: found[node_id],
+            reverse=True,
+        )
+        missing = [node_id for node_id in requested if node_id not in found]
+        if use_json(output_format):
+            message = dumps(
+                {"degrees": {node_id: found[node_id] for node_id in ranked}, "missing": missing}
+            )
+        else:
+            lines = [f"{node_id}: {found[node_id]}" for node_id in ranked]
+            message = (
+                f"📏 Degrees of {len(ranked)} node(s) of type '{node_type}' in graph "
+                f"'{graph_name}':\n" + "\n".join(lines)
+            )
+            if missing:
+                message += f"\nMissing: {missing}"
+    except Exception as e:
+        message = f"❌ Failed to compute degrees in graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+def edge_type_pattern(graph: Graph, edge_types: Optional[List[str] | str]) -> str:
+    """Return the edge pattern of a GSQL traversal over `edge_types`, or over all edge types."""
+    if not edge_types:
+        return ""
+    edge_types = [edge_types] if isinstance(edge_types, str) else edge_types
+    invalid_types = [t for t in edge_types if t not in graph.edge_types]
+    if invalid_types:
+        raise ValueError(
+            f"Invalid edge type(s): {', '.join(invalid_types)}. "
+            f"Valid edge types are: {', '.join(sorted(graph.edge_types))}."
+        )
+    return "|".join(dict.fromkeys(edge_types))
+
+
+def _fetch_degrees(
+    graph_name: str, node_type: str, pattern: str, node_ids: List[str]
+) -> Dict[str, int]:
+    # Counting in a vertex accumulator keeps the nodes without edges, at degree 0, in the result.
+    gsql = f"""
+INTERPRET QUERY(SET<STRING> node_ids) FOR GRAPH {graph_name} {{
+  SumAccum<INT> @degree;
+  Nodes = to_vertex_set(node_ids, "{node_type}");
+  Connected = SELECT s FROM Nodes:s -({pattern})- :t ACCUM s.@degree += 1;
+  PRINT Nodes[Nodes.@degree AS degree];
+}}""".strip()
+    result = get_api().run_interpreted_query(gsql, {"node_ids": node_ids})
+    vertices = result[0].get("Nodes", []) if result else []
+    return {str(vertex["v_id"]): vertex["attributes"]["degree"] for vertex in vertices}
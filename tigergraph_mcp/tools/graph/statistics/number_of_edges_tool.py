@@ -10,9 +10,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import get_count_cache
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class NumberOfEdgesToolInput(BaseModel):
@@ -23,6 +23,9 @@ class NumberOfEdgesToolInput(BaseModel):
         None,
         description="The type of edges to count (optional). If omitted, counts all edges.",
     )
+    refresh: bool = Field(
+        False, description="Whether to count the edges in the database instead of the cache."
+    )
 
 
 tools = [
@@ -37,6 +40,11 @@ edge_type = "Friendship"  # Optional
 ```
 
 If `edge_type` is not provided, all edges will be counted.
+
+Counts are cached and kept up to date by the writes made through this server, so polling is
+cheap. The response says whether the count is exact or cached. After edges are added, a cached
+count is an upper bound, since edges that already existed may have been counted again. Set
+`refresh=True` to count in the database.
 """,
         inputSchema=NumberOfEdgesToolInput.model_json_schema(),
     )
@@ -46,12 +54,17 @@ If `edge_type` is not provided, all edges will be counted.
 async def number_of_edges(
     graph_name: str,
     edge_type: Optional[str] = None,
+    refresh: bool = False,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        count = graph.number_of_edges(edge_type)
-        message = f"🔗 Graph '{graph_name}' has {count} edge(s)" + (
-            f" of type '{edge_type}'." if edge_type else "."
+        graph = get_graph(graph_name)
+        count = get_count_cache().count(
+            graph_name, ("edge", edge_type), lambda: graph.number_of_edges(edge_type), refresh
+        )
+        message = (
+            f"🔗 Graph '{graph_name}' has {count.amount()} edge(s)"
+            + (f" of type '{edge_type}'" if edge_type else "")
+            + f" ({count.source()})."
         )
     except Exception as e:
         message = f"❌ Failed to count edges in graph '{graph_name}': {str(e)}"
@@ -10,9 +10,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import get_count_cache
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class NumberOfNodesToolInput(BaseModel):
@@ -23,6 +23,9 @@ class NumberOfNodesToolInput(BaseModel):
         None,
         description="The type of nodes to count (optional). If omitted, counts all nodes.",
     )
+    refresh: bool = Field(
+        False, description="Whether to count the nodes in the database instead of the cache."
+    )
 
 
 tools = [
@@ -37,6 +40,11 @@ node_type = "Person"  # Optional
 ```
 
 If `node_type` is not provided, all nodes will be counted.
+
+Counts are cached and kept up to date by the writes made through this server, so polling is
+cheap. The response says whether the count is exact or cached. After nodes are added, a cached
+count is an upper bound, since nodes that already existed may have been counted again. Set
+`refresh=True` to count in the database.
 """,
         inputSchema=NumberOfNodesToolInput.model_json_schema(),
     )
@@ -46,12 +54,17 @@ If `node_type` is not provided, all nodes will be counted.
 async def number_of_nodes(
     graph_name: str,
     node_type: Optional[str] = None,
+    refresh: bool = False,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        count = graph.number_of_nodes(node_type)
-        message = f"🔢 Graph '{graph_name}' has {count} node(s)" + (
-            f" of type '{node_type}'." if node_type else "."
+        graph = get_graph(graph_name)
+        count = get_count_cache().count(
+            graph_name, ("node", node_type), lambda: graph.number_of_nodes(node_type), refresh
+        )
+        message = (
+            f"🔢 Graph '{graph_name}' has {count.amount()} node(s)"
+            + (f" of type '{node_type}'" if node_type else "")
+            + f" ({count.source()})."
         )
     except Exception as e:
         message = f"❌ Failed to count nodes in graph '{graph_name}': {str(e)}"
@@ -0,0 +1,215 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import json
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+from tigergraphx import Graph
+
+from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import dumps
+from tigergraph_mcp.tools.query_templates import QueryTemplate, run_template
+
+NUMERIC_TYPES = {"INT", "UINT", "FLOAT", "DOUBLE"}
+PERCENTILES = (50, 90, 99)
+
+
+class ProfileToolInput(BaseModel):
+    """Input schema for profiling a TigerGraph graph."""
+
+    graph_name: str = Field(..., description="The name of the graph to profile.")
+    distinct_counts: bool = Field(
+        False,
+        description="Whether to count the distinct values of string attributes. The counts are "
+        "exact: the database holds every distinct value of every string attribute in memory "
+        "while the query runs, so avoid it on large graphs.",
+    )
+
+
+tools = [
+    Tool(
+        name=TigerGraphToolName.PROFILE,
+        description="""Profiles the data of a TigerGraph graph in a single query.
+
+Use this to get an overview of a graph instead of chaining `graph__get_schema`,
+`graph__number_of_nodes`, `graph__number_of_edges` and `graph__get_nodes` calls. All statistics
+are computed inside TigerGraph; the query is generated from the schema, and if the server installs
+generated queries, it is installed once it has been run a few times.
+
+Example input:
+```python
+graph_name = "SocialGraph"
+```
+
+The result is compact JSON with, per node type, the number of nodes and for each attribute:
+- numeric attributes: `min`, `max` and `mean`;
+- string attributes, if `distinct_counts` is set: the exact number of `distinct` values;
+- all of them: the number of nodes still holding the attribute's default value (`defaults`),
+  TigerGraph's equivalent of missing values.
+
+Per edge type, it gives the number of edges and the distribution of the degree of the source
+nodes (`min`, `mean`, percentiles `p50`, `p90`, `p99` and `max`).
+""",
+        inputSchema=ProfileToolInput.model_json_schema(),
+    )
+]
+
+
+async def profile(graph_name: str, distinct_counts: bool = False) -> List[TextContent]:
+    try:
+        graph = get_graph(graph_name)
+        query = _ProfileQuery(graph, distinct_counts)
+        result = run_template(query.template)
+        message = dumps(query.parse(result[0] if result else {}))
+    except Exception as e:
+        message = f"❌ Failed to profile graph '{graph_name}': {str(e)}"
+    return [TextContent(type="text", text=message)]
+
+
+class _ProfileQuery:
+    """The profiling query of a graph, and the mapping from its output back to the schema."""
+
+    def __init__(self, graph: Graph, distinct_counts: bool):
+        schema = graph.get_schema("dict")
+        self.node_types: Dict[str, str] = {}
+        # (node type, attribute) -> (output prefix, whether the attribute is numeric)
+        self.attributes: Dict[tuple, tuple] = {}
+        self.edge_types: Dict[str, tuple] = {}
+        self.distinct_counts = distinct_counts
+        declarations: List[str] = []
+        statements: List[str] = []
+
+        for i, (node_type, node_schema) in enumerate(schema["nodes"].items()):
+            count = f"n{i}"
+            self.node_types[node_type] = count
+            declarations.append(f"SumAccum<INT> @@{count};")
+            accum = [f"@@{count} += 1"]
+            for j, (attr, attr_schema) in enumerate(node_schema["attributes"].items()):
+                data_type = getattr(attr_schema["data_type"], "value", attr_schema["data_type"])
+                if attr == node_schema["primary_key"] or (
+                    data_type not in NUMERIC_TYPES and data_type != "STRING"
+                ):
+                    continue
+                prefix = f"n{i}_a{j}"
+                numeric = data_type in NUMERIC_TYPES
+                self.attributes[(node_type, attr)] = (prefix, numeric)
+                default = attr_schema.get("default_value")
+                if numeric:
+                    declarations += [
+                        f"MinAccum<DOUBLE> @@{prefix}_min;",
+                        f"MaxAccum<DOUBLE> @@{prefix}_max;",
+                        f"SumAccum<DOUBLE> @@{prefix}_sum;",
+                    ]
+                    accum += [
+                        f"@@{prefix}_min += s.{attr}",
+                        f"@@{prefix}_max += s.{attr}",
+                        f"@@{prefix}_sum += s.{attr}",
+                    ]
+                    default_literal = str(default if default is not None else 0)
+                else:
+                    if distinct_counts:
+                        declarations.append(f"SetAccum<STRING> @@{prefix}_distinct;")
+                        accum.append(f"@@{prefix}_distinct += s.{attr}")
+                    default_literal = json.dumps(default if default is not None else "")
+                declarations.append(f"SumAccum<INT> @@{prefix}_defaults;")
+                accum.append(f"IF s.{attr} == {default_literal} THEN @@{prefix}_defaults += 1 END")
+            statements += [
+                f"N{i} = {{{node_type}.*}};",
+                f"N{i} = SELECT s FROM N{i}:s ACCUM {', '.join(accum)};",
+            ]
+
+        for k, (edge_type, edge_schema) in enumerate(schema["edges"].items()):
+            source = edge_schema["from_node_type"]
+            # An undirected edge between two nodes of the source type is seen from both ends.
+            seen_twice = (
+                not edge_schema.get("is_directed_edge", True)
+                and edge_schema["to_node_type"] == source
+            )
+            self.edge_types[edge_type] = (f"e{k}", source, seen_twice)
+            declarations += [
+                f"SumAccum<INT> @d{k};",
+                f"MapAccum<INT, SumAccum<INT>> @@e{k};",
+            ]
+            statements += [
+                f"E{k} = {{{source}.*}};",
+                f"E{k} = SELECT s FROM E{k}:s -({edge_type})- :t ACCUM s.@d{k} += 1 "
+                f"POST-ACCUM @@e{k} += (s.@d{k} -> 1);",
+            ]
+
+        outputs = [
+            declaration.split()[-1].strip("@;")
+            for declaration in declarations
+            if "@@" in declaration
+        ]
+        # Only the sizes of the distinct value sets leave the database.
+        prints = ", ".join(
+            f"@@{output}.size() AS {output}"
+            if output.endswith("_distinct")
+            else f"@@{output} AS {output}"
+            for output in outputs
+        )
+        body = "\n".join(f"  {line}" for line in declarations + statements)
+        body += f"\n  PRINT {prints};" if outputs else ""
+        self.template = QueryTemplate(graph.name, "profile", "", body)
+
+    def parse(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        counts = {node_type: row.get(name, 0) for node_type, name in self.node_types.items()}
+        nodes: Dict[str, Any] = {
+            node_type: {"count": count, "attributes": {}} for node_type, count in counts.items()
+        }
+        for (node_type, attr), (prefix, numeric) in self.attributes.items():
+            count = counts[node_type]
+            stats: Dict[str, Any] = {}
+            if numeric:
+                stats["min"] = row.get(f"{prefix}_min") if count else None
+                stats["max"] = row.get(f"{prefix}_max") if count else None
+                stats["mean"] = _round(row.get(f"{prefix}_sum", 0) / count) if count else None
+            elif self.distinct_counts:
+                stats["distinct"] = row.get(f"{prefix}_distinct", 0)
+            stats["defaults"] = row.get(f"{prefix}_defaults", 0)
+            nodes[node_type]["attributes"][attr] = stats
+
+        edges: Dict[str, Any] = {}
+        for edge_type, (name, source, seen_twice) in self.edge_types.items():
+            histogram = {int(degree): n for degree, n in row.get(name, {}).items()}
+            connected = sum(histogram.values())
+            histogram[0] = histogram.get(0, 0) + max(counts.get(source, 0) - connected, 0)
+            total = sum(degree * n for degree, n in histogram.items())
+            edges[edge_type] = {
+                "count": total // 2 if seen_twice else total,
+                "source_node_type": source,
+                "degree": _degree_stats(histogram),
+            }
+        return {"nodes": nodes, "edges": edges}
+
+
+def _degree_stats(histogram: Dict[int, int]) -> Optional[Dict[str, Any]]:
+    nodes = sum(histogram.values())
+    if not nodes:
+        return None
+    degrees = sorted(degree for degree, n in histogram.items() if n)
+    stats: Dict[str, Any] = {
+        "min": degrees[0],
+        "mean": _round(sum(degree * n for degree, n in histogram.items()) / nodes),
+    }
+    for percentile in PERCENTILES:
+        rank = percentile / 100 * nodes
+        seen = 0
+        for degree in degrees:
+            seen += histogram[degree]
+            if seen >= rank:
+                stats[f"p{percentile}"] = degree
+                break
+    stats["max"] = degrees[-1]
+    return stats
+
+
+def _round(value: float) -> float:
+    return round(value, 4)
@@ -3,9 +3,8 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
-
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
 
 
 class FetchNodeToolInput(BaseModel):
@@ -51,7 +50,7 @@ async def fetch_node(
     node_type: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         if vector_attribute_name is None:
             return [
                 TextContent(
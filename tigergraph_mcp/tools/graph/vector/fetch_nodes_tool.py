@@ -3,8 +3,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
 
 
 class FetchNodesToolInput(BaseModel):
@@ -22,6 +23,7 @@ class FetchNodesToolInput(BaseModel):
     node_type: Optional[str] = Field(
         None, description="The type of the nodes (optional)."
     )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
 
 
 tools = [
@@ -51,9 +53,10 @@ async def fetch_nodes(
     node_ids: List[str] | List[int],
     vector_attribute_name: Optional[str] = None,
     node_type: Optional[str] = None,
+    output_format: Optional[OutputFormat] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         if not vector_attribute_name:
             return [
                 TextContent(
@@ -67,7 +70,9 @@ async def fetch_nodes(
             vector_attribute_name=vector_attribute_name,
             node_type=node_type,
         )
-        if not vectors:
+        if use_json(output_format):
+            message = dumps(vectors)
+        elif not vectors:
             message = f"⚠️ No vectors found for the specified node IDs in graph '{graph_name}'."
         else:
             formatted = "\n".join(
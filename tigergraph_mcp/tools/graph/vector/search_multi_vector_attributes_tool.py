@@ -3,8 +3,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
 
 
 class SearchMultiVectorAttributesInput(BaseModel):
@@ -27,6 +28,7 @@ class SearchMultiVectorAttributesInput(BaseModel):
         None,
         description="List of attributes to return per node type (optional).",
     )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
 
 
 tools = [
@@ -93,9 +95,10 @@ async def search_multi_vector_attributes(
     node_types: Optional[List[str]] = None,
     limit: int = 10,
     return_attributes_list: Optional[List[List[str]]] = None,
+    output_format: Optional[OutputFormat] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         results = graph.search_multi_vector_attributes(
             data=data,
             vector_attribute_names=vector_attribute_names,
@@ -103,7 +106,9 @@ async def search_multi_vector_attributes(
             limit=limit,
             return_attributes_list=return_attributes_list,
         )
-        if not results:
+        if use_json(output_format):
+            message = dumps(results)
+        elif not results:
             message = f"⚠️ No similar nodes found in graph '{graph_name}'."
         else:
             formatted = "\n".join(str(entry) for entry in results)
@@ -3,8 +3,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
 
 
 class SearchToolInput(BaseModel):
@@ -29,6 +30,7 @@ class SearchToolInput(BaseModel):
     candidate_ids: Optional[Set[str]] = Field(
         None, description="Specific node IDs to limit the search to (optional)."
     )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
 
 
 tools = [
@@ -64,9 +66,10 @@ async def search(
     limit: int = 10,
     return_attributes: Optional[str | List[str]] = None,
     candidate_ids: Optional[Set[str]] = None,
+    output_format: Optional[OutputFormat] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         results = graph.search(
             data=data,
             vector_attribute_name=vector_attribute_name,
@@ -75,7 +78,9 @@ async def search(
             return_attributes=return_attributes,
             candidate_ids=candidate_ids,
         )
-        if not results:
+        if use_json(output_format):
+            message = dumps(results)
+        elif not results:
             message = f"⚠️ No similar nodes found in graph '{graph_name}'."
         else:
             formatted = "\n".join(str(entry) for entry in results)
@@ -3,8 +3,9 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.output import OUTPUT_FORMAT_DESCRIPTION, OutputFormat, dumps, use_json
 
 
 class SearchTopKSimilarNodesInput(BaseModel):
@@ -23,6 +24,7 @@ class SearchTopKSimilarNodesInput(BaseModel):
     return_attributes: Optional[List[str]] = Field(
         None, description="List of attributes to include in the results (optional)."
     )
+    output_format: Optional[OutputFormat] = Field(None, description=OUTPUT_FORMAT_DESCRIPTION)
 
 
 tools = [
@@ -55,9 +57,10 @@ async def search_top_k_similar_nodes(
     node_type: Optional[str] = None,
     limit: int = 5,
     return_attributes: Optional[List[str]] = None,
+    output_format: Optional[OutputFormat] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
+        graph = get_graph(graph_name)
         results = graph.search_top_k_similar_nodes(
             node_id=node_id,
             vector_attribute_name=vector_attribute_name,
@@ -65,7 +68,9 @@ async def search_top_k_similar_nodes(
             limit=limit,
             return_attributes=return_attributes,
         )
-        if not results:
+        if use_json(output_format):
+            message = dumps(results)
+        elif not results:
             message = f"⚠️ No similar nodes found for node '{node_id}' in graph '{graph_name}'."
         else:
             formatted = "\n".join(str(entry) for entry in results)
@@ -3,8 +3,17 @@ from pydantic import Field
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel
 
-from tigergraphx import Graph
 from tigergraph_mcp.tools import TigerGraphToolName
+from tigergraph_mcp.tools.count_cache import record_nodes_added
+from tigergraph_mcp.tools.graph_cache import get_graph
+from tigergraph_mcp.tools.graph.bulk.upsert_pipeline import resolve_node_type
+from tigergraph_mcp.tools.graph.bulk.columnar import (
+    ARROW_IPC_DESCRIPTION,
+    Column,
+    add_nodes_columnar,
+    columns_description,
+    primary_key,
+)
 
 
 class UpsertToolInput(BaseModel):
@@ -13,12 +22,21 @@ class UpsertToolInput(BaseModel):
     graph_name: str = Field(
         ..., description="The name of the graph where the nodes will be upserted."
     )
-    data: Dict | List[Dict] = Field(
-        ..., description="Single record or list of records to upsert."
+    data: Optional[Dict | List[Dict]] = Field(
+        None,
+        description="Single record or list of records to upsert. "
+        "Required unless `columns` or `arrow_ipc` is given.",
     )
     node_type: Optional[str] = Field(
         None, description="The node type for the upsert operation (optional)."
     )
+    columns: Optional[Dict[str, Column]] = Field(
+        None,
+        description=columns_description(
+            "The column named after the node type's primary key holds the node IDs."
+        ),
+    )
+    arrow_ipc: Optional[str] = Field(None, description=ARROW_IPC_DESCRIPTION)
 
 
 tools = [
@@ -42,6 +60,15 @@ data = [
     {"name": "Emily", "age": 28, "gender": "Female", "emb_1": [0.7, 0.8, 0.9]},
 ]
 ```
+
+Columnar input, for large numbers of records:
+```python
+columns = {
+    "name": ["Mike", "Emily"],
+    "age": [29, 28],
+    "emb_1": {"dtype": "float32", "data": "<base64>", "shape": [2, 3]},
+}
+```
 """,
         inputSchema=UpsertToolInput.model_json_schema(),
     )
@@ -50,15 +77,31 @@ data = [
 
 async def upsert(
     graph_name: str,
-    data: Dict | List[Dict],
+    data: Optional[Dict | List[Dict]] = None,
     node_type: Optional[str] = None,
+    columns: Optional[Dict[str, Column]] = None,
+    arrow_ipc: Optional[str] = None,
 ) -> List[TextContent]:
     try:
-        graph = Graph.from_db(graph_name)
-        result = graph.upsert(data=data, node_type=node_type)
-        message = (
-            f"✅ Successfully upserted {result} node(s) into graph '{graph_name}'."
-        )
+        if (data is None) == (columns is None and arrow_ipc is None):
+            raise ValueError(
+                "Provide either `data`, or columnar input in `columns` or `arrow_ipc`."
+            )
+        graph = get_graph(graph_name)
+        if data is None:
+            node_type, id_column = primary_key(graph, node_type)
+            message = add_nodes_columnar(
+                graph, node_type, columns, arrow_ipc, id_column=id_column
+            ).message(
+                lambda count: f"upserted {count} node(s) into graph '{graph_name}'",
+                f"upsert data into graph '{graph_name}'",
+            )
+        else:
+            result = graph.upsert(data=data, node_type=node_type)
+            record_nodes_added(graph_name, resolve_node_type(graph, node_type), result or 0)
+            message = (
+                f"✅ Successfully upserted {result} node(s) into graph '{graph_name}'."
+            )
     except Exception as e:
         message = f"❌ Failed to upsert data into graph '{graph_name}': {str(e)}"
     return [TextContent(type="text", text=message)]
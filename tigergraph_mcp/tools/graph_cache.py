@@ -0,0 +1,87 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from tigergraphx import Graph
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools.connection_pool import ConnectionConfig, connection_profile
+
+logger = logging.getLogger(__name__)
+
+
+class GraphCache:
+    """Process-wide cache of `Graph` handles keyed by graph name and connection profile.
+
+    `Graph.from_db` fetches and parses the full schema from the server, so reusing the handle
+    across tool calls removes that round-trip from every request. Entries expire after `ttl`
+    seconds and can be dropped explicitly whenever the schema is known to have changed.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, Graph]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        graph_name: str,
+        tigergraph_connection_config: Optional[ConnectionConfig] = None,
+        refresh: bool = False,
+    ) -> Graph:
+        if self.ttl <= 0:
+            return Graph.from_db(graph_name, tigergraph_connection_config)
+
+        key = (graph_name, connection_profile(tigergraph_connection_config))
+        if not refresh:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+
+        logger.debug(f"Loading graph handle for '{graph_name}' from the database.")
+        graph = Graph.from_db(graph_name, tigergraph_connection_config)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), graph)
+        return graph
+
+    def invalidate(self, graph_name: Optional[str] = None) -> None:
+        """Drop cached handles for `graph_name` under every profile, or all handles if omitted."""
+        with self._lock:
+            if graph_name is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == graph_name]:
+                    del self._entries[key]
+
+
+_graph_cache: Optional[GraphCache] = None
+_graph_cache_lock = threading.Lock()
+
+
+def get_graph_cache() -> GraphCache:
+    global _graph_cache
+    with _graph_cache_lock:
+        if _graph_cache is None:
+            _graph_cache = GraphCache(ttl=get_config().graph_cache_ttl)
+        return _graph_cache
+
+
+def get_graph(
+    graph_name: str,
+    tigergraph_connection_config: Optional[ConnectionConfig] = None,
+    refresh: bool = False,
+) -> Graph:
+    return get_graph_cache().get(graph_name, tigergraph_connection_config, refresh=refresh)
+
+
+def invalidate_graph(graph_name: Optional[str] = None) -> None:
+    get_graph_cache().invalidate(graph_name)
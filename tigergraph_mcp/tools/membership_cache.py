@@ -0,0 +1,126 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Iterable, List, Optional, Set, Tuple
+
+from tigergraph_mcp.config import get_config
+
+# Cached node IDs are keyed by ("node", node_type), cached edges, as (source ID, target ID)
+# pairs, by ("edge", src_node_type, edge_type, tgt_node_type).
+MembershipKey = Tuple[str, ...]
+
+
+class MembershipCache:
+    """Process-wide record of the node IDs and edges known to exist, per graph and type.
+
+    Only presence is cached: members found missing are checked again on every call, since they
+    may be added at any time. Known members are trusted until they are removed through this
+    server (`remove_node`, `clear_graph_data`, ...) or their type's entry expires after `ttl`
+    seconds, which bounds how long a removal made by another client can go unnoticed. The total
+    number of members is capped at `max_entries`, evicting the least recently used types first.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._size = 0
+        self._entries: OrderedDict[Tuple[str, MembershipKey], Tuple[float, Set[Hashable]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def partition(
+        self, graph_name: str, key: MembershipKey, members: Iterable[Hashable]
+    ) -> Tuple[Set[Hashable], List[Hashable]]:
+        """Split `members` into those known to exist and those that must be checked."""
+        members = list(members)
+        with self._lock:
+            entry = self._entries.get((graph_name, key))
+            if entry is not None and time.monotonic() >= entry[0]:
+                self._remove((graph_name, key))
+                entry = None
+            if entry is None:
+                return set(), members
+            self._entries.move_to_end((graph_name, key))
+            known = entry[1]
+            return {m for m in members if m in known}, [m for m in members if m not in known]
+
+    def add(self, graph_name: str, key: MembershipKey, members: Iterable[Hashable]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._entries.get((graph_name, key))
+            if entry is None or time.monotonic() >= entry[0]:
+                if entry is not None:
+                    self._remove((graph_name, key))
+                entry = self._entries[(graph_name, key)] = (time.monotonic() + self.ttl, set())
+            known = entry[1]
+            before = len(known)
+            known.update(members)
+            self._size += len(known) - before
+            self._entries.move_to_end((graph_name, key))
+            while self._size > self.max_entries and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def discard_node(self, graph_name: str, node_type: str, node_id: str) -> None:
+        """Forget a removed node, along with the cached edges of its type, which went with it."""
+        self.discard_nodes(graph_name, node_type, [node_id])
+
+    def discard_nodes(
+        self, graph_name: str, node_type: str, node_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """Forget removed nodes, or every node of the type if `node_ids` is None, along with the
+        cached edges of their type."""
+        with self._lock:
+            node_key = (graph_name, ("node", node_type))
+            entry = self._entries.get(node_key)
+            if entry is not None and node_ids is None:
+                self._remove(node_key)
+            elif entry is not None:
+                before = len(entry[1])
+                entry[1].difference_update(node_ids)
+                self._size -= before - len(entry[1])
+            for cached_graph, key in list(self._entries):
+                if cached_graph == graph_name and key[0] == "edge" and node_type in key[1::2]:
+                    self._remove((cached_graph, key))
+
+    def invalidate(self, graph_name: Optional[str] = None) -> None:
+        """Forget everything known about `graph_name`, or about every graph if omitted."""
+        with self._lock:
+            for cached_graph, key in list(self._entries):
+                if graph_name in (None, cached_graph):
+                    self._remove((cached_graph, key))
+
+    def _remove(self, entry_key: Tuple[str, MembershipKey]) -> None:
+        _, known = self._entries.pop(entry_key)
+        self._size -= len(known)
+
+
+_membership_cache: Optional[MembershipCache] = None
+_membership_cache_lock = threading.Lock()
+
+
+def get_membership_cache() -> MembershipCache:
+    global _membership_cache
+    with _membership_cache_lock:
+        if _membership_cache is None:
+            config = get_config()
+            _membership_cache = MembershipCache(
+                config.membership_cache_size, config.membership_cache_ttl
+            )
+        return _membership_cache
+
+
+def invalidate_membership(graph_name: Optional[str] = None) -> None:
+    get_membership_cache().invalidate(graph_name)
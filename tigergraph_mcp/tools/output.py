@@ -0,0 +1,40 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import json
+from typing import Any, Literal, Optional
+
+from tigergraph_mcp.config import get_config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+OutputFormat = Literal["text", "json"]
+
+OUTPUT_FORMAT_DESCRIPTION = (
+    "How to return the results: 'text' lists one result per line, 'json' returns them as a "
+    "single compact JSON document that is smaller and can be parsed directly. Defaults to the "
+    "server's TG_MCP_OUTPUT_FORMAT setting."
+)
+
+
+def use_json(output_format: Optional[OutputFormat]) -> bool:
+    """Return whether results should be rendered as JSON, falling back to the server default."""
+    return (output_format or get_config().output_format) == "json"
+
+
+def dumps(value: Any) -> str:
+    """Serialize `value` to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
@@ -0,0 +1,312 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Generated GSQL queries that are installed once they are used repeatedly.
+
+Tools that compile their request to GSQL describe the query as a `QueryTemplate`: a parameter
+list and a body that depend only on the shape of the request, with every value passed as a
+query parameter. The template is named after a hash of its text, so all calls of one shape map
+to the same query. When installation is enabled, each call counts a use of its shape, for up to
+`MAX_COUNTED_SHAPES` recently used shapes. Until the query is installed, calls run it in
+interpreted mode, and the call that brings a shape to `query_template_threshold` uses schedules
+its installation in the background; later calls run the installed query, which TigerGraph does
+not have to parse and plan again. Shapes used only a few times are never
+installed, since installing a query takes far longer than interpreting it a few times.
+Installation happens on a single thread, as TigerGraph installs queries one at a time anyway.
+
+Installing changes the user's query catalog, so it is off unless `install_generated_queries` is
+set. Even then, at most `max_generated_queries` queries are installed per graph; they are dropped
+when the graph's schema changes and when the server shuts down. A query that fails to install is
+retried after a delay that doubles with each failure.
+
+Expressions written by the client, such as filters, are part of a template with their literals
+lifted into parameters, so that calls differing only in the values they compare against share
+one installed query. Interpreted runs keep the literals inline: unlike a typed parameter, a
+literal is converted by TigerGraph to whatever type it is compared with. If the lifted form does
+not type-check, installing it fails and the template keeps running in interpreted mode.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools.connection_pool import get_api
+
+logger = logging.getLogger(__name__)
+
+_INSTALLING = "installing"
+_INSTALLED = "installed"
+_FAILED = "failed"
+
+# Delay before retrying a failed installation, doubled with each failure up to the maximum.
+RETRY_DELAY = 60.0
+MAX_RETRY_DELAY = 3600.0
+
+# Maximum number of shapes whose uses are counted; the least recently used are forgotten first.
+MAX_COUNTED_SHAPES = 1000
+
+# String literals in double or single quotes, and unsigned numbers that are not part of an
+# identifier or of an attribute access.
+_LITERAL = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|(?<![\w.@$])\d+(\.\d+)?(?:[eE][-+]?\d+)?(?![\w.])'
+)
+_ESCAPE = re.compile(r"\\(.)")
+
+# A lifted literal: its parameter's GSQL type and its value.
+LiftedLiteral = Tuple[str, Any]
+
+
+class QueryTemplate:
+    """A generated query, with the literals of client expressions lifted into parameters.
+
+    `body` is the body run once installed; `interpreted_body`, which defaults to it, is the body
+    run in interpreted mode, with the literals inline.
+    """
+
+    def __init__(
+        self,
+        graph_name: str,
+        prefix: str,
+        parameters: str,
+        body: str,
+        interpreted_body: Optional[str] = None,
+        literals: Optional[Dict[str, LiftedLiteral]] = None,
+    ):
+        self.graph_name = graph_name
+        self.parameters = parameters
+        self.body = body.strip("\n")
+        self.interpreted_body = (interpreted_body or body).strip("\n")
+        self.literals = literals or {}
+        declarations = [parameters] if parameters else []
+        declarations += [f"{gsql_type} {name}" for name, (gsql_type, _) in self.literals.items()]
+        self.installed_parameters = ", ".join(declarations)
+        digest = hashlib.sha1(
+            f"{graph_name}\n{self.installed_parameters}\n{self.body}".encode()
+        ).hexdigest()
+        self.name = f"mcp_{prefix}_{digest[:12]}"
+
+    @classmethod
+    def render(
+        cls,
+        graph_name: str,
+        prefix: str,
+        parameters: str,
+        render: Callable[..., str],
+        *expressions: Optional[str],
+    ) -> "QueryTemplate":
+        """Build the template of `render(*expressions)`, lifting the literals of `expressions`."""
+        lifted, literals = lift_literals(expressions)
+        return cls(graph_name, prefix, parameters, render(*lifted), render(*expressions), literals)
+
+    def literal_values(self) -> Dict[str, Any]:
+        return {name: value for name, (_, value) in self.literals.items()}
+
+    def interpreted(self) -> str:
+        return (
+            f"INTERPRET QUERY({self.parameters}) FOR GRAPH {self.graph_name} "
+            f"{{\n{self.interpreted_body}\n}}"
+        )
+
+    def create_statement(self) -> str:
+        return (
+            f"CREATE QUERY {self.name}({self.installed_parameters}) FOR GRAPH {self.graph_name} "
+            f"{{\n{self.body}\n}}"
+        )
+
+
+def lift_literals(
+    expressions: Sequence[Optional[str]],
+) -> Tuple[List[Optional[str]], Dict[str, LiftedLiteral]]:
+    """Replace the string and number literals of `expressions` with parameters `lit_0`, ...
+
+    Returns the rewritten expressions and the type and value of each parameter. Expressions
+    that are None stay None.
+    """
+    literals: Dict[str, LiftedLiteral] = {}
+
+    def lift(match: re.Match) -> str:
+        text = match.group(0)
+        name = f"lit_{len(literals)}"
+        if text[0] in "\"'":
+            literals[name] = ("STRING", _ESCAPE.sub(r"\1", text[1:-1]))
+        elif match.group(1) is None and "e" not in text.lower():
+            literals[name] = ("INT", int(text))
+        else:
+            literals[name] = ("DOUBLE", float(text))
+        return name
+
+    lifted = [None if e is None else _LITERAL.sub(lift, e) for e in expressions]
+    return lifted, literals
+
+
+class QueryTemplateManager:
+    """Tracks which query templates are installed and runs each one the fastest available way."""
+
+    def __init__(self, install: bool, threshold: int = 1, max_queries: Optional[int] = None):
+        self.install = install
+        self.threshold = threshold
+        self.max_queries = max_queries
+        self._states: Dict[Tuple[str, str], str] = {}
+        self._uses: OrderedDict[Tuple[str, str], int] = OrderedDict()
+        self._failures: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._installer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tigergraph-mcp-install"
+        )
+
+    def run(self, template: QueryTemplate, params: Optional[Dict[str, Any]] = None) -> List:
+        """Run `template`, installed if it is, in interpreted mode otherwise."""
+        result = self.run_installed(template, params)
+        if result is not None:
+            return result
+        return get_api().run_interpreted_query(template.interpreted(), params or {})
+
+    def run_installed(
+        self, template: QueryTemplate, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[List]:
+        """Count a use of `template` and run it if it is installed; return None otherwise, for
+        the caller to run the query its own way."""
+        key = (template.graph_name, template.name)
+        with self._lock:
+            state = self._states.get(key)
+            if state == _FAILED and time.monotonic() >= self._failures[key][1]:
+                del self._states[key]
+                state = None
+            if state is None and self.install:
+                uses = self._uses.pop(key, 0) + 1
+                self._uses[key] = uses
+                if len(self._uses) > MAX_COUNTED_SHAPES:
+                    self._uses.popitem(last=False)
+                if uses >= self.threshold and self._has_room(key[0]):
+                    self._states[key] = _INSTALLING
+                    self._installer.submit(self._install, template)
+        if state != _INSTALLED:
+            return None
+        try:
+            return get_api().run_installed_query_get(
+                template.graph_name,
+                template.name,
+                {**(params or {}), **template.literal_values()},
+            )
+        except Exception as e:
+            # The query may have been dropped, or invalidated by a schema change.
+            logger.warning(f"Installed query '{template.name}' failed, reinstalling: {e}")
+            with self._lock:
+                self._states.pop(key, None)
+            return None
+
+    def invalidate(self, graph_name: Optional[str] = None, drop_queries: bool = True) -> None:
+        """Forget the state of the queries of `graph_name`, or of every graph if omitted, and
+        drop the installed ones from the database unless `drop_queries` is False."""
+        installed = []
+        with self._lock:
+            for key in [key for key in self._uses if graph_name in (None, key[0])]:
+                del self._uses[key]
+            for key in list(self._states):
+                if graph_name in (None, key[0]) and self._states[key] != _INSTALLING:
+                    if self._states.pop(key) == _INSTALLED:
+                        installed.append(key)
+                    self._failures.pop(key, None)
+        if drop_queries and installed:
+            self._installer.submit(self._drop, installed)
+
+    def close(self) -> None:
+        """Stop installing queries and drop the installed ones from the database."""
+        self.install = False
+        # Wait for a running installation, so that its query is dropped too.
+        self._installer.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            installed = [key for key, state in self._states.items() if state == _INSTALLED]
+            self._states.clear()
+            self._uses.clear()
+        self._drop(installed)
+
+    def _has_room(self, graph_name: str) -> bool:
+        if self.max_queries is None:
+            return True
+        taken = sum(
+            1
+            for (graph, _), state in self._states.items()
+            if graph == graph_name and state in (_INSTALLING, _INSTALLED)
+        )
+        return taken < self.max_queries
+
+    def _install(self, template: QueryTemplate) -> None:
+        key = (template.graph_name, template.name)
+        api = get_api()
+        try:
+            existing = {
+                query.get("name"): query.get("installed")
+                for query in api.get_query_info(template.graph_name)
+            }
+            if template.name not in existing:
+                api.create_query(template.graph_name, template.create_statement())
+            if not existing.get(template.name):
+                result = api.install_query(template.graph_name, template.name)
+                if "Query installed successfully" not in result:
+                    raise RuntimeError(result)
+            state = _INSTALLED
+            logger.info(f"Installed generated query '{template.name}'.")
+        except Exception as e:
+            # Failed queries keep running in interpreted mode until the retry.
+            state = _FAILED
+            logger.warning(f"Failed to install generated query '{template.name}': {e}")
+        with self._lock:
+            if state == _FAILED:
+                failures = self._failures.get(key, (0, 0.0))[0] + 1
+                delay = min(RETRY_DELAY * 2 ** (failures - 1), MAX_RETRY_DELAY)
+                self._failures[key] = (failures, time.monotonic() + delay)
+            else:
+                self._failures.pop(key, None)
+            self._states[key] = state
+
+    def _drop(self, keys: List[Tuple[str, str]]) -> None:
+        for graph_name, query_name in keys:
+            try:
+                get_api().drop_query(graph_name, query_name)
+                logger.info(f"Dropped generated query '{query_name}'.")
+            except Exception as e:
+                logger.warning(f"Failed to drop generated query '{query_name}': {e}")
+
+
+_query_templates: Optional[QueryTemplateManager] = None
+_query_templates_lock = threading.Lock()
+
+
+def get_query_templates() -> QueryTemplateManager:
+    global _query_templates
+    with _query_templates_lock:
+        if _query_templates is None:
+            config = get_config()
+            _query_templates = QueryTemplateManager(
+                config.install_generated_queries,
+                config.query_template_threshold,
+                config.max_generated_queries,
+            )
+        return _query_templates
+
+
+def run_template(template: QueryTemplate, params: Optional[Dict[str, Any]] = None) -> List:
+    return get_query_templates().run(template, params)
+
+
+def invalidate_query_templates(graph_name: Optional[str] = None, drop_queries: bool = True) -> None:
+    get_query_templates().invalidate(graph_name, drop_queries)
+
+
+def close_query_templates() -> None:
+    """Drop the generated queries installed by this process, if any."""
+    with _query_templates_lock:
+        query_templates = _query_templates
+    if query_templates is not None:
+        query_templates.close()
@@ -0,0 +1,249 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Per-response size budget for tools that can return large results.
+
+Rows are admitted in order until the next one would exceed the row or byte budget. From then
+on, rows are no longer kept: they only feed a summary (row count, per-attribute statistics and
+most frequent values) that is updated one row at a time, so an oversized result is never
+buffered twice or rendered in full.
+
+The budget bounds the size of a response, not the work behind it: the tools apply it to results
+that TigerGraph has already computed and returned in full, so that the summary covers all rows.
+Bounding the work is up to the request, with a limit or pagination.
+"""
+
+import math
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from tigergraph_mcp.config import get_config
+from tigergraph_mcp.tools.output import dumps
+
+RowFields = Callable[[Any], Mapping[str, Any]]
+
+# Bound the memory used by a summary, whatever the shape of the result.
+MAX_SUMMARY_ATTRIBUTES = 32
+MIN_TRACKED_VALUES = 64
+
+
+def row_fields(row: Any) -> Mapping[str, Any]:
+    """Return the attributes summarized for a row returned by TigerGraph."""
+    if isinstance(row, Mapping):
+        attributes = row.get("attributes")
+        if isinstance(attributes, Mapping):
+            # A vertex or edge printed by a GSQL query.
+            fields = {key: row[key] for key in ("v_type", "e_type") if key in row}
+            fields.update(attributes)
+            return fields
+        return row
+    return {"value": row}
+
+
+class TopValues:
+    """Approximate most frequent values of a stream in bounded memory (space-saving).
+
+    Counts are exact as long as the number of distinct values does not exceed `capacity`.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._counts: Dict[Hashable, int] = {}
+
+    def add(self, value: Hashable) -> None:
+        if value in self._counts:
+            self._counts[value] += 1
+        elif len(self._counts) < self.capacity:
+            self._counts[value] = 1
+        else:
+            # Replace the least frequent value, inheriting its count as the error bound.
+            evicted = min(self._counts, key=self._counts.__getitem__)
+            self._counts[value] = self._counts.pop(evicted) + 1
+
+    def most_common(self, k: int) -> List[Tuple[Hashable, int]]:
+        return sorted(self._counts.items(), key=lambda item: item[1], reverse=True)[:k]
+
+
+class AttributeSummary:
+    def __init__(self, top_k: int):
+        self.top_k = top_k
+        self.count = 0
+        self.nulls = 0
+        self.numeric = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._sum = 0.0
+        self._top_values = TopValues(max(MIN_TRACKED_VALUES, top_k * 10))
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+        if value is None:
+            self.nulls += 1
+            return
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if math.isfinite(value):
+                self.numeric += 1
+                self._sum += value
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        try:
+            self._top_values.add(value)
+        except TypeError:
+            pass  # Lists and maps are counted, but not tracked as values.
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._sum / self.numeric if self.numeric else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"count": self.count, "nulls": self.nulls}
+        if self.numeric:
+            summary.update(min=self.min, max=self.max, mean=self.mean)
+        summary["top_values"] = self._top_values.most_common(self.top_k)
+        return summary
+
+    def describe(self) -> str:
+        parts = [f"{self.count} values"]
+        if self.nulls:
+            parts.append(f"{self.nulls} null")
+        if self.numeric:
+            parts.append(f"min {self.min}, max {self.max}, mean {self.mean:.4g}")
+        top_values = self._top_values.most_common(self.top_k)
+        if top_values:
+            parts.append("top: " + ", ".join(f"{value!r} ({n})" for value, n in top_values))
+        return "; ".join(parts)
+
+
+class ResultSummary:
+    """Summary statistics over a stream of rows, updated one row at a time."""
+
+    def __init__(self, top_k: int, fields: RowFields = row_fields):
+        self.top_k = top_k
+        self.fields = fields
+        self.rows = 0
+        self.attributes: Dict[str, AttributeSummary] = {}
+
+    def add(self, row: Any) -> None:
+        self.rows += 1
+        for name, value in self.fields(row).items():
+            attribute = self.attributes.get(name)
+            if attribute is None:
+                if len(self.attributes) >= MAX_SUMMARY_ATTRIBUTES:
+                    continue
+                attribute = self.attributes[name] = AttributeSummary(self.top_k)
+            attribute.add(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "attributes": {name: attr.to_dict() for name, attr in self.attributes.items()},
+        }
+
+    def describe(self) -> str:
+        lines = [f"- {name}: {attr.describe()}" for name, attr in self.attributes.items()]
+        return "\n".join(lines)
+
+
+class ResultBudget:
+    """Keeps the leading rows of a result that fit in `max_rows` rows and `max_bytes` bytes.
+
+    A budget of 0 disables the corresponding limit. One budget can be shared by several calls
+    to `take`, e.g. for the vertex sets printed by one query.
+    """
+
+    def __init__(self, max_rows: int, max_bytes: int, top_k: int, fields: RowFields = row_fields):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.top_k = top_k
+        self.fields = fields
+        self.kept_rows = 0
+        self.kept_bytes = 0
+        self._kept: List[Any] = []
+        self._summary: Optional[ResultSummary] = None
+
+    @classmethod
+    def from_config(cls, fields: RowFields = row_fields) -> "ResultBudget":
+        config = get_config()
+        return cls(
+            config.max_response_rows,
+            config.max_response_bytes,
+            config.summary_top_k,
+            fields=fields,
+        )
+
+    @property
+    def truncated(self) -> bool:
+        return self._summary is not None
+
+    @property
+    def total_rows(self) -> int:
+        return self._summary.rows if self._summary is not None else self.kept_rows
+
+    @property
+    def summary(self) -> Optional[ResultSummary]:
+        return self._summary
+
+    def take(self, rows: Iterable[Any]) -> List[Any]:
+        """Return the rows of `rows` that fit in the remaining budget, summarizing the rest."""
+        kept = []
+        for row in rows:
+            if self._summary is None and self._admit(row):
+                kept.append(row)
+                self._kept.append(row)
+            else:
+                self._overflow().add(row)
+        return kept
+
+    def wrap(self, results: Any) -> Any:
+        """Return `results` unchanged, or with the summary attached if it was truncated."""
+        if self._summary is None:
+            return results
+        return {
+            "results": results,
+            "truncated": True,
+            "returned_rows": self.kept_rows,
+            "total_rows": self.total_rows,
+            "summary": self._summary.to_dict(),
+        }
+
+    def note(self) -> str:
+        """Return the text appended to a truncated response, or an empty string."""
+        if self._summary is None:
+            return ""
+        return (
+            f"\n\n⚠️ Result truncated: showing {self.kept_rows} of {self.total_rows} rows "
+            f"(response budget: {self._describe_limits()}). Narrow the request to see the "
+            "remaining rows. Summary of all rows:\n"
+            f"{self._summary.describe()}"
+        )
+
+    def _admit(self, row: Any) -> bool:
+        if self.max_rows and self.kept_rows >= self.max_rows:
+            return False
+        if self.max_bytes:
+            size = len(dumps(row)) + 1
+            if self.kept_bytes + size > self.max_bytes:
+                return False
+            self.kept_bytes += size
+        self.kept_rows += 1
+        return True
+
+    def _overflow(self) -> ResultSummary:
+        if self._summary is None:
+            # The budget was just exceeded: catch the summary up with the rows already kept.
+            self._summary = ResultSummary(self.top_k, self.fields)
+            for row in self._kept:
+                self._summary.add(row)
+            self._kept = []
+        return self._summary
+
+    def _describe_limits(self) -> str:
+        limits = []
+        if self.max_rows:
+            limits.append(f"{self.max_rows} rows")
+        if self.max_bytes:
+            limits.append(f"{self.max_bytes} bytes")
+        return ", ".join(limits)
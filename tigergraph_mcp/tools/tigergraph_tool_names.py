@@ -14,17 +14,25 @@ class TigerGraphToolName(str, Enum):
     ADD_NODE = "graph__add_node"
     ADD_NODES = "graph__add_nodes"
     REMOVE_NODE = "graph__remove_node"
+    REMOVE_NODES = "graph__remove_nodes"
     HAS_NODE = "graph__has_node"
+    HAS_NODES = "graph__has_nodes"
     GET_NODE_DATA = "graph__get_node_data"
+    GET_NODES_DATA = "graph__get_nodes_data"
     GET_NODE_EDGES = "graph__get_node_edges"
     CLEAR_GRAPH_DATA = "graph__clear_graph_data"
     # Edge Operations
     ADD_EDGE = "graph__add_edge"
     ADD_EDGES = "graph__add_edges_from"
     HAS_EDGE = "graph__has_edge"
+    HAS_EDGES = "graph__has_edges"
     GET_EDGE_DATA = "graph__get_edge_data"
+    GET_EDGES_DATA = "graph__get_edges_data"
     # Statistics Operations
     DEGREE = "graph__degree"
+    DEGREES = "graph__degrees"
+    DEGREE_DISTRIBUTION = "graph__degree_distribution"
+    PROFILE = "graph__profile"
     NUMBER_OF_NODES = "graph__number_of_nodes"
     NUMBER_OF_EDGES = "graph__number_of_edges"
     # Query Operations
@@ -34,6 +42,9 @@ class TigerGraphToolName(str, Enum):
     RUN_QUERY = "graph__run_query"
     IS_QUERY_INSTALLED = "graph__is_query_installed"
     GET_NODES = "graph__get_nodes"
+    AGGREGATE_NODES = "graph__aggregate_nodes"
+    TOP_K_NODES = "graph__top_k_nodes"
+    TOP_K_EDGES = "graph__top_k_edges"
     GET_NEIGHBORS = "graph__get_neighbors"
     BREADTH_FIRST_SEARCH = "graph__breadth_first_search"
     # Vector Operations
@@ -43,6 +54,8 @@ class TigerGraphToolName(str, Enum):
     SEARCH = "graph__search"
     SEARCH_MULTI_VECTOR_ATTRIBUTES = "graph__search_multi_vector_attributes"
     SEARCH_TOP_K_SIMILAR_NODES = "graph__search_top_k_similar_nodes"
+    # Bulk Operations
+    BATCH = "graph__batch"
 
     # -------------------- Database Operations --------------------
     # GSQL Operations
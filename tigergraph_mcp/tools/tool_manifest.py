@@ -0,0 +1,134 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""Static manifest of the tools served by TigerGraph-MCP.
+
+The tool descriptors are kept in `tool_manifest.json` so the server can answer `list_tools`
+without importing the tool modules, which pull in TigerGraphX. Regenerate the file after adding
+or changing a tool:
+
+    python -m tigergraph_mcp.tools.tool_manifest
+
+Use `--check` to verify that the file is up to date instead.
+"""
+
+import importlib
+import json
+import sys
+from typing import Dict, List, Tuple
+
+from tigergraph_mcp.executor import ToolCategory
+from tigergraph_mcp.tools.tool_registry import MANIFEST_PATH
+
+TOOL_MODULES: List[Tuple[str, ToolCategory]] = [
+    # Tools for Schema Operations
+    ("tigergraph_mcp.tools.graph.schema.create_schema_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.graph.schema.get_schema_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.schema.drop_graph_tool", ToolCategory.SCHEMA),
+    # Tools for Data Operations
+    ("tigergraph_mcp.tools.graph.data.load_data_tool", ToolCategory.LOAD),
+    # Tools for Node Operations
+    ("tigergraph_mcp.tools.graph.node.add_node_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.node.add_nodes_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.node.remove_node_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.node.remove_nodes_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.node.has_node_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.node.has_nodes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.node.get_node_data_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.node.get_nodes_data_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.node.get_node_edges_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.node.clear_graph_data_tool", ToolCategory.WRITE),
+    # Tools for Edge Operations
+    ("tigergraph_mcp.tools.graph.edge.add_edge_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.edge.add_edges_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.edge.has_edge_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.edge.has_edges_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.edge.get_edge_data_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.edge.get_edges_data_tool", ToolCategory.READ),
+    # Tools for Statistics Operations
+    ("tigergraph_mcp.tools.graph.statistics.degree_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.statistics.degrees_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.statistics.degree_distribution_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.statistics.profile_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.statistics.number_of_nodes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.statistics.number_of_edges_tool", ToolCategory.READ),
+    # Tools for Query Operations
+    ("tigergraph_mcp.tools.graph.query.create_query_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.graph.query.install_query_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.graph.query.drop_query_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.graph.query.run_query_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.is_query_installed_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.get_nodes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.aggregate_nodes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.top_k_nodes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.top_k_edges_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.get_neighbors_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.query.breadth_first_search_tool", ToolCategory.READ),
+    # Tools for Vector Operations
+    ("tigergraph_mcp.tools.graph.vector.upsert_tool", ToolCategory.WRITE),
+    ("tigergraph_mcp.tools.graph.vector.fetch_node_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.vector.fetch_nodes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.vector.search_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.vector.search_multi_vector_attributes_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.graph.vector.search_top_k_similar_nodes_tool", ToolCategory.READ),
+    # Tools for Bulk Operations
+    ("tigergraph_mcp.tools.graph.bulk.batch_tool", ToolCategory.WRITE),
+    # Tools for GSQL Operations
+    ("tigergraph_mcp.tools.db.gsql.list_metadata_tool", ToolCategory.READ),
+    # Tools for Data Source Operations
+    ("tigergraph_mcp.tools.db.data_source.create_data_source_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.db.data_source.update_data_source_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.db.data_source.get_data_source_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.db.data_source.drop_data_source_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.db.data_source.get_all_data_sources_tool", ToolCategory.READ),
+    ("tigergraph_mcp.tools.db.data_source.drop_all_data_sources_tool", ToolCategory.SCHEMA),
+    ("tigergraph_mcp.tools.db.data_source.preview_sample_data_tool", ToolCategory.READ),
+]
+
+# Read tools whose result may depend on more than their arguments and the graph's data, or that
+# may change it. Installed queries are free to modify the graph.
+NON_IDEMPOTENT_MODULES = {
+    "tigergraph_mcp.tools.graph.query.run_query_tool",
+}
+
+
+def build_manifest() -> List[Dict]:
+    """Import every tool module and collect its descriptor."""
+    manifest = []
+    for module_name, category in TOOL_MODULES:
+        module = importlib.import_module(module_name)
+        for tool in module.tools:
+            manifest.append(
+                {
+                    "module": module_name,
+                    "category": category.value,
+                    "idempotent": category == ToolCategory.READ
+                    and module_name not in NON_IDEMPOTENT_MODULES,
+                    "tool": tool.model_dump(mode="json", exclude_none=True),
+                }
+            )
+    return manifest
+
+
+def dump_manifest(manifest: List[Dict]) -> str:
+    return json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+
+
+def main() -> None:
+    content = dump_manifest(build_manifest())
+    if "--check" in sys.argv[1:]:
+        if MANIFEST_PATH.read_text(encoding="utf-8") != content:
+            sys.exit(
+                f"{MANIFEST_PATH.name} is out of date, regenerate it with "
+                "`python -m tigergraph_mcp.tools.tool_manifest`."
+            )
+        return
+    MANIFEST_PATH.write_text(content, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
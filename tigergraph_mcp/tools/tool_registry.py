@@ -5,115 +5,122 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from mcp.types import Tool
-
-from .graph.schema import (
-    create_schema_tool,
-    get_schema_tool,
-    drop_graph_tool,
-)
-from .graph.data import (
-    load_data_tool,
-)
-from .graph.node import (
-    add_node_tool,
-    add_nodes_tool,
-    remove_node_tool,
-    has_node_tool,
-    get_node_data_tool,
-    get_node_edges_tool,
-    clear_graph_data_tool,
-)
-from .graph.edge import (
-    add_edge_tool,
-    add_edges_tool,
-    has_edge_tool,
-    get_edge_data_tool,
-)
-from .graph.statistics import (
-    degree_tool,
-    number_of_nodes_tool,
-    number_of_edges_tool,
-)
-from .graph.query import (
-    create_query_tool,
-    install_query_tool,
-    drop_query_tool,
-    run_query_tool,
-    is_query_installed_tool,
-    get_nodes_tool,
-    get_neighbors_tool,
-    breadth_first_search_tool,
-)
-from .graph.vector import (
-    upsert_tool,
-    fetch_node_tool,
-    fetch_nodes_tool,
-    search_tool,
-    search_multi_vector_attributes_tool,
-    search_top_k_similar_nodes_tool,
-)
-from .db.gsql import list_metadata_tool
-from .db.data_source import (
-    create_data_source_tool,
-    update_data_source_tool,
-    get_data_source_tool,
-    drop_data_source_tool,
-    get_all_data_sources_tool,
-    drop_all_data_sources_tool,
-    preview_sample_data_tool,
-)
+import importlib
+import json
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Awaitable, Callable, Dict, List, Optional, Type
+
+from mcp.types import Tool, TextContent
+from pydantic import BaseModel
+
+from tigergraph_mcp.executor import ToolCategory
+
+# Generated by `python -m tigergraph_mcp.tools.tool_manifest` from the tool modules.
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+
+
+class ToolEntry:
+    """Everything needed to list and dispatch one tool.
+
+    The descriptor comes from the static manifest; the module implementing the tool is only
+    imported the first time the tool is called.
+    """
+
+    def __init__(
+        self, tool: Tool, module_name: str, category: ToolCategory, idempotent: bool = False
+    ):
+        self.tool = tool
+        self.module_name = module_name
+        self.category = category
+        # Whether the tool only reads, so that identical calls can share one result.
+        self.idempotent = idempotent
+        # Every `<name>_tool` module defines the `<name>` coroutine handling the tool.
+        self.handler_name = module_name.rsplit(".", 1)[-1].removesuffix("_tool")
+        self._module: Optional[ModuleType] = None
+
+    @property
+    def handler(self) -> Callable[..., Awaitable[List[TextContent]]]:
+        return getattr(self._load(), self.handler_name)
+
+    @property
+    def input_model(self) -> Type[BaseModel]:
+        # The input schema was generated from the model, so it carries the model's name.
+        return getattr(self._load(), self.tool.inputSchema["title"])
+
+    def parse_arguments(self, arguments: Dict) -> Dict:
+        """Validate `arguments` against the input model, keeping only the fields provided so the
+        handler's own defaults apply to the rest. Unknown arguments are rejected rather than
+        ignored, so a misspelled one does not silently change what the call does."""
+        model = self.input_model
+        unknown = sorted(set(arguments) - set(model.model_fields))
+        if unknown:
+            raise ValueError(
+                f"Unknown arguments for tool '{self.tool.name}': {', '.join(unknown)}. "
+                f"Expected some of: {', '.join(model.model_fields)}."
+            )
+        inputs = model.model_validate(arguments)
+        return {field: getattr(inputs, field) for field in inputs.model_fields_set}
+
+    async def call(self, arguments: Dict) -> List[TextContent]:
+        return await self.handler(**self.parse_arguments(arguments))
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            _prepare_tool_imports()
+            self._module = importlib.import_module(self.module_name)
+        return self._module
+
+
+_tool_imports_prepared = False
+_tool_imports_lock = threading.Lock()
+
+
+def _prepare_tool_imports() -> None:
+    # Tool modules bring in TigerGraphX; make sure every connection it opens from then on goes
+    # through the shared pool.
+    global _tool_imports_prepared
+    with _tool_imports_lock:
+        if not _tool_imports_prepared:
+            from .connection_pool import install_connection_pool
+
+            install_connection_pool()
+            _tool_imports_prepared = True
+
+
+def _build_tool_entries() -> Dict[str, ToolEntry]:
+    with MANIFEST_PATH.open(encoding="utf-8") as f:
+        manifest = json.load(f)
+    entries = {}
+    for item in manifest:
+        tool = Tool.model_validate(item["tool"])
+        entries[tool.name] = ToolEntry(
+            tool, item["module"], ToolCategory(item["category"]), item.get("idempotent", False)
+        )
+    return entries
+
+
+# Built once at import time; both the tool list and the name lookup are reused for every request.
+_tool_entries = _build_tool_entries()
+_all_tools = [entry.tool for entry in _tool_entries.values()]
+_handler_entries = {entry.handler_name: entry for entry in _tool_entries.values()}
 
 
 def get_all_tools() -> list[Tool]:
-    return (
-        # Tools for Schema Operations
-        create_schema_tool.tools
-        + get_schema_tool.tools
-        + drop_graph_tool.tools
-        # Tools for Data Operations
-        + load_data_tool.tools
-        # Tools for Node Operations
-        + add_node_tool.tools
-        + add_nodes_tool.tools
-        + remove_node_tool.tools
-        + has_node_tool.tools
-        + get_node_data_tool.tools
-        + get_node_edges_tool.tools
-        + clear_graph_data_tool.tools
-        # Tools for Edge Operations
-        + add_edge_tool.tools
-        + add_edges_tool.tools
-        + has_edge_tool.tools
-        + get_edge_data_tool.tools
-        # Tools for Statistics Operations
-        + degree_tool.tools
-        + number_of_nodes_tool.tools
-        + number_of_edges_tool.tools
-        # Tools for Query Operations
-        + create_query_tool.tools
-        + install_query_tool.tools
-        + drop_query_tool.tools
-        + run_query_tool.tools
-        + is_query_installed_tool.tools
-        + get_nodes_tool.tools
-        + get_neighbors_tool.tools
-        + breadth_first_search_tool.tools
-        # Tools for Vector Operations
-        + upsert_tool.tools
-        + fetch_node_tool.tools
-        + fetch_nodes_tool.tools
-        + search_tool.tools
-        + search_multi_vector_attributes_tool.tools
-        + search_top_k_similar_nodes_tool.tools
-        # Tools for GSQL Operations
-        + list_metadata_tool.tools
-        # Tools for Data Source Operations
-        + create_data_source_tool.tools
-        + update_data_source_tool.tools
-        + get_data_source_tool.tools
-        + drop_data_source_tool.tools
-        + get_all_data_sources_tool.tools
-        + drop_all_data_sources_tool.tools
-        + preview_sample_data_tool.tools
-    )
+    return _all_tools
+
+
+def get_tool_entry(name: str) -> ToolEntry:
+    entry = _tool_entries.get(name)
+    if entry is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return entry
+
+
+def get_tool_handler(handler_name: str) -> Callable[..., Awaitable[List[TextContent]]]:
+    """Return a tool's handler coroutine by its function name, importing its module if needed."""
+    entry = _handler_entries.get(handler_name)
+    if entry is None:
+        raise AttributeError(f"No tool handler named '{handler_name}'")
+    return entry.handler
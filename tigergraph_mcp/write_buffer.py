@@ -0,0 +1,153 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from mcp.types import TextContent
+
+from .executor import ToolExecutor
+from .tools import TigerGraphToolName, get_tool_entry
+
+logger = logging.getLogger(__name__)
+
+# The single-element writes that are buffered, with the arguments that must match for two calls
+# to be written together.
+BUFFERED_TOOLS: Dict[str, Tuple[str, ...]] = {
+    TigerGraphToolName.ADD_NODE: ("node_type",),
+    TigerGraphToolName.ADD_EDGE: ("src_node_type", "edge_type", "tgt_node_type"),
+}
+
+MISSING_RESULT = (
+    "❌ The buffered write returned no result for this call; it may not have been applied."
+)
+
+
+class _PendingBatch:
+    def __init__(self, graph_name: str, tool: str):
+        self.graph_name = graph_name
+        self.tool = tool
+        self.calls: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class WriteBuffer:
+    """Merges concurrent `add_node` and `add_edge` calls into bulk writes.
+
+    A call arriving while nothing is buffered or being written for its graph is written right
+    away, so a client sending one call at a time pays no delay. Calls arriving while a write is
+    in progress are held back, per graph, tool and types, until `max_size` of them are pending
+    or `max_delay` seconds after the first one, then written together through the
+    `graph__batch` tool. Any other call on a graph, read or write, first flushes what is
+    buffered for it. Each buffered call completes once its write is done, with its own result,
+    so a failed flush is reported to every call it contained.
+    """
+
+    def __init__(
+        self,
+        executor: ToolExecutor,
+        max_size: int,
+        max_delay: float,
+        on_write: Optional[Callable[[str], None]] = None,
+    ):
+        self.executor = executor
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.on_write = on_write
+        self._batches: Dict[Hashable, _PendingBatch] = {}
+        self._flushing: Dict[str, Set[asyncio.Task]] = {}
+
+    @staticmethod
+    def is_buffered(tool_name: str) -> bool:
+        return tool_name in BUFFERED_TOOLS
+
+    async def add(self, tool_name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+        graph_name = arguments.get("graph_name")
+        if not isinstance(graph_name, str):
+            raise ValueError("`graph_name` must be a string.")
+        types = tuple(str(arguments.get(name)) for name in BUFFERED_TOOLS[tool_name])
+        key = (graph_name, tool_name, types)
+        batch = self._batches.get(key)
+        idle = batch is None and not self._flushing.get(graph_name)
+        if batch is None:
+            batch = self._batches[key] = _PendingBatch(graph_name, tool_name)
+            if not idle:
+                loop = asyncio.get_running_loop()
+                batch.timer = loop.call_later(self.max_delay, self._start_flush, key)
+        future = asyncio.get_running_loop().create_future()
+        batch.calls.append((arguments, future))
+        if idle or len(batch.calls) >= self.max_size:
+            self._start_flush(key)
+        # A cancelled call only stops waiting; its write still goes through with the others.
+        return await asyncio.shield(future)
+
+    async def flush(self, graph_name: Optional[str] = None) -> None:
+        """Write what is buffered for `graph_name`, or for every graph if it is None, and wait
+        for all writes in progress on it to finish."""
+        for key in [k for k, b in self._batches.items() if graph_name in (None, b.graph_name)]:
+            self._start_flush(key)
+        if graph_name is None:
+            tasks = [task for tasks in self._flushing.values() for task in tasks]
+        else:
+            tasks = list(self._flushing.get(graph_name, ()))
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def _start_flush(self, key: Hashable) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._write(batch))
+        tasks = self._flushing.setdefault(batch.graph_name, set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _write(self, batch: _PendingBatch) -> None:
+        operations = [{"tool": batch.tool, "arguments": arguments} for arguments, _ in batch.calls]
+        arguments = {
+            "graph_name": batch.graph_name,
+            "operations": operations,
+            "output_format": "json",
+        }
+        logger.debug(f"Writing {len(operations)} buffered {batch.tool} calls.")
+        entry = get_tool_entry(TigerGraphToolName.BATCH)
+        try:
+            try:
+                content = await self.executor.run(
+                    entry.category, entry.call, {"arguments": arguments}
+                )
+                text = content[0].text
+                if text.startswith("❌"):
+                    results = [text] * len(operations)
+                else:
+                    results = [item["result"] for item in json.loads(text)]
+            except Exception as e:
+                logger.exception("Error writing buffered calls")
+                message = (
+                    f"❌ Failed to write buffered {batch.tool} calls to graph "
+                    f"'{batch.graph_name}': {str(e)}"
+                )
+                results = [message] * len(operations)
+            if len(results) != len(operations):
+                logger.error(
+                    f"Got {len(results)} results for {len(operations)} buffered {batch.tool} calls."
+                )
+            for (_, future), result in zip(batch.calls, results):
+                future.set_result([TextContent(type="text", text=result)])
+        finally:
+            # Even a failed write may have changed part of the graph.
+            if self.on_write is not None:
+                self.on_write(batch.graph_name)
+            # Never leave a caller waiting, even if a result is missing or the write itself was
+            # cancelled; the outcome of such a call is unknown.
+            for _, future in batch.calls:
+                if not future.done():
+                    future.set_result([TextContent(type="text", text=MISSING_RESULT)])